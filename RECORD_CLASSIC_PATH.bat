@@ -3,6 +3,6 @@ echo ========================================
 echo   CLASSIC CIRCUIT - AI PATH RECORDER
 echo ========================================
 echo.
-python record_classic_path.py
+python ai_coordinates\record_classic_path.py
 echo.
 pause
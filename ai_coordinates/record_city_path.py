@@ -1,7 +1,13 @@
 import pygame
 import sys
+import os
+import json
 import math
 
+# Map packs are read with the game's own registry (run from the repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+from map_registry import read_manifest
+
 # Initialize Pygame
 pygame.init()
 
@@ -15,15 +21,15 @@ def blit_rotate_center(win, image, top_left, angle):
     new_rect = rotated_image.get_rect(center=image.get_rect(topleft=top_left).center)
     win.blit(rotated_image, new_rect.topleft)
 
-# Load the city track images (NO SCALING - match actual game)
+# Load the city track images from its map pack (same scaling as the game)
 try:
-    city_grass = pygame.image.load('imgs/city-grass.png')
-    city_track = pygame.image.load('imgs/city-track.png')
-    city_border = pygame.image.load('imgs/city-border.png')
-    city_finish = pygame.image.load('imgs/city-finish.png')
+    pack = read_manifest(os.path.join('maps', 'city'))
+    city_grass, city_track, city_border, city_finish = [
+        scale_image(pygame.image.load(path), scale)
+        for path, scale in (pack.layers[name] for name in ('grass', 'track', 'border', 'finish'))]
     car_img = scale_image(pygame.image.load('imgs/redbull.png'), 0.08)
-except:
-    print("Error: Could not load city track images!")
+except Exception as e:
+    print(f"Error: Could not load city track images! {e}")
     sys.exit(1)
 
 # Window setup
@@ -37,7 +43,7 @@ TITLE_FONT = pygame.font.SysFont("arial", 24, bold=True)
 
 # Starting position and finish line
 START_POS = (430, 75)
-FINISH_POS = (510, 60)
+FINISH_POS = pack['finish_pos']
 START_ANGLE = 90
 
 # Path recording
@@ -181,21 +187,12 @@ def save_path():
         return False
     
     print("\n" + "="*60)
-    print("CITY CIRCUIT PATH - Copy this into your main.py:")
+    print("CITY CIRCUIT PATH - Copy this into maps/city/manifest.json:")
     print("="*60)
-    print("CITY_PATH = [", end="")
-    
-    for i, point in enumerate(path_points):
-        if i % 3 == 0:
-            print("\n             ", end="")
-        print(f"{point}", end="")
-        if i < len(path_points) - 1:
-            print(", ", end="")
-    
-    print("]")
+    print('"path": ' + json.dumps([list(point) for point in path_points]))
     print("="*60)
     print(f"\nTotal waypoints: {len(path_points)}")
-    print("Path saved! Replace CITY_PATH in main.py with the above.")
+    print('Replace "path" in maps/city/manifest.json with the above.')
     return True
 
 # Main loop
@@ -5,8 +5,14 @@ Records optimal racing line coordinates for AI pathfinding
 
 import pygame
 import sys
+import os
+import json
 import math
 
+# Map packs are read with the game's own registry (run from the repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+from map_registry import read_manifest
+
 # Initialize Pygame
 pygame.init()
 
@@ -20,12 +26,17 @@ def blit_rotate_center(win, image, top_left, angle):
     new_rect = rotated_image.get_rect(center=image.get_rect(topleft=top_left).center)
     win.blit(rotated_image, new_rect.topleft)
 
-# Load Classic Circuit assets (same as main.py)
-GRASS = scale_image(pygame.image.load('imgs/terrain-1.png'), 2.3)
-TRACK = scale_image(pygame.image.load('imgs/track.png'), 1)
-TRACK_BORDER = scale_image(pygame.image.load('imgs/track-border.png'), 1)
-FINISH = pygame.image.load('imgs/finish.png')
-FINISH_POSITION = (140, 250)
+# Load Classic Circuit assets from its map pack (same as the game)
+PACK = read_manifest(os.path.join('maps', 'classic'))
+def load_layer(name):
+    path, scale = PACK.layers[name]
+    return scale_image(pygame.image.load(path), scale)
+
+GRASS = load_layer('grass')
+TRACK = load_layer('track')
+TRACK_BORDER = load_layer('border')
+FINISH = load_layer('finish')
+FINISH_POSITION = PACK['finish_pos']
 CAR_IMG = scale_image(pygame.image.load('imgs/redbull.png'), 0.08)
 
 # Window setup (exact same dimensions as main.py)
@@ -198,35 +209,20 @@ def draw_path(win, points):
             win.blit(num_text, (point[0] + 10, point[1] - 10))
 
 def save_path(points):
-    """Save path to Python file with professional formatting"""
+    """Save path as the "path" entry of a map pack manifest"""
     if len(points) < 3:
         print("❌ Error: Need at least 3 waypoints to save path")
         return False
     
     try:
-        with open('classic_path_output.py', 'w') as f:
-            f.write('"""\\n')
-            f.write('AI Path for Classic Circuit\\n')
-            f.write(f'Generated with {len(points)} waypoints\\n')
-            f.write('Optimized racing line for AI navigation\\n')
-            f.write('"""\\n\\n')
-            f.write('# Classic Circuit AI Path\\n')
-            f.write('CLASSIC_PATH = [')
-            
-            # Format points nicely (5 per line)
-            for i, point in enumerate(points):
-                if i % 5 == 0:
-                    f.write('\n    ')
-                f.write(f'({point[0]}, {point[1]})')
-                if i < len(points) - 1:
-                    f.write(', ')
-            
-            f.write('\n]\n')
+        with open('classic_path_output.json', 'w') as f:
+            json.dump({"path": [list(point) for point in points]}, f)
+            f.write('\n')
         
         print(f"✅ Path saved successfully!")
         print(f"📊 Total waypoints: {len(points)}")
-        print(f"📁 File: classic_path_output.py")
-        print(f"📋 Copy the CLASSIC_PATH list to main.py")
+        print(f"📁 File: classic_path_output.json")
+        print(f"📋 Replace \"path\" in maps/classic/manifest.json with it")
         return True
     except Exception as e:
         print(f"❌ Error saving path: {e}")
@@ -289,7 +285,7 @@ def main():
                 
                 elif event.key == pygame.K_s:
                     if save_path(path_points):
-                        print("✅ Ready to copy to main.py!")
+                        print("✅ Ready to copy to the map manifest!")
                 
                 elif event.key == pygame.K_c:
                     path_points.clear()
@@ -0,0 +1,181 @@
+"""
+Vectorized AI car engine
+
+Holds the state of many AI cars as NumPy arrays (structure of arrays) and
+advances all of them in one step with the same rules as ComputerCar.move:
+stun handling, waypoint steering, waypoint advance and kinematic
+integration. With one car it reproduces ComputerCar exactly.
+
+Benchmark against per-object ComputerCar updates from the repository root:
+
+    python app/ai_fleet.py --cars 200 --ticks 3600
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+import simclock
+
+WAYPOINT_RADIUS = 20  # Same reach distance as ComputerCar.update_path_point
+
+
+class AIFleet:
+    """State of N AI cars following one waypoint path"""
+
+    def __init__(self, path, x, y, angle, max_vel, rotation_vel, current_point=None):
+        self.path_x = np.array([p[0] for p in path], dtype=np.float64)
+        self.path_y = np.array([p[1] for p in path], dtype=np.float64)
+
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.array(y, dtype=np.float64)
+        count = len(self.x)
+        self.angle = np.broadcast_to(np.asarray(angle, dtype=np.float64), (count,)).copy()
+        self.max_vel = np.broadcast_to(np.asarray(max_vel, dtype=np.float64), (count,)).copy()
+        self.rotation_vel = np.broadcast_to(np.asarray(rotation_vel, dtype=np.float64), (count,)).copy()
+        self.vel = self.max_vel.copy()
+        if current_point is None:
+            current_point = 0
+        self.current_point = np.broadcast_to(np.asarray(current_point, dtype=np.int64), (count,)).copy()
+        self.stunned_until = np.zeros(count)
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+        self.waypoint_laps = np.zeros(count, dtype=np.int64)  # Times each car wrapped the path
+
+    @classmethod
+    def from_cars(cls, cars):
+        """Build a fleet from ComputerCar objects sharing one path"""
+        fleet = cls(cars[0].path,
+                    [c.x for c in cars], [c.y for c in cars], [c.angle for c in cars],
+                    [c.max_vel for c in cars], [c.rotation_vel for c in cars],
+                    [c.current_point for c in cars])
+        fleet.vel[:] = [c.vel for c in cars]
+        fleet.stunned_until[:] = [c.stunned_until for c in cars]
+        return fleet
+
+    def __len__(self):
+        return len(self.x)
+
+    def stun(self, index, duration):
+        self.stunned_until[index] = simclock.now() + duration
+
+    def step(self, now=None):
+        """Advance every car by one tick"""
+        if now is None:
+            now = simclock.now()
+
+        # Stun handling: frozen cars skip the whole update, recovered cars restart at full speed
+        stunned = self.stunned_until > 0
+        frozen = stunned & (now < self.stunned_until)
+        recovered = stunned & ~frozen
+        self.stunned_until[recovered] = 0
+        self.vel[recovered] = self.max_vel[recovered]
+        active = ~frozen
+
+        path_len = len(self.path_x)
+        self.current_point[self.current_point >= path_len] = 0
+        target_x = self.path_x[self.current_point]
+        target_y = self.path_y[self.current_point]
+
+        # Waypoint steering (calculate_angle)
+        x_diff = target_x - self.x
+        y_diff = target_y - self.y
+        level = y_diff == 0
+        desired = np.arctan(x_diff / np.where(level, 1.0, y_diff))
+        desired[level] = math.pi / 2
+        desired[target_y > self.y] += math.pi
+
+        difference = self.angle - np.degrees(desired)
+        difference[difference >= 180] -= 360
+        turn = np.minimum(self.rotation_vel, np.abs(difference))
+        new_angle = np.where(difference > 0, self.angle - turn, self.angle + turn)
+        self.angle = np.where(active, new_angle, self.angle)
+
+        # Waypoint advance (update_path_point), measured before moving
+        dist = np.sqrt((self.x - target_x) ** 2 + (self.y - target_y) ** 2)
+        reached = active & (dist < WAYPOINT_RADIUS)
+        advanced = self.current_point + 1
+        wrapped = reached & (advanced >= path_len)
+        self.current_point = np.where(reached, np.where(wrapped, 0, advanced), self.current_point)
+        self.waypoint_laps += wrapped
+
+        # Kinematic integration (AbstractCar.move)
+        radians = np.radians(self.angle)
+        self.prev_x = np.where(active, self.x, self.prev_x)
+        self.prev_y = np.where(active, self.y, self.prev_y)
+        self.x = np.where(active, self.x - np.sin(radians) * self.vel, self.x)
+        self.y = np.where(active, self.y - np.cos(radians) * self.vel, self.y)
+
+    def write_back(self, cars):
+        """Copy fleet state into ComputerCar objects, e.g. before drawing them"""
+        for i, car in enumerate(cars):
+            car.x, car.y = float(self.x[i]), float(self.y[i])
+            car.prev_x, car.prev_y = float(self.prev_x[i]), float(self.prev_y[i])
+            car.angle = float(self.angle[i])
+            car.vel = float(self.vel[i])
+            car.current_point = int(self.current_point[i])
+            car.stunned_until = float(self.stunned_until[i])
+
+
+def main():
+    from main import MAPS, ComputerCar, get_ai_speed
+
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized AI engine against ComputerCar")
+    parser.add_argument("--map", default="classic", choices=sorted(MAPS.keys()))
+    parser.add_argument("--difficulty", default="medium", choices=["easy", "medium", "hard", "extreme"])
+    parser.add_argument("--cars", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=3600)
+    args = parser.parse_args()
+
+    current_map = MAPS[args.map]
+    path = current_map["path"]
+    speed, rotation = get_ai_speed(args.difficulty, args.map)
+
+    def make_cars(count):
+        cars = []
+        for i in range(count):
+            car = ComputerCar(speed, rotation, path)
+            # Spread the field around the path so cars do not overlap
+            car.current_point = i % len(path)
+            car.x, car.y = path[(i - 1) % len(path)]
+            car.prev_x, car.prev_y = car.x, car.y
+            car.angle = current_map.get("start_angle", 0)
+            cars.append(car)
+        return cars
+
+    clock = simclock.set_clock(simclock.TickClock())
+
+    # Exactness check against ComputerCar with a single car
+    reference = make_cars(1)
+    fleet = AIFleet.from_cars(make_cars(1))
+    for _ in range(args.ticks):
+        clock.tick()
+        reference[0].move()
+        fleet.step()
+    error = max(abs(reference[0].x - fleet.x[0]), abs(reference[0].y - fleet.y[0]))
+    print(f"N=1 max position difference after {args.ticks} ticks: {error:.3e}")
+
+    cars = make_cars(args.cars)
+    started = time.perf_counter()
+    for _ in range(args.ticks):
+        clock.tick()
+        for car in cars:
+            car.move()
+    objects_elapsed = time.perf_counter() - started
+
+    fleet = AIFleet.from_cars(make_cars(args.cars))
+    started = time.perf_counter()
+    for _ in range(args.ticks):
+        clock.tick()
+        fleet.step()
+    fleet_elapsed = time.perf_counter() - started
+
+    car_ticks = args.cars * args.ticks
+    print(f"ComputerCar objects: {car_ticks / objects_elapsed:,.0f} car-ticks/s")
+    print(f"AIFleet:             {car_ticks / fleet_elapsed:,.0f} car-ticks/s "
+          f"({objects_elapsed / fleet_elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
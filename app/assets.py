@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pygame
+
+from utils import scale_image
+
+
+def load_image(path, scale=1):
+    """Image file scaled by factor, as the game's sprites are loaded"""
+    image = pygame.image.load(path)
+    return scale_image(image, scale) if scale != 1 else image
+
+
+class AssetManager:
+    """Named assets loaded on first use instead of at import.
+
+    Each asset is registered with a loader; get() runs it the first time
+    the asset is needed, or prefetch() runs loaders on a background thread
+    ahead of time. Loaders must not need the display (no convert), since
+    they may run off the main thread. Every load is recorded with how long
+    it took and which thread did it.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+        self._assets = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        self.records = []   # (name, milliseconds, thread name), in load order
+
+    def register(self, name, loader):
+        self._loaders[name] = loader
+        self._locks[name] = threading.Lock()
+
+    def loaded(self, name):
+        return name in self._assets
+
+    def get(self, name):
+        """The asset, loading it now if nothing has loaded it yet"""
+        if name in self._assets:
+            return self._assets[name]
+        # A prefetch already loading this asset finishes it; we wait for that
+        with self._locks[name]:
+            if name not in self._assets:
+                started = time.perf_counter()
+                asset = self._loaders[name]()
+                elapsed = (time.perf_counter() - started) * 1000
+                with self._lock:
+                    self._assets[name] = asset
+                    self.records.append((name, elapsed, threading.current_thread().name))
+        return self._assets[name]
+
+    def prefetch(self, names):
+        """Load names in order on a daemon thread; returns the thread"""
+        pending = [name for name in names if name not in self._assets]
+
+        def run():
+            for name in pending:
+                self.get(name)
+
+        thread = threading.Thread(target=run, name="asset-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        with self._lock:
+            return {"registered": len(self._loaders), "loaded": len(self._assets),
+                    "load_ms": round(sum(ms for _, ms, _ in self.records), 1)}
+
+    def report(self):
+        """One line per loaded asset, slowest first"""
+        with self._lock:
+            records = sorted(self.records, key=lambda r: -r[1])
+        return [f"{name:<20} {ms:7.1f}ms  {thread}" for name, ms, thread in records]
+
+
+ASSETS = AssetManager()
@@ -21,12 +21,15 @@ BOOST_MULTIPLIER = 1.8      # Speed multiplier for boost power-up
 WEAPON_AMMO_PER_PICKUP = 1  # Ammo granted per weapon pickup
 PROJECTILE_SPEED = 8        # Speed of fired projectiles
 POWERUP_SPAWN_COUNT = 4     # Initial number of power-ups on track
+POWERUP_BORDER_CLEARANCE = 8    # Minimum distance from power-ups to the track border (pixels)
+POWERUP_MIN_SPACING = 60        # Minimum distance between power-ups and from cars (pixels)
 
 # === VISUAL SETTINGS ===
 PARTICLE_COUNT_COLLISION = 5    # Particles spawned on wall collision
 PARTICLE_COUNT_PICKUP = 10      # Particles spawned on power-up pickup
 PARTICLE_COUNT_EXPLOSION = 15   # Particles spawned on projectile hit
 PARTICLE_COUNT_FINISH = 20      # Particles spawned on lap completion
+PARTICLE_CAPACITY = 512         # Most particles alive at once; bursts beyond this are dropped
 
 # === UI COLORS ===
 HUD_PANEL_COLOR = (20, 20, 30, 200)     # HUD background color (RGBA)
@@ -46,3 +49,8 @@ MENU_OVERLAY_ALPHA = 180                # Menu background transparency (0-255)
 # === ADVANCED SETTINGS ===
 ENABLE_PARTICLES = True     # Set to False to disable particle effects for better performance
 DEBUG_MODE = False          # Set to True to show AI path points and collision boxes
+DIRTY_RECT_RENDERING = False  # Redraw only moving objects during races (F2 toggles in-game)
+SHOW_FRAME_STATS = False    # Show frame-time stats during races (F3 toggles in-game)
+CAR_SPRITE_ANGLE_STEP = 2   # Degrees between pre-rotated car frames (smaller = smoother, more memory)
+EXACT_CAR_ROTATION = False  # Rotate car sprites exactly every frame (for screenshots)
+LEADERBOARD_BACKEND = "json"  # "json" keeps a top 10 per map and difficulty in leaderboard.json, "sqlite" keeps every race in leaderboard.db
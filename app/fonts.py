@@ -0,0 +1,85 @@
+"""
+Cached system font lookup
+
+pygame.font.SysFont scans every installed font (fc-list on Linux) the
+first time it runs in a process. FontCache asks SysFont once per family
+and style, stores the resulting file path in cache/fonts.json and builds
+later fonts straight from that path with pygame.font.Font. Delete the
+file to pick up newly installed fonts.
+"""
+import json
+import os
+
+import pygame
+
+FONT_CACHE_VERSION = 1
+FONT_CACHE_FILE = os.path.join("cache", "fonts.json")
+
+
+def _match(path, size, set_bold, set_italic):
+    # SysFont constructor hook: capture what SysFont would load instead of loading it
+    return {"path": path, "bold": set_bold, "italic": set_italic}
+
+
+class FontCache:
+    """Family name to font file mapping, persisted between runs.
+
+    Each entry keeps the file SysFont picked for a (name, bold, italic)
+    request plus whether the style has to be faked with set_bold or
+    set_italic, so fonts come out exactly as SysFont would make them.
+    """
+
+    def __init__(self, path=FONT_CACHE_FILE):
+        self.path = path
+        self.entries = {}
+        self.scans = 0
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == FONT_CACHE_VERSION:
+                self.entries = data["fonts"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def resolve(self, name, bold=False, italic=False):
+        """{"path", "bold", "italic"} for a family; path None means pygame's default font"""
+        key = f"{name}|{int(bold)}|{int(italic)}"
+        entry = self.entries.get(key)
+        # A font uninstalled since the cache was written is looked up again
+        if entry is None or (entry["path"] and not os.path.exists(entry["path"])):
+            entry = pygame.font.SysFont(name, 0, bold, italic, constructor=_match)
+            self.scans += 1
+            self.entries[key] = entry
+            self.save()
+        return entry
+
+    def font(self, name, size, bold=False, italic=False):
+        """pygame Font for a family, falling back to the default font if the file won't load"""
+        entry = self.resolve(name, bold, italic)
+        try:
+            font = pygame.font.Font(entry["path"], size)
+        except (OSError, RuntimeError):
+            font = pygame.font.Font(None, size)
+        if entry["bold"]:
+            font.set_bold(True)
+        if entry["italic"]:
+            font.set_italic(True)
+        return font
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_file = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_file, "w") as f:
+                json.dump({"version": FONT_CACHE_VERSION, "fonts": self.entries}, f, indent=2)
+            os.replace(temp_file, self.path)
+        except OSError:
+            pass   # A read-only install still gets its fonts, just without the cache
+
+
+FONT_CACHE = FontCache()
+
+
+def load_font(name, size, bold=False, italic=False):
+    """Drop-in replacement for pygame.font.SysFont backed by the shared cache"""
+    return FONT_CACHE.font(name, size, bold, italic)
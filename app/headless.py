@@ -0,0 +1,183 @@
+"""
+Headless race runner
+
+Steps the same car physics, collisions, power-ups and lap logic as the
+game loop in main.py, without opening a window and without waiting for
+the frame clock. Run from the repository root:
+
+    python app/headless.py --map classic --difficulty hard --laps 3 --races 20
+"""
+import argparse
+import json
+import time
+
+import simclock
+from particles import ParticleSystem
+from main import (FPS, MAPS, SPAWN_INTERVAL, COUNTDOWN_SECONDS, GameInfo, GameSettings, PlayerCar,
+                  ComputerCar, spawn_powerups, handle_collision, fire_projectile,
+                  get_ai_speed)
+
+POWERUP_START_COUNT = 4
+MAX_RACE_SECONDS_PER_LAP = 120  # Give up on a race that stalls
+
+
+class AutopilotCar(PlayerCar):
+    """PlayerCar that follows the map's AI path instead of the keyboard"""
+
+    calculate_angle = ComputerCar.calculate_angle
+    update_path_point = ComputerCar.update_path_point
+
+    def __init__(self, max_vel, rotation_vel, path):
+        super().__init__(max_vel, rotation_vel)
+        self.path = path
+        self.current_point = 0
+
+    def drive(self):
+        # Mirrors move_player: a stunned car only slows down
+        if self.is_stunned():
+            self.reduce_speed()
+            return
+        self.calculate_angle()
+        self.update_path_point()
+        self.move_forward()
+
+
+def _place(car, pos, angle):
+    car.x, car.y = pos
+    car.prev_x, car.prev_y = pos
+    car.START_POS = pos
+    car.angle = angle
+
+
+def run_race(map_key="classic", difficulty="medium", laps=1, race_mode="continuous",
+             powerups_enabled=True, seed=None, max_ticks=None):
+    """Simulate one autopilot-vs-AI race as fast as possible.
+
+    Returns a dict with the winner ("player", "ai" or None on timeout),
+    total ticks, race time and the lap times of both cars. The same seed
+    always produces the same race.
+    """
+    current_map = MAPS[map_key]
+    settings = GameSettings()
+    settings.laps_to_win = laps
+    settings.race_mode = race_mode
+    settings.powerups_enabled = powerups_enabled
+    settings.ai_difficulty = difficulty
+
+    previous_clock, previous_rng = simclock.get_clock(), simclock.rng()
+    clock = simclock.set_clock(simclock.TickClock(FPS))
+    simclock.set_rng(simclock.RaceRNG(seed))
+    try:
+        start_angle = current_map.get("start_angle", 0)
+        player_car = AutopilotCar(4, 4, current_map["path"])
+        _place(player_car, current_map["player_start"], start_angle)
+
+        ai_speed, ai_rotation = get_ai_speed(difficulty, map_key)
+        computer_car = ComputerCar(ai_speed, ai_rotation, current_map["path"])
+        _place(computer_car, current_map["ai_start"], start_angle)
+
+        game_info = GameInfo()
+        ai_game_info = GameInfo()
+        game_info.start_level()
+        ai_game_info.start_level()
+
+        if powerups_enabled:
+            powerups = spawn_powerups(POWERUP_START_COUNT, current_map,
+                                      [(player_car.x, player_car.y), (computer_car.x, computer_car.y)])
+        else:
+            powerups = []
+        projectiles = []
+        # Particles are purely visual: keep none alive, but emit so the effects RNG advances as in the game
+        particles = ParticleSystem()
+        last_spawn = clock.now()
+
+        if max_ticks is None:
+            max_ticks = FPS * MAX_RACE_SECONDS_PER_LAP * laps
+
+        winner = None
+        while clock.ticks < max_ticks:
+            clock.tick()
+            player_car.update_power_state()
+
+            if powerups_enabled and clock.now() - last_spawn > SPAWN_INTERVAL:
+                occupied = [pu["pos"] for pu in powerups] + [(player_car.x, player_car.y),
+                                                             (computer_car.x, computer_car.y)]
+                powerups.extend(spawn_powerups(1, current_map, occupied))
+                last_spawn = clock.now()
+
+            particles.clear()
+
+            if player_car.ammo > 0:
+                projectiles.append(fire_projectile(player_car, "player"))
+
+            player_car.drive()
+            computer_car.move()
+
+            result = handle_collision(player_car, computer_car, powerups, projectiles, particles,
+                                      current_map, game_info, None, None, ai_game_info, settings)
+
+            if result == "win":
+                winner = "player"
+                break
+            if result == "lose":
+                winner = "ai"
+                break
+            if result in ("player_lap_win", "ai_lap_win"):
+                # Sprint mode: everyone back to the grid
+                _place(player_car, current_map["player_start"], start_angle)
+                player_car.vel = 0
+                _place(computer_car, current_map["ai_start"], start_angle)
+                computer_car.vel = computer_car.max_vel
+                computer_car.current_point = 0
+                player_car.current_point = 0
+                # The game counts down again before the next round, then restarts both timers
+                clock.tick(FPS * COUNTDOWN_SECONDS)
+                game_info.start_level()
+                ai_game_info.start_level()
+
+        game_info.freeze_time()
+        ai_game_info.freeze_time()
+        return {
+            "map": map_key,
+            "difficulty": difficulty,
+            "laps": laps,
+            "race_mode": race_mode,
+            "seed": seed,
+            "winner": winner,
+            "ticks": clock.ticks,
+            "race_time": round(clock.now(), 2),
+            "lap_times": {"player": game_info.lap_times, "ai": ai_game_info.lap_times},
+            "best_lap": {"player": game_info.best_time, "ai": ai_game_info.best_time},
+        }
+    finally:
+        simclock.set_clock(previous_clock)
+        simclock.set_rng(previous_rng)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run races without a window, as fast as the CPU allows")
+    parser.add_argument("--map", default="classic", choices=sorted(MAPS.keys()))
+    parser.add_argument("--difficulty", default="medium", choices=["easy", "medium", "hard", "extreme"])
+    parser.add_argument("--laps", type=int, default=1)
+    parser.add_argument("--mode", default="continuous", choices=["continuous", "sprint"])
+    parser.add_argument("--races", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the first race, incremented per race")
+    parser.add_argument("--no-powerups", action="store_true")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    total_ticks = 0
+    for i in range(args.races):
+        seed = None if args.seed is None else args.seed + i
+        result = run_race(args.map, args.difficulty, args.laps, args.mode,
+                          not args.no_powerups, seed)
+        total_ticks += result["ticks"]
+        print(json.dumps(result))
+
+    elapsed = time.perf_counter() - started
+    print(f"{args.races} races, {total_ticks} ticks in {elapsed:.2f}s "
+          f"({total_ticks / elapsed:.0f} ticks/s, {total_ticks / FPS / elapsed:.1f}x real time)")
+
+
+if __name__ == "__main__":
+    main()
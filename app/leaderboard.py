@@ -1,8 +1,185 @@
+import atexit
 import json
 import os
+import queue
+import threading
+import time as _time
 from datetime import datetime
 
+from config import LEADERBOARD_BACKEND
+
 LEADERBOARD_FILE = "leaderboard.json"
+MODES = ("single_player", "multiplayer")
+BOARD_SIZE = 10  # Records kept per mode, map and difficulty in leaderboard.json
+
+
+class LeaderboardIndex:
+    """Leaderboard records indexed by (mode, difficulty, map).
+
+    The file is parsed once and re-read only when its mtime or size
+    changes, so screens can query it every frame. None in a key means
+    "any", e.g. (mode, None, None) holds every record of a mode.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.signature = None
+        self.data = None
+        self.records = {}
+        self.rebuilds = 0
+
+    def _file_signature(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self):
+        # While a save is queued the file on disk is older than memory
+        if self.data is not None and _writer.busy():
+            return
+        signature = self._file_signature()
+        if self.data is None or signature != self.signature:
+            self.rebuild(load_leaderboard(), signature)
+
+    def saved(self, data):
+        """Called by the writer once data is on disk, so it is not re-read"""
+        if self.data is data:
+            self.signature = self._file_signature()
+
+    def rebuild(self, data, signature=None):
+        self.data = data
+        self.signature = signature
+        self.rebuilds += 1
+        self.records = {}
+        for mode in MODES:
+            for record in sorted(data.get(mode, []), key=lambda r: r["time"]):
+                difficulty, map_name = record.get("difficulty"), record.get("map")
+                # dict.fromkeys drops repeats when a record has no difficulty or map
+                for key in dict.fromkeys(((mode, None, None), (mode, difficulty, None),
+                                          (mode, None, map_name), (mode, difficulty, map_name))):
+                    self.records.setdefault(key, []).append(record)
+
+    def top(self, mode, limit, difficulty=None, map_name=None):
+        self.refresh()
+        return self.records.get((mode, difficulty, map_name), [])[:limit]
+
+
+class LeaderboardWriter:
+    """Persists leaderboard changes on a background thread.
+
+    Callers update memory first and hand the write over, so the render
+    thread never waits on the disk. Writes queued close together are
+    coalesced: only the newest JSON snapshot is written, and database
+    records go in as one transaction.
+    """
+
+    COALESCE_DELAY = 0.1  # Seconds to wait for more writes before touching the disk
+    RETRY_DELAY = 2.0     # Seconds before a failed write is tried again
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        # Reentrant so readers can hold it across the database and pending records
+        self.lock = threading.RLock()
+        self.thread = None
+        self.unsaved_records = []  # (mode, record) not yet in the database
+        self.failed = []           # Queue items whose write failed, retried with the next batch
+        self.writes = 0
+        self.errors = 0
+
+    def _start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+            self.thread.start()
+
+    def busy(self):
+        return self.queue.unfinished_tasks > 0 or bool(self.failed)
+
+    def save_json(self, data):
+        self._start()
+        self.queue.put(("json", data))
+
+    def add_db_record(self, mode, record):
+        with self.lock:
+            self.unsaved_records.append((mode, record))
+        self._start()
+        self.queue.put(("sqlite", mode, record))
+
+    def pending_db_records(self, mode):
+        with self.lock:
+            return [record for m, record in self.unsaved_records if m == mode]
+
+    def _run(self):
+        while True:
+            try:
+                # With a failed batch waiting, wake up to retry it even if nothing new arrives
+                batch = [self.queue.get(timeout=self.RETRY_DELAY if self.failed else None)]
+            except queue.Empty:
+                batch = []
+            _time.sleep(self.COALESCE_DELAY)
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(self.failed + batch)
+                self.failed = []
+            except Exception as e:
+                # Keep the thread alive and the records pending; they are retried
+                self.errors += 1
+                self.failed = self.failed + batch
+                print(f"Leaderboard save failed, retrying in {self.RETRY_DELAY:.0f}s: {e!r}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _write(self, batch):
+        snapshots = [item[1] for item in batch if item[0] == "json"]
+        if snapshots:
+            if not save_leaderboard(snapshots[-1]):
+                raise OSError(f"could not write {LEADERBOARD_FILE}")
+            _index.saved(snapshots[-1])
+            self.writes += 1
+
+        records = [item[1:] for item in batch if item[0] == "sqlite"]
+        if records:
+            db = _database()
+            # Commit and drop from pending together, so readers never see a record twice or not at all
+            with self.lock:
+                db.add_batch({mode: [record for m, record in records if m == mode] for mode in MODES})
+                for item in records:
+                    self.unsaved_records.remove(item)
+            self.writes += 1
+
+    def flush(self):
+        """Block until every queued write has been tried"""
+        self.queue.join()
+        if self.failed:
+            print(f"Leaderboard: {len(self.failed)} change(s) could not be saved")
+
+
+_index = LeaderboardIndex(LEADERBOARD_FILE)
+_writer = LeaderboardWriter()
+_db = None
+_db_lock = threading.Lock()
+
+
+def _database():
+    """SQLite backend, opened on first use; imports leaderboard.json once"""
+    global _db
+    with _db_lock:
+        if _db is None:
+            from leaderboard_db import LeaderboardDB
+            _db = LeaderboardDB()
+            _db.import_json(LEADERBOARD_FILE)
+    return _db
+
+
+def _use_database():
+    return LEADERBOARD_BACKEND == "sqlite"
+
 
 def load_leaderboard():
     """Load leaderboard data from file"""
@@ -15,18 +192,47 @@ def load_leaderboard():
     return {"single_player": [], "multiplayer": []}
 
 def save_leaderboard(data):
-    """Save leaderboard data to file"""
+    """Save leaderboard data to file atomically (temp file + rename)"""
+    temp_file = LEADERBOARD_FILE + ".tmp"
     try:
-        with open(LEADERBOARD_FILE, 'w') as f:
+        with open(temp_file, 'w') as f:
             json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, LEADERBOARD_FILE)
         return True
     except:
         return False
 
+def flush_leaderboard():
+    """Wait for queued leaderboard writes; call before exiting"""
+    _writer.flush()
+
+atexit.register(flush_leaderboard)
+
+def _add_json_record(mode, record):
+    """Update the in-memory board now and save it in the background"""
+    _index.refresh()
+    # Build a new dict: the writer may still be serialising the old one
+    leaderboard = {m: list(_index.data.get(m, [])) for m in MODES}
+    leaderboard[mode].append(record)
+    
+    # Sort by time (fastest first) and keep the top records of each map and difficulty
+    leaderboard[mode].sort(key=lambda x: x["time"])
+    counts = {}
+    kept = []
+    for entry in leaderboard[mode]:
+        board = (entry.get("map"), entry.get("difficulty"))
+        counts[board] = counts.get(board, 0) + 1
+        if counts[board] <= BOARD_SIZE:
+            kept.append(entry)
+    leaderboard[mode] = kept
+    
+    _index.rebuild(leaderboard, _index.signature)
+    _writer.save_json(leaderboard)
+
 def add_single_player_record(player_name, time, map_name, difficulty, laps):
     """Add a single player record to leaderboard"""
-    leaderboard = load_leaderboard()
-    
     record = {
         "name": player_name[:10],  # Limit to 10 characters
         "time": round(time, 2),
@@ -36,19 +242,15 @@ def add_single_player_record(player_name, time, map_name, difficulty, laps):
         "date": datetime.now().strftime("%m/%d/%Y | %I:%M %p").upper()
     }
     
-    leaderboard["single_player"].append(record)
-    
-    # Sort by time (fastest first) and keep top 10
-    leaderboard["single_player"].sort(key=lambda x: x["time"])
-    leaderboard["single_player"] = leaderboard["single_player"][:10]
-    
-    save_leaderboard(leaderboard)
+    if _use_database():
+        # The database keeps every race
+        _writer.add_db_record("single_player", record)
+    else:
+        _add_json_record("single_player", record)
     return record
 
 def add_multiplayer_record(winner_name, loser_name, time, map_name, laps):
     """Add a multiplayer record to leaderboard"""
-    leaderboard = load_leaderboard()
-    
     record = {
         "winner": winner_name[:10],
         "loser": loser_name[:10],
@@ -58,22 +260,47 @@ def add_multiplayer_record(winner_name, loser_name, time, map_name, laps):
         "date": datetime.now().strftime("%m/%d/%Y | %I:%M %p").upper()
     }
     
-    leaderboard["multiplayer"].append(record)
-    
-    # Sort by time (fastest first) and keep top 10
-    leaderboard["multiplayer"].sort(key=lambda x: x["time"])
-    leaderboard["multiplayer"] = leaderboard["multiplayer"][:10]
-    
-    save_leaderboard(leaderboard)
+    if _use_database():
+        _writer.add_db_record("multiplayer", record)
+    else:
+        _add_json_record("multiplayer", record)
     return record
 
-def get_top_records(mode="single_player", limit=10, difficulty=None):
-    """Get top records for a specific mode, optionally filtered by difficulty"""
-    leaderboard = load_leaderboard()
-    records = leaderboard.get(mode, [])
-    
-    # Filter by difficulty if specified (for single player)
-    if mode == "single_player" and difficulty:
-        records = [r for r in records if r.get("difficulty") == difficulty]
-    
-    return records[:limit]
+def get_top_records(mode="single_player", limit=10, difficulty=None, map_name=None):
+    """Get top records for a specific mode, optionally filtered by difficulty and map"""
+    # Difficulty only applies to single player records
+    if mode != "single_player":
+        difficulty = None
+    if _use_database():
+        db = _database()
+        # One snapshot of the database and the writer's queue, which commits under the same lock
+        with _writer.lock:
+            records = db.top(mode, limit, difficulty, map_name)
+            pending = _writer.pending_db_records(mode)
+        # Races still queued for the writer show up straight away
+        pending = [r for r in pending
+                   if (difficulty is None or r.get("difficulty") == difficulty)
+                   and (map_name is None or r.get("map") == map_name)]
+        if pending:
+            records = sorted(records + pending, key=lambda r: r["time"])[:limit]
+        return records
+    return _index.top(mode, limit, difficulty, map_name)
+
+def get_personal_best(name, mode="single_player", difficulty=None, map_name=None):
+    """A player's fastest recorded race, or None"""
+    if _use_database():
+        return _database().personal_best(name[:10], mode, difficulty, map_name)
+    key = "name" if mode == "single_player" else "winner"
+    for record in _index.top(mode, None, difficulty, map_name):
+        if record.get(key) == name[:10]:
+            return record
+    return None
+
+def get_time_percentile(time, mode="single_player", difficulty=None, map_name=None):
+    """Percentage of recorded races slower than time"""
+    if _use_database():
+        return _database().percentile(time, mode, difficulty, map_name)
+    records = _index.top(mode, None, difficulty, map_name)
+    if not records:
+        return 100.0
+    return round(100 * sum(1 for r in records if r["time"] > time) / len(records), 1)
@@ -0,0 +1,178 @@
+"""
+SQLite leaderboard backend
+
+Keeps every race ever recorded instead of a top 10 per board, so each map,
+difficulty and lap count has its own board. Indexes on
+(mode, map, difficulty, laps, time) let top-N, personal-best and percentile
+queries read only the matching slice of the table.
+
+Enable it with LEADERBOARD_BACKEND = "sqlite" in config.py. The existing
+leaderboard.json is imported automatically the first time the database is
+opened, or by hand from the repository root:
+
+    python app/leaderboard_db.py --import leaderboard.json
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+
+LEADERBOARD_DB_FILE = "leaderboard.db"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS races (
+    id INTEGER PRIMARY KEY,
+    mode TEXT NOT NULL,
+    name TEXT NOT NULL,
+    loser TEXT,
+    time REAL NOT NULL,
+    map TEXT,
+    difficulty TEXT,
+    laps INTEGER,
+    date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_races_board ON races (mode, map, difficulty, laps, time);
+CREATE INDEX IF NOT EXISTS idx_races_difficulty ON races (mode, difficulty, time);
+CREATE INDEX IF NOT EXISTS idx_races_mode ON races (mode, time);
+CREATE INDEX IF NOT EXISTS idx_races_name ON races (mode, name, time);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _where(mode, map_name=None, difficulty=None, laps=None, name=None):
+    clauses, params = ["mode = ?"], [mode]
+    for column, value in (("map", map_name), ("difficulty", difficulty), ("laps", laps), ("name", name)):
+        if value is not None:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return " AND ".join(clauses), params
+
+
+def _to_record(row):
+    """Row -> dict shaped like the records in leaderboard.json"""
+    mode, name, loser, time, map_name, difficulty, laps, date = row
+    if mode == "multiplayer":
+        return {"winner": name, "loser": loser, "time": time, "map": map_name, "laps": laps, "date": date}
+    return {"name": name, "time": time, "map": map_name, "difficulty": difficulty, "laps": laps, "date": date}
+
+
+class LeaderboardDB:
+    """Every recorded race in one WAL-mode SQLite table"""
+
+    COLUMNS = "mode, name, loser, time, map, difficulty, laps, date"
+
+    def __init__(self, path=LEADERBOARD_DB_FILE):
+        self.path = path
+        # One shared connection; the lock keeps writer threads and the UI apart
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def add_record(self, mode, record):
+        self.add_records(mode, [record])
+
+    def add_records(self, mode, records):
+        self.add_batch({mode: records})
+
+    def add_batch(self, records_by_mode):
+        """Insert {mode: records} as one transaction: all of it is stored or none"""
+        with self.lock, self.conn:
+            for mode, records in records_by_mode.items():
+                self._insert(mode, records)
+
+    def _insert(self, mode, records):
+        # Caller holds the lock and commits
+        rows = [(mode, r.get("winner", r.get("name")), r.get("loser"), r["time"], r.get("map"),
+                 r.get("difficulty"), r.get("laps"), r.get("date")) for r in records]
+        self.conn.executemany(f"INSERT INTO races ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def top(self, mode, limit=10, difficulty=None, map_name=None, laps=None):
+        """Fastest races on a board; unset filters match everything"""
+        where, params = _where(mode, map_name, difficulty, laps)
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {self.COLUMNS} FROM races WHERE {where} ORDER BY time LIMIT ?", params + [limit]
+            ).fetchall()
+        return [_to_record(row) for row in rows]
+
+    def personal_best(self, name, mode="single_player", difficulty=None, map_name=None, laps=None):
+        """A player's fastest race on a board, or None"""
+        where, params = _where(mode, map_name, difficulty, laps, name)
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT {self.COLUMNS} FROM races WHERE {where} ORDER BY time LIMIT 1", params
+            ).fetchone()
+        return _to_record(row) if row else None
+
+    def percentile(self, time, mode="single_player", difficulty=None, map_name=None, laps=None):
+        """Percentage of races on a board slower than time (100 = fastest ever)"""
+        where, params = _where(mode, map_name, difficulty, laps)
+        with self.lock:
+            total, slower = self.conn.execute(
+                f"SELECT COUNT(*), COUNT(CASE WHEN time > ? THEN 1 END) FROM races WHERE {where}",
+                [time] + params
+            ).fetchone()
+        if not total:
+            return 100.0
+        return round(100 * slower / total, 1)
+
+    def count(self, mode=None):
+        with self.lock:
+            if mode is None:
+                return self.conn.execute("SELECT COUNT(*) FROM races").fetchone()[0]
+            return self.conn.execute("SELECT COUNT(*) FROM races WHERE mode = ?", (mode,)).fetchone()[0]
+
+    def import_json(self, path, force=False):
+        """Copy the records of a leaderboard.json file in, once per file.
+
+        Returns the number of records imported (0 if already imported).
+        """
+        key = "imported:" + os.path.abspath(path)
+        with self.lock:
+            done = self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone()
+        if (done and not force) or not os.path.exists(path):
+            return 0
+
+        with open(path, "r") as f:
+            data = json.load(f)
+        imported = 0
+        # Records and the "imported" marker commit together, so a failed import is redone cleanly
+        with self.lock, self.conn:
+            for mode in ("single_player", "multiplayer"):
+                records = data.get(mode, [])
+                self._insert(mode, records)
+                imported += len(records)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, str(imported)))
+        return imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the SQLite leaderboard")
+    parser.add_argument("--db", default=LEADERBOARD_DB_FILE)
+    parser.add_argument("--import", dest="import_path", metavar="JSON", help="Import a leaderboard.json file")
+    parser.add_argument("--force", action="store_true", help="Import even if the file was imported before")
+    args = parser.parse_args()
+
+    db = LeaderboardDB(args.db)
+    if args.import_path:
+        imported = db.import_json(args.import_path, args.force)
+        print(f"Imported {imported} records from {args.import_path}")
+    print(f"{db.count('single_player')} single player and {db.count('multiplayer')} multiplayer races in {args.db}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
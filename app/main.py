@@ -1,9 +1,27 @@
-import pygame
 import time
+STARTUP_STARTED = time.perf_counter()  # Taken before pygame loads, for the first-frame report
+import pygame
 import math
 import random
-from utils import blit_text_center, scale_image, blit_rotate_center
-from leaderboard import add_single_player_record, add_multiplayer_record, get_top_records
+import simclock
+from config import (DEBUG_MODE, DIRTY_RECT_RENDERING, SHOW_FRAME_STATS, CAR_SPRITE_ANGLE_STEP, EXACT_CAR_ROTATION,
+                    POWERUP_BORDER_CLEARANCE, POWERUP_MIN_SPACING, ENABLE_PARTICLES, PARTICLE_CAPACITY,
+                    PARTICLE_COUNT_COLLISION, PARTICLE_COUNT_PICKUP, PARTICLE_COUNT_EXPLOSION, PARTICLE_COUNT_FINISH)
+from utils import blit_text_center, blit_rotate_center
+from leaderboard import add_single_player_record, add_multiplayer_record, get_top_records, flush_leaderboard
+from masks import CAR_MASKS, SWEEP_MAX_DISTANCE, SWEEP_STEP, segment_hit, sweep_mask
+from render import DirtyRectRenderer, FrameStats
+from text_cache import TEXT_CACHE, render_text
+from surface_pool import SURFACE_POOL
+from particles import ParticleSystem
+from spawn_index import SPAWN_INDEXES
+from spatial_hash import SpatialHash
+from distance_field import DISTANCE_FIELDS
+from map_registry import discover_maps
+from thumbnails import THUMBNAILS
+from assets import ASSETS, load_image
+from fonts import load_font
+from sprites import PowerupAnimation, RotationFrames, car_sprite_sheet, car_sheet_memory, exact_rotation, set_exact_rotation
 pygame.font.init()
 
 # Game Constants
@@ -18,47 +36,41 @@ PU_VULN = "vulnerability"
 PU_WEAPON = "weapon"
 PU_COLORS = {PU_BOOST: (255, 215, 0), PU_VULN: (200, 0, 200), PU_WEAPON: (0, 200, 0)}
 
-# Load assets
-GRASS = scale_image(pygame.image.load('imgs/terrain-1.png'), 2.3) 
-TRACK = scale_image(pygame.image.load('imgs/track.png'), 1)
-TRACK_BORDER = scale_image(pygame.image.load('imgs/track-border.png'), 1)
-TRACK_BORDER_MASK = pygame.mask.from_surface(TRACK_BORDER)
-TRACK_MASK = pygame.mask.from_surface(TRACK)
-
-FINISH = pygame.image.load('imgs/finish.png')
-FINISH_MASK = pygame.mask.from_surface(FINISH)
-FINISH_POSITION = (140, 250)
-
-FERARRI = scale_image(pygame.image.load('imgs/fer.png'), 0.12)
-BLUE_CAR = scale_image(pygame.image.load('imgs/redbull.png'), 0.08)
-
-# Menu images for car selection
-FERRARI_MENU = pygame.image.load('imgs/ferrari-menu.png')
-REDBULL_MENU = pygame.image.load('imgs/redbull-menu.png')
-
-POWERUP_BOOST_IMG = scale_image(pygame.image.load('imgs/powerup_boost.png'), 0.3)
-POWERUP_VULN_IMG = scale_image(pygame.image.load('imgs/powerup_vuln.png'), 0.3)
-POWERUP_WEAPON_IMG = scale_image(pygame.image.load('imgs/powerup_weapon.png'), 0.3)
-PROJECTILE_IMG = scale_image(pygame.image.load('imgs/projectile.png'), 1.0)
-
-# Window setup
-WIDTH, HEIGHT = TRACK.get_width(), TRACK.get_height()
-WIN = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("🏎️ Ultimate Racing Championship")
+# Map packs from maps/; only their manifests are read here
+MAPS = discover_maps(spawn_clearance=POWERUP_BORDER_CLEARANCE)
+MENU_MAP = "classic" if "classic" in MAPS else next(iter(MAPS))
+MAP_CARDS_PER_PAGE = 2  # Map select cards that fit above the back button
+
+# Assets load on first use (or on the prefetch thread), except what the main menu draws
+ASSETS.register("car:ferrari", lambda: load_image('imgs/fer.png', 0.12))
+ASSETS.register("car:redbull", lambda: load_image('imgs/redbull.png', 0.08))
+ASSETS.register("menu:ferrari", lambda: load_image('imgs/ferrari-menu.png'))
+ASSETS.register("menu:redbull", lambda: load_image('imgs/redbull-menu.png'))
+# Pre-rendered animation frames, drawn with a plain indexed blit
+ASSETS.register("powerup_frames", lambda: {
+    PU_BOOST: PowerupAnimation(load_image('imgs/powerup_boost.png', 0.3)),
+    PU_VULN: PowerupAnimation(load_image('imgs/powerup_vuln.png', 0.3)),
+    PU_WEAPON: PowerupAnimation(load_image('imgs/powerup_weapon.png', 0.3)),
+})
+ASSETS.register("projectile_frames", lambda: RotationFrames(load_image('imgs/projectile.png')))
+
+CAR_ASSETS = ("car:ferrari", "car:redbull")   # Indexed by car selection
+PREFETCH_ASSETS = ("menu:ferrari", "menu:redbull", "car:ferrari", "car:redbull",
+                   "powerup_frames", "projectile_frames")
+
+set_exact_rotation(EXACT_CAR_ROTATION)
+
+# Window size (the window itself is opened in the main block); the menu
+# map is the menu backdrop, so its images load up front
+WIDTH, HEIGHT = MAPS[MENU_MAP]["track"].get_size()
 
 # Fonts - Professional styling
-TITLE_FONT = pygame.font.SysFont("arial", 72, bold=True)
-MAIN_FONT = pygame.font.SysFont("arial", 36, bold=True)
-SMALL_FONT = pygame.font.SysFont("arial", 24)
-TINY_FONT = pygame.font.SysFont("arial", 18)
-HUD_FONT = pygame.font.SysFont("consolas", 16, bold=True)
-COUNTDOWN_FONT = pygame.font.SysFont("arial", 180, bold=True)
-
-# AI Path
-PATH = [ (182, 109), (81, 99), (64, 441), (115, 594), (319, 808), 
-    (431, 782), (468, 560), (605, 533), (667, 620), (683, 777), 
-    (803, 784), (813, 417), (497, 393), (470, 297), (789, 268), 
-    (800, 92), (337, 87), (307, 396), (213, 393), (199, 223)]
+TITLE_FONT = load_font("arial", 72, bold=True)
+MAIN_FONT = load_font("arial", 36, bold=True)
+SMALL_FONT = load_font("arial", 24)
+TINY_FONT = load_font("arial", 18)
+HUD_FONT = load_font("consolas", 16, bold=True)
+COUNTDOWN_FONT = load_font("arial", 180, bold=True)
 
 # Game Settings
 class GameSettings:
@@ -162,62 +174,6 @@ def update_window_title(state, current_map=None, lap=None):
     else:
         pygame.display.set_caption("🏎️ Ultimate Racing Championship")
 
-# Load city circuit map assets
-try:
-    CITY_GRASS = pygame.image.load('imgs/city-grass.png')
-    CITY_TRACK = pygame.image.load('imgs/city-track.png')
-    CITY_BORDER = pygame.image.load('imgs/city-border.png')
-    CITY_BORDER_MASK = pygame.mask.from_surface(CITY_BORDER)
-    CITY_TRACK_MASK = pygame.mask.from_surface(CITY_TRACK)
-    CITY_FINISH = pygame.image.load('imgs/city-finish.png')
-    CITY_FINISH_MASK = pygame.mask.from_surface(CITY_FINISH)
-    CITY_FINISH_POS = (510, 60)
-    CITY_PATH = [  (104, 91), (102, 279), (224, 297),
-             (229, 563), (111, 603), (125, 775),
-             (790, 779), (794, 613), (656, 575),
-             (662, 321), (794, 278), (798, 119),
-             (499, 101)]
-    city_available = True
-except:
-    city_available = False
-
-# Map configurations
-MAPS = {
-    "classic": {
-        "name": "Classic Circuit",
-        "grass": GRASS,
-        "track": TRACK,
-        "border": TRACK_BORDER,
-        "border_mask": TRACK_BORDER_MASK,
-        "track_mask": TRACK_MASK,
-        "finish": FINISH,
-        "finish_mask": FINISH_MASK,
-        "finish_pos": FINISH_POSITION,
-        "path": PATH,
-        "player_start": (205, 200),
-        "ai_start": (170, 200),
-        "checkpoint": (490, 389)  # Halfway point on the track
-    }
-}
-
-if city_available:
-    MAPS["city"] = {
-        "name": "City Circuit",
-        "grass": CITY_GRASS,
-        "track": CITY_TRACK,
-        "border": CITY_BORDER,
-        "border_mask": CITY_BORDER_MASK,
-        "track_mask": CITY_TRACK_MASK,
-        "finish": CITY_FINISH,
-        "finish_mask": CITY_FINISH_MASK,
-        "finish_pos": CITY_FINISH_POS,
-        "path": CITY_PATH,
-        "player_start": (430, 85),  # Moved up from 105 to 85
-        "ai_start": (430, 55),      # Moved up from 75 to 55
-        "start_angle": 90,
-        "checkpoint": (662, 575)  # Halfway point on city track
-    }
-
 class GameInfo:
     def __init__(self, level=1):
         self.level = level
@@ -229,7 +185,9 @@ class GameInfo:
         self.last_lap_time = -10  # Initialize to -10 to allow first lap immediately
         self.frozen_time = None  # For freezing timer when race ends
         self.passed_halfway = False  # Track if player passed halfway point to prevent wrong-way finish
+        self.next_checkpoint = 0  # Index of the map checkpoint to drive through next this lap
         self.wrong_way_warning = 0  # Timestamp for showing wrong way warning
+        self.lap_times = []  # Every completed lap, in order
 
     def next_level(self):
         self.level += 1
@@ -244,30 +202,42 @@ class GameInfo:
     
     def start_level(self):
         self.started = True
-        self.level_start_time = time.time()
-        self.current_lap_start = time.time()
+        self.level_start_time = simclock.now()
+        self.current_lap_start = simclock.now()
         self.frozen_time = None
         self.passed_halfway = False  # Reset checkpoint for new race
+        self.next_checkpoint = 0
+    
+    def pass_checkpoints(self, car, checkpoints, radius=80):
+        """Advance through the map's checkpoints in order; passed_halfway once all are done"""
+        if self.passed_halfway or not checkpoints:
+            return
+        x, y = checkpoints[self.next_checkpoint]
+        if math.hypot(car.x - x, car.y - y) < radius:
+            self.next_checkpoint += 1
+            if self.next_checkpoint == len(checkpoints):
+                self.passed_halfway = True
+                self.next_checkpoint = 0
     
     def freeze_time(self):
         """Freeze the timer at current time"""
         if self.started and self.frozen_time is None:
-            self.frozen_time = time.time() - self.level_start_time
+            self.frozen_time = simclock.now() - self.level_start_time
 
     def get_level_time(self):
         if not self.started:
             return 0
         if hasattr(self, 'frozen_time') and self.frozen_time is not None:
             return round(self.frozen_time, 2)
-        return round(time.time() - self.level_start_time, 2)
+        return round(simclock.now() - self.level_start_time, 2)
     
     def get_lap_time(self):
         if not self.started:
             return 0
-        return round(time.time() - self.current_lap_start, 2)
+        return round(simclock.now() - self.current_lap_start, 2)
     
     def complete_lap(self):
-        current_time = time.time()
+        current_time = simclock.now()
         # Prevent multiple lap counts within 2 seconds (cooldown)
         if current_time - self.last_lap_time < 2.0:
             return 0
@@ -276,13 +246,14 @@ class GameInfo:
         if self.best_time is None or lap_time < self.best_time:
             self.best_time = lap_time
         self.laps += 1
+        self.lap_times.append(lap_time)
         self.current_lap_start = current_time
         self.last_lap_time = current_time
         return lap_time
 
 class AbstractCar:
     def __init__(self, max_vel, rotation_vel):
-        self.img = self.IMG
+        self.img = ASSETS.get(self.IMG)
         self.max_vel = max_vel
         self.original_max_vel = max_vel
         self.vel = 0
@@ -290,6 +261,7 @@ class AbstractCar:
         self.angle = 0
         self.x, self.y = self.START_POS
         self.prev_x, self.prev_y = self.x, self.y
+        self.free_x, self.free_y = self.x, self.y  # Last position known clear of the walls
         self.acceleration = 0.2
     
     def rotate(self, left=False, right=False):
@@ -299,7 +271,10 @@ class AbstractCar:
             self.angle -= self.rotation_vel
 
     def draw(self, win):
-        blit_rotate_center(win, self.img, (self.x, self.y), self.angle)
+        if exact_rotation():
+            return blit_rotate_center(win, self.img, (self.x, self.y), self.angle)
+        frame, dx, dy = car_sprite_sheet(self.img, CAR_SPRITE_ANGLE_STEP).frame(self.angle)
+        return win.blit(frame, (round(self.x) + dx, round(self.y) + dy))
 
     def move_forward(self):
         self.vel = min(self.vel + self.acceleration, self.max_vel)
@@ -317,9 +292,36 @@ class AbstractCar:
         self.x -= horizontal
         self.y -= vertical
     
+    def sweep(self, mask):
+        """Stop the car just short of mask if it hit it since its last free position.
+
+        Keeps fast cars from tunnelling through walls thinner than one move.
+        The sweep starts from the last previous position clear of mask, so
+        a car still touching a wall after a bounce is swept as well. Moves
+        of SWEEP_STEP or less, free positions more than SWEEP_MAX_DISTANCE
+        back, and free positions the car has since turned into the wall
+        at are left to collide(). Returns the contact point like collide()
+        does, or None.
+        """
+        car_mask, dx, dy = CAR_MASKS.get(self.img, self.angle)
+        if mask.overlap(car_mask, (int(self.prev_x + dx), int(self.prev_y + dy))) is None:
+            self.free_x, self.free_y = self.prev_x, self.prev_y
+        elif mask.overlap(car_mask, (int(self.free_x + dx), int(self.free_y + dy))) is not None:
+            return None
+        distance = math.hypot(self.x - self.free_x, self.y - self.free_y)
+        if distance <= SWEEP_STEP or distance > SWEEP_MAX_DISTANCE:
+            return None
+        hit = sweep_mask(mask, car_mask, self.free_x + dx, self.free_y + dy, self.x + dx, self.y + dy)
+        if hit is None:
+            return None
+        (free_x, free_y), poi = hit
+        self.x, self.y = free_x - dx, free_y - dy
+        return poi
+
     def collide(self, mask, x=0, y=0):
-        car_mask = pygame.mask.from_surface(self.img)
-        offset = (int(self.x - x), int(self.y - y))
+        # Rotated mask is cached per angle bucket and placed where blit_rotate_center draws the car
+        car_mask, dx, dy = CAR_MASKS.get(self.img, self.angle)
+        offset = (int(self.x + dx - x), int(self.y + dy - y))
         poi = mask.overlap(car_mask, offset)
         return poi
     
@@ -329,9 +331,10 @@ class AbstractCar:
         self.vel = 0
         self.max_vel = self.original_max_vel
         self.prev_x, self.prev_y = self.x, self.y
+        self.free_x, self.free_y = self.x, self.y
 
 class PlayerCar(AbstractCar):
-    IMG = FERARRI
+    IMG = "car:ferrari"
     START_POS = (205, 200)
 
     def __init__(self, max_vel, rotation_vel, player_num=1):
@@ -345,13 +348,13 @@ class PlayerCar(AbstractCar):
         
         # Set different colors for different players
         if player_num == 2:
-            self.img = BLUE_CAR
+            self.img = ASSETS.get("car:redbull")
     
     def is_stunned(self):
-        return time.time() < self.stunned_until
+        return simclock.now() < self.stunned_until
     
     def stun(self, duration=2.0):
-        self.stunned_until = time.time() + duration
+        self.stunned_until = simclock.now() + duration
         self.vel = 0
 
     def reduce_speed(self):
@@ -363,7 +366,7 @@ class PlayerCar(AbstractCar):
         self.move()
 
     def apply_powerup(self, pu_type):
-        now = time.time()
+        now = simclock.now()
         if pu_type == PU_BOOST:
             self.max_vel = self.original_max_vel * 1.8
             self.active_power = PU_BOOST
@@ -378,7 +381,7 @@ class PlayerCar(AbstractCar):
             self.power_end_time = now + POWERUP_DURATION
 
     def update_power_state(self):
-        if self.active_power and time.time() > self.power_end_time:
+        if self.active_power and simclock.now() > self.power_end_time:
             if self.active_power == PU_BOOST:
                 self.max_vel = self.original_max_vel
             if self.active_power == PU_VULN:
@@ -386,7 +389,7 @@ class PlayerCar(AbstractCar):
             self.active_power = None
 
 class ComputerCar(AbstractCar):
-    IMG = BLUE_CAR
+    IMG = "car:redbull"
     START_POS = (170, 200)
 
     def __init__(self, max_vel, rotation_vel, path=[]):
@@ -431,7 +434,7 @@ class ComputerCar(AbstractCar):
                 self.current_point = 0
 
     def move(self):
-        now = time.time()
+        now = simclock.now()
         if self.stunned_until:
             if now < self.stunned_until:
                 return
@@ -457,9 +460,11 @@ class Projectile:
         self.angle = angle
         self.owner = owner
         self.dead = False
+        self.prev_x, self.prev_y = x, y
 
     def move(self):
         rad = math.radians(self.angle)
+        self.prev_x, self.prev_y = self.x, self.y
         self.x -= math.sin(rad) * self.SPEED
         self.y -= math.cos(rad) * self.SPEED
 
@@ -504,112 +509,70 @@ class Projectile:
     def rect(self):
         return pygame.Rect(self.x - self.RADIUS, self.y - self.RADIUS, self.RADIUS*2, self.RADIUS*2)
 
-class Particle:
-    def __init__(self, x, y, color, vel_x, vel_y, lifetime=1.0):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vel_x = vel_x
-        self.vel_y = vel_y
-        self.lifetime = lifetime
-        self.age = 0
-        self.size = random.randint(2, 5)
-
-    def update(self, dt):
-        self.x += self.vel_x * dt * 60
-        self.y += self.vel_y * dt * 60
-        self.age += dt
-        return self.age < self.lifetime
-
-    def draw(self, win):
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        size = max(1, int(self.size * (1 - self.age / self.lifetime)))
-        color = (*self.color[:3], alpha) if len(self.color) == 4 else self.color
-        pygame.draw.circle(win, color, (int(self.x), int(self.y)), size)
-
-def spawn_powerups(count=3, track_mask=None, border_mask=None):
+def spawn_powerups(count=3, game_map=None, avoid=()):
+    """Spawn power-ups on valid track pixels, spaced out from each other and from avoid positions"""
     powerups = []
-    margin = 50
-    attempts = 0
-    max_attempts = 5000
     
-    if track_mask is None:
-        track_mask = TRACK_MASK
-    if border_mask is None:
-        border_mask = TRACK_BORDER_MASK
-    
-    while len(powerups) < count and attempts < max_attempts:
-        pu_type = random.choice([PU_BOOST, PU_VULN, PU_WEAPON])
-        x = random.randint(margin, WIDTH - margin)
-        y = random.randint(margin, HEIGHT - margin)
-        
-        try:
-            # Check if position is on the track
-            # get_at returns an integer (0 or 1) for masks
-            on_track = track_mask.get_at((x, y)) > 0
-        except IndexError:
-            on_track = False
-        
-        try:
-            # Check if position is on border
-            on_border = border_mask.get_at((x, y)) > 0
-        except IndexError:
-            on_border = False
-
-        # Only spawn if on track AND not on border
-        if on_track and not on_border:
-            powerups.append({
-                "type": pu_type, 
-                "pos": (x, y), 
-                "angle": random.uniform(0, 360), 
-                "rot_speed": random.uniform(-90, 90), 
-                "pulse_offset": random.uniform(0, math.pi * 2)
-            })
-        attempts += 1
-
-    # If we couldn't find enough valid positions, don't add random ones
-    # This ensures powerups are ONLY on valid track areas
+    if game_map is None:
+        game_map = MAPS[MENU_MAP]
+    
+    # Valid pixels are indexed once per map, so each spawn is one random draw
+    index = SPAWN_INDEXES.get((game_map.key, POWERUP_BORDER_CLEARANCE), game_map["track_mask"],
+                              game_map["border_mask"], POWERUP_BORDER_CLEARANCE)
+    rng = simclock.rng().spawns
+    for x, y in index.spawn_points(count, rng, avoid, POWERUP_MIN_SPACING):
+        powerups.append({
+            "type": rng.choice([PU_BOOST, PU_VULN, PU_WEAPON]), 
+            "pos": (x, y), 
+            "angle": rng.uniform(0, 360), 
+            "rot_speed": rng.uniform(-90, 90), 
+            "pulse_offset": rng.uniform(0, math.pi * 2)
+        })
+
+    # If there is no room left, fewer power-ups spawn rather than invalid ones
     return powerups
 
 def draw_text_with_shadow(win, text, font, x, y, color=(255, 255, 255), shadow_color=(0, 0, 0), offset=2):
-    shadow = font.render(text, True, shadow_color)
-    main = font.render(text, True, color)
+    shadow = render_text(font, text, True, shadow_color)
+    main = render_text(font, text, True, color)
     win.blit(shadow, (x + offset, y + offset))
     win.blit(main, (x, y))
 
 def draw_hud(win, player_car, game_info, current_map, player_car2=None, game_info2=None, ai_game_info=None):
+    """Draw the HUD and return the screen rects it covered"""
+    rects = []
     # Draw wrong way warnings (always show, even if HUD is hidden)
-    current_time = time.time()
+    current_time = simclock.now()
     
     # Player 1 wrong way warning
     if hasattr(game_info, 'wrong_way_warning') and current_time - game_info.wrong_way_warning < 2.0:
         warning_alpha = int(255 * (1 - (current_time - game_info.wrong_way_warning) / 2.0))
         warning_text = "⚠️ WRONG WAY! ⚠️"
-        warning_surface = MAIN_FONT.render(warning_text, True, (255, 50, 50))
+        warning_surface = render_text(MAIN_FONT, warning_text, True, (255, 50, 50))
         warning_x = (WIDTH - warning_surface.get_width()) // 2
         warning_y = HEIGHT // 3
         
         # Pulsing effect
         scale = 1.0 + 0.1 * math.sin(current_time * 10)
         scaled_warning = pygame.transform.rotozoom(warning_surface, 0, scale)
-        win.blit(scaled_warning, (warning_x, warning_y))
+        rects.append(win.blit(scaled_warning, (warning_x, warning_y)))
     
     # Player 2 wrong way warning
     if player_car2 and game_info2 and hasattr(game_info2, 'wrong_way_warning') and current_time - game_info2.wrong_way_warning < 2.0:
         warning_alpha = int(255 * (1 - (current_time - game_info2.wrong_way_warning) / 2.0))
         warning_text = "⚠️ P2 WRONG WAY! ⚠️"
-        warning_surface = SMALL_FONT.render(warning_text, True, (255, 100, 150))
+        warning_surface = render_text(SMALL_FONT, warning_text, True, (255, 100, 150))
         warning_x = (WIDTH - warning_surface.get_width()) // 2
         warning_y = HEIGHT // 3 + 60
         
         # Pulsing effect
         scale = 1.0 + 0.1 * math.sin(current_time * 10)
         scaled_warning = pygame.transform.rotozoom(warning_surface, 0, scale)
-        win.blit(scaled_warning, (warning_x, warning_y))
+        rects.append(win.blit(scaled_warning, (warning_x, warning_y)))
     
     # Check if HUD should be shown
     if not game_settings.show_hud:
-        return
+        return rects
     
     # Modern HUD with panels - more transparent
     panel_color = (20, 20, 30, 120)
@@ -620,10 +583,8 @@ def draw_hud(win, player_car, game_info, current_map, player_car2=None, game_inf
     # Bottom-left panel - Player 1 info (combined with ammo)
     panel_height = 140 if player_car.active_power else 115
     panel_rect = pygame.Rect(10, HEIGHT - panel_height - 10, 220, panel_height)
-    s = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
-    s.fill(panel_color)
-    pygame.draw.rect(s, accent_color, s.get_rect(), 2, border_radius=8)
-    win.blit(s, panel_rect.topleft)
+    s = SURFACE_POOL.panel(panel_rect.size, panel_color, accent_color)
+    rects.append(win.blit(s, panel_rect.topleft))
     
     p1_label = "P1 " if player_car2 else ""
     y_start = HEIGHT - panel_height - 5
@@ -635,7 +596,7 @@ def draw_hud(win, player_car, game_info, current_map, player_car2=None, game_inf
     
     # Show active power if any
     if player_car.active_power:
-        remaining = max(0, player_car.power_end_time - time.time())
+        remaining = max(0, player_car.power_end_time - simclock.now())
         power_name = player_car.active_power.upper()
         power_color = (255, 215, 0) if player_car.active_power == PU_BOOST else (200, 0, 200) if player_car.active_power == PU_VULN else (0, 255, 0)
         draw_text_with_shadow(win, f"PWR: {power_name[:4]} {remaining:.1f}s", HUD_FONT, 18, y_start + 80, power_color)
@@ -646,10 +607,8 @@ def draw_hud(win, player_car, game_info, current_map, player_car2=None, game_inf
         panel_height2 = 140 if player_car2.active_power else 115
         p2_x_offset = WIDTH - 420  # Moved even more to the left
         panel_rect3 = pygame.Rect(p2_x_offset, HEIGHT - panel_height2 - 10, 220, panel_height2)
-        s3 = pygame.Surface((panel_rect3.width, panel_rect3.height), pygame.SRCALPHA)
-        s3.fill(panel_color)
-        pygame.draw.rect(s3, accent_color2, s3.get_rect(), 2, border_radius=8)
-        win.blit(s3, panel_rect3.topleft)
+        s3 = SURFACE_POOL.panel(panel_rect3.size, panel_color, accent_color2)
+        rects.append(win.blit(s3, panel_rect3.topleft))
         
         y_start2 = HEIGHT - panel_height2 - 5
         p2_text_x = p2_x_offset + 8
@@ -661,7 +620,7 @@ def draw_hud(win, player_car, game_info, current_map, player_car2=None, game_inf
         
         # Show active power if any
         if player_car2.active_power:
-            remaining = max(0, player_car2.power_end_time - time.time())
+            remaining = max(0, player_car2.power_end_time - simclock.now())
             power_name = player_car2.active_power.upper()
             power_color = (255, 215, 0) if player_car2.active_power == PU_BOOST else (200, 0, 200) if player_car2.active_power == PU_VULN else (0, 255, 0)
             draw_text_with_shadow(win, f"PWR: {power_name[:4]} {remaining:.1f}s", HUD_FONT, p2_text_x, y_start2 + 80, power_color)
@@ -672,10 +631,8 @@ def draw_hud(win, player_car, game_info, current_map, player_car2=None, game_inf
         ai_panel_height = 80
         ai_x_offset = WIDTH - 420
         ai_panel_rect = pygame.Rect(ai_x_offset, HEIGHT - ai_panel_height - 10, 220, ai_panel_height)
-        s_ai = pygame.Surface((ai_panel_rect.width, ai_panel_rect.height), pygame.SRCALPHA)
-        s_ai.fill(panel_color)
-        pygame.draw.rect(s_ai, accent_color_ai, s_ai.get_rect(), 2, border_radius=8)
-        win.blit(s_ai, ai_panel_rect.topleft)
+        s_ai = SURFACE_POOL.panel(ai_panel_rect.size, panel_color, accent_color_ai)
+        rects.append(win.blit(s_ai, ai_panel_rect.topleft))
         
         ai_y_start = HEIGHT - ai_panel_height - 5
         ai_text_x = ai_x_offset + 8
@@ -683,65 +640,81 @@ def draw_hud(win, player_car, game_info, current_map, player_car2=None, game_inf
         draw_text_with_shadow(win, f"TIME: {ai_game_info.get_lap_time():.2f}s", HUD_FONT, ai_text_x, ai_y_start + 20, (255, 150, 150))
         if ai_game_info.best_time:
             draw_text_with_shadow(win, f"BEST: {ai_game_info.best_time:.2f}s", HUD_FONT, ai_text_x, ai_y_start + 40, (255, 200, 100))
+    
+    return rects
 
-def draw(win, images, player_car, computer_car, game_info, powerups, projectiles, particles, current_map, player_car2=None, game_info2=None, ai_game_info=None):
-    for img, pos in images:
-        win.blit(img, pos)
+def draw(win, images, player_car, computer_car, game_info, powerups, projectiles, particles, current_map, player_car2=None, game_info2=None, ai_game_info=None, background=True):
+    """Draw the race and return the rects of everything drawn over the background"""
+    if background:
+        for img, pos in images:
+            win.blit(img, pos)
+    rects = []
 
     # Draw particles
-    for p in particles:
-        p.draw(win)
+    rects.extend(particles.draw(win))
 
     # Draw powerups with animation
     dt = 1.0 / FPS
+    powerup_frames = ASSETS.get("powerup_frames")
     for pu in powerups:
-        img = None
-        if pu["type"] == PU_BOOST:
-            img = POWERUP_BOOST_IMG
-        elif pu["type"] == PU_VULN:
-            img = POWERUP_VULN_IMG
-        elif pu["type"] == PU_WEAPON:
-            img = POWERUP_WEAPON_IMG
+        frames = powerup_frames.get(pu["type"])
 
         pu["angle"] = (pu.get("angle", 0) + pu.get("rot_speed", 0) * dt) % 360
         pu["pulse_offset"] = pu.get("pulse_offset", 0) + dt * 2.0
 
-        if img:
+        if frames:
             scale = 1.0 + 0.15 * math.sin(pu["pulse_offset"])
-            rot_img = pygame.transform.rotozoom(img, pu["angle"], scale)
+            rot_img = frames.frame(pu["angle"], scale)
             rect = rot_img.get_rect(center=pu["pos"])
-            win.blit(rot_img, rect.topleft)
+            rects.append(win.blit(rot_img, rect.topleft))
         else:
             color = PU_COLORS.get(pu["type"], (255,255,255))
-            pygame.draw.circle(win, color, pu["pos"], 12)
+            rects.append(pygame.draw.circle(win, color, pu["pos"], 12))
             pygame.draw.circle(win, (0,0,0), pu["pos"], 12, 2)
 
     # Draw projectiles
+    projectile_frames = ASSETS.get("projectile_frames")
     for p in projectiles:
-        if PROJECTILE_IMG:
-            img = pygame.transform.rotate(PROJECTILE_IMG, p.angle)
+        if projectile_frames:
+            img = projectile_frames.frame(p.angle)
             rect = img.get_rect(center=(int(p.x), int(p.y)))
-            win.blit(img, rect.topleft)
+            rects.append(win.blit(img, rect.topleft))
         else:
             p.draw(win)
+            rects.append(p.rect().inflate(30, 30))
 
-    player_car.draw(win)
+    rects.append(player_car.draw(win))
     # Draw stun indicator for player 1
     if player_car.is_stunned():
-        stun_text = SMALL_FONT.render("STUNNED!", True, (255, 50, 50))
-        win.blit(stun_text, (int(player_car.x - 30), int(player_car.y - 40)))
+        stun_text = render_text(SMALL_FONT, "STUNNED!", True, (255, 50, 50))
+        rects.append(win.blit(stun_text, (int(player_car.x - 30), int(player_car.y - 40))))
     
     if player_car2:
-        player_car2.draw(win)
+        rects.append(player_car2.draw(win))
         # Draw stun indicator for player 2
         if player_car2.is_stunned():
-            stun_text = SMALL_FONT.render("STUNNED!", True, (255, 50, 50))
-            win.blit(stun_text, (int(player_car2.x - 30), int(player_car2.y - 40)))
+            stun_text = render_text(SMALL_FONT, "STUNNED!", True, (255, 50, 50))
+            rects.append(win.blit(stun_text, (int(player_car2.x - 30), int(player_car2.y - 40))))
     else:
-        computer_car.draw(win)
+        rects.append(computer_car.draw(win))
     
     # Draw HUD
-    draw_hud(win, player_car, game_info, current_map, player_car2, game_info2, ai_game_info)
+    rects.extend(draw_hud(win, player_car, game_info, current_map, player_car2, game_info2, ai_game_info))
+    return rects
+
+def draw_frame_stats(win, stats, dirty_rects):
+    """Frame-time overlay for comparing full and dirty-rect rendering"""
+    summary = stats.summary()
+    mode = "DIRTY" if dirty_rects else "FULL"
+    sheets = car_sheet_memory()
+    assets = ASSETS.stats()
+    text = (f"{mode} avg {summary['avg_ms']:.1f}ms  p95 {summary['p95_ms']:.1f}ms  max {summary['max_ms']:.1f}ms"
+            f"  car frames {sheets['frames']} ({sheets['bytes'] // 1024}KB)"
+            f"  text hits {TEXT_CACHE.stats()['hit_rate']:.0%}"
+            f"  surface allocs {SURFACE_POOL.allocations}"
+            f"  assets {assets['loaded']}/{assets['registered']} ({assets['load_ms']:.0f}ms)")
+    txt = render_text(HUD_FONT, text, True, (255, 255, 0), (0, 0, 0))
+    return win.blit(txt, (10, 10))
 
 def draw_button(win, rect, text, font, base_color, hover_color, text_color=(0, 0, 0)):
     mx, my = pygame.mouse.get_pos()
@@ -755,7 +728,7 @@ def draw_button(win, rect, text, font, base_color, hover_color, text_color=(0, 0
     pygame.draw.rect(win, color, rect, border_radius=10)
     pygame.draw.rect(win, (255, 255, 255), rect, 3, border_radius=10)
     
-    txt = font.render(text, True, text_color)
+    txt = render_text(font, text, True, text_color)
     tw, th = txt.get_width(), txt.get_height()
     win.blit(txt, (x + (w - tw) // 2, y + (h - th) // 2))
     
@@ -765,8 +738,7 @@ def draw_main_menu(win, images):
     for img, pos in images:
         win.blit(img, pos)
 
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 180))
     win.blit(overlay, (0, 0))
 
     # Title with glow effect
@@ -775,14 +747,14 @@ def draw_main_menu(win, images):
     
     for offset in range(5, 0, -1):
         glow_color = (255, 215, 0, 50 * (6 - offset))
-        glow = TITLE_FONT.render(title_text, True, glow_color)
+        glow = render_text(TITLE_FONT, title_text, True, glow_color)
         win.blit(glow, ((WIDTH - glow.get_width()) // 2 - offset, HEIGHT // 6 - offset))
         win.blit(glow, ((WIDTH - glow.get_width()) // 2 + offset, HEIGHT // 6 + offset))
     
-    title = TITLE_FONT.render(title_text, True, (255, 255, 255))
+    title = render_text(TITLE_FONT, title_text, True, (255, 255, 255))
     win.blit(title, ((WIDTH - title.get_width()) // 2, HEIGHT // 6))
     
-    subtitle = MAIN_FONT.render(subtitle_text, True, (255, 215, 0))
+    subtitle = render_text(MAIN_FONT, subtitle_text, True, (255, 215, 0))
     win.blit(subtitle, ((WIDTH - subtitle.get_width()) // 2, HEIGHT // 6 + 80))
 
     # Menu buttons
@@ -811,12 +783,11 @@ def draw_help_screen(win, images):
     for img, pos in images:
         win.blit(img, pos)
 
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 200))
     win.blit(overlay, (0, 0))
 
     # Title
-    title = MAIN_FONT.render("GAME GUIDE", True, (255, 215, 0))
+    title = render_text(MAIN_FONT, "GAME GUIDE", True, (255, 215, 0))
     win.blit(title, ((WIDTH - title.get_width()) // 2, 30))
 
     # Content area
@@ -826,7 +797,7 @@ def draw_help_screen(win, images):
     section_spacing = 15
     
     # Controls Section - Two columns for P1 and P2
-    section_title = SMALL_FONT.render("🎮 CONTROLS", True, (255, 215, 0))
+    section_title = render_text(SMALL_FONT, "🎮 CONTROLS", True, (255, 215, 0))
     win.blit(section_title, (content_x, content_y))
     content_y += 35
     
@@ -835,7 +806,7 @@ def draw_help_screen(win, images):
     col2_x = WIDTH // 2 + 40
     p1_y = content_y
     
-    p1_title = TINY_FONT.render("Player 1 (WASD):", True, (100, 200, 255))
+    p1_title = render_text(TINY_FONT, "Player 1 (WASD):", True, (100, 200, 255))
     win.blit(p1_title, (col1_x, p1_y))
     p1_y += line_height
     
@@ -847,14 +818,14 @@ def draw_help_screen(win, images):
         "  SPACE - Fire Weapon"
     ]
     for ctrl in p1_controls:
-        txt = TINY_FONT.render(ctrl, True, (255, 255, 255))
+        txt = render_text(TINY_FONT, ctrl, True, (255, 255, 255))
         win.blit(txt, (col1_x, p1_y))
         p1_y += line_height
     
     # Player 2 Controls (Right Column)
     p2_y = content_y
     
-    p2_title = TINY_FONT.render("Player 2 (Arrow Keys):", True, (255, 150, 150))
+    p2_title = render_text(TINY_FONT, "Player 2 (Arrow Keys):", True, (255, 150, 150))
     win.blit(p2_title, (col2_x, p2_y))
     p2_y += line_height
     
@@ -866,7 +837,7 @@ def draw_help_screen(win, images):
         "  [ - Fire Weapon"
     ]
     for ctrl in p2_controls:
-        txt = TINY_FONT.render(ctrl, True, (255, 255, 255))
+        txt = render_text(TINY_FONT, ctrl, True, (255, 255, 255))
         win.blit(txt, (col2_x, p2_y))
         p2_y += line_height
     
@@ -874,14 +845,14 @@ def draw_help_screen(win, images):
     content_y = max(p1_y, p2_y) + 5
     
     # General Controls
-    general = TINY_FONT.render("ESC - Return to Menu    G - Toggle HUD", True, (200, 200, 200))
+    general = render_text(TINY_FONT, "ESC - Return to Menu    G - Toggle HUD", True, (200, 200, 200))
     win.blit(general, (col1_x, content_y))
     content_y += line_height
     
     content_y += section_spacing
     
     # Power-ups Section
-    section_title = SMALL_FONT.render("⚡ POWER-UPS", True, (255, 215, 0))
+    section_title = render_text(SMALL_FONT, "⚡ POWER-UPS", True, (255, 215, 0))
     win.blit(section_title, (content_x, content_y))
     content_y += 35
     
@@ -891,14 +862,14 @@ def draw_help_screen(win, images):
         ("🟢 WEAPON", "- +1 ammo to stun opponents", (0, 255, 0))
     ]
     for name, desc, color in powerups_info:
-        name_txt = TINY_FONT.render(name, True, color)
-        desc_txt = TINY_FONT.render(desc, True, (255, 255, 255))
+        name_txt = render_text(TINY_FONT, name, True, color)
+        desc_txt = render_text(TINY_FONT, desc, True, (255, 255, 255))
         win.blit(name_txt, (content_x + 20, content_y))
         win.blit(desc_txt, (content_x + 200, content_y))
         content_y += line_height
     
     # Note about disabling powerups
-    note_txt = TINY_FONT.render("* Can be disabled in OPTIONS menu", True, (150, 150, 150))
+    note_txt = render_text(TINY_FONT, "* Can be disabled in OPTIONS menu", True, (150, 150, 150))
     win.blit(note_txt, (content_x + 20, content_y))
     content_y += line_height
     
@@ -906,7 +877,7 @@ def draw_help_screen(win, images):
     
     # Mechanics Section (Column 1)
     mechanics_y = content_y
-    section_title = SMALL_FONT.render("🎯 GAME MECHANICS", True, (255, 215, 0))
+    section_title = render_text(SMALL_FONT, "🎯 GAME MECHANICS", True, (255, 215, 0))
     win.blit(section_title, (content_x, mechanics_y))
     mechanics_y += 35
     
@@ -921,13 +892,13 @@ def draw_help_screen(win, images):
         "• Beat your best lap time!"
     ]
     for mech in mechanics:
-        txt = TINY_FONT.render(mech, True, (255, 255, 255))
+        txt = render_text(TINY_FONT, mech, True, (255, 255, 255))
         win.blit(txt, (content_x + 20, mechanics_y))
         mechanics_y += line_height
     
     # Pro Tips Section (Column 2)
     tips_y = content_y
-    section_title = SMALL_FONT.render("💡 PRO TIPS", True, (255, 215, 0))
+    section_title = render_text(SMALL_FONT, "💡 PRO TIPS", True, (255, 215, 0))
     win.blit(section_title, (col2_x, tips_y))
     tips_y += 35
     
@@ -942,7 +913,7 @@ def draw_help_screen(win, images):
         "  = less control"
     ]
     for tip in tips:
-        txt = TINY_FONT.render(tip, True, (200, 255, 200))
+        txt = render_text(TINY_FONT, tip, True, (200, 255, 200))
         win.blit(txt, (col2_x, tips_y))
         tips_y += line_height
     
@@ -962,12 +933,11 @@ def draw_options_menu(win, images, settings):
     for img, pos in images:
         win.blit(img, pos)
 
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 200))
     win.blit(overlay, (0, 0))
 
     # Title
-    title = MAIN_FONT.render("OPTIONS", True, (255, 215, 0))
+    title = render_text(MAIN_FONT, "OPTIONS", True, (255, 215, 0))
     win.blit(title, ((WIDTH - title.get_width()) // 2, 50))
 
     # Options panel
@@ -980,7 +950,7 @@ def draw_options_menu(win, images, settings):
 
     # Option 1: Laps to Win (Text Input)
     opt_y = panel_y + 60
-    label1 = SMALL_FONT.render("Laps to Win:", True, (255, 255, 255))
+    label1 = render_text(SMALL_FONT, "Laps to Win:", True, (255, 255, 255))
     win.blit(label1, (panel_x + 50, opt_y))
     
     btn_w, btn_h = 200, 50
@@ -1002,12 +972,12 @@ def draw_options_menu(win, images, settings):
     
     # Show hint text
     if settings.editing_laps:
-        hint = TINY_FONT.render("Type number, press ENTER", True, (200, 200, 200))
+        hint = render_text(TINY_FONT, "Type number, press ENTER", True, (200, 200, 200))
         win.blit(hint, (btn_x, opt_y + 45))
     
     # Option 2: Race Mode
     opt_y += 90
-    label2 = SMALL_FONT.render("Race Mode:", True, (255, 255, 255))
+    label2 = render_text(SMALL_FONT, "Race Mode:", True, (255, 255, 255))
     win.blit(label2, (panel_x + 50, opt_y))
     
     race_mode_hover = draw_button(win, (btn_x, opt_y - 10, btn_w, btn_h), 
@@ -1019,7 +989,7 @@ def draw_options_menu(win, images, settings):
         mode_desc = "Race continues until all laps complete"
     else:
         mode_desc = "Reset positions after each lap winner"
-    mode_desc_render = TINY_FONT.render(mode_desc, True, (200, 200, 200))
+    mode_desc_render = render_text(TINY_FONT, mode_desc, True, (200, 200, 200))
     win.blit(mode_desc_render, (panel_x + 50, opt_y + 45))
     
     # Option 3: Map Rotation (disabled in Continuous mode)
@@ -1029,9 +999,9 @@ def draw_options_menu(win, images, settings):
     rotation_disabled = settings.race_mode == "continuous"
     
     if rotation_disabled:
-        label3 = SMALL_FONT.render("Map Rotation:", True, (100, 100, 100))  # Gray text
+        label3 = render_text(SMALL_FONT, "Map Rotation:", True, (100, 100, 100))  # Gray text
     else:
-        label3 = SMALL_FONT.render("Map Rotation:", True, (255, 255, 255))
+        label3 = render_text(SMALL_FONT, "Map Rotation:", True, (255, 255, 255))
     win.blit(label3, (panel_x + 50, opt_y))
     
     if rotation_disabled:
@@ -1040,7 +1010,7 @@ def draw_options_menu(win, images, settings):
                                     "Disabled", TINY_FONT,
                                     (50, 50, 60), (50, 50, 60), (100, 100, 100))
         # Show why it's disabled
-        disabled_text = TINY_FONT.render("Only available in Sprint mode", True, (150, 150, 150))
+        disabled_text = render_text(TINY_FONT, "Only available in Sprint mode", True, (150, 150, 150))
         win.blit(disabled_text, (panel_x + 50, opt_y + 45))
     else:
         rotation_hover = draw_button(win, (btn_x, opt_y - 10, btn_w, btn_h), 
@@ -1049,23 +1019,23 @@ def draw_options_menu(win, images, settings):
     
     # Option 4: Powerups
     opt_y += 90
-    label4 = SMALL_FONT.render("Powerups:", True, (255, 255, 255))
+    label4 = render_text(SMALL_FONT, "Powerups:", True, (255, 255, 255))
     win.blit(label4, (panel_x + 50, opt_y))
     
     powerups_hover = draw_button(win, (btn_x, opt_y - 10, btn_w, btn_h), 
                                 settings.get_powerups_text(), SMALL_FONT,
                                 (100, 80, 100), (140, 120, 140), (255, 255, 255))
     
-    powerups_desc = TINY_FONT.render("Enable or disable all powerups", True, (200, 200, 200))
+    powerups_desc = render_text(TINY_FONT, "Enable or disable all powerups", True, (200, 200, 200))
     win.blit(powerups_desc, (panel_x + 50, opt_y + 45))
     
     # Option 5: Show HUD
     opt_y += 90
-    label5 = SMALL_FONT.render("Show HUD:", True, (255, 255, 255))
+    label5 = render_text(SMALL_FONT, "Show HUD:", True, (255, 255, 255))
     win.blit(label5, (panel_x + 50, opt_y))
     
     # Show hint text above button
-    hud_desc = TINY_FONT.render("Press G during race to toggle", True, (200, 200, 200))
+    hud_desc = render_text(TINY_FONT, "Press G during race to toggle", True, (200, 200, 200))
     win.blit(hud_desc, (panel_x + 50, opt_y + 25))
     
     hud_hover = draw_button(win, (btn_x, opt_y - 10, btn_w, btn_h), 
@@ -1093,8 +1063,7 @@ def draw_car_selection(win, images, is_multiplayer=False, stage=1, p1_car=-1, p2
     for img, pos in images:
         win.blit(img, pos)
 
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 180))
     win.blit(overlay, (0, 0))
 
     # Title and prompt
@@ -1110,12 +1079,12 @@ def draw_car_selection(win, images, is_multiplayer=False, stage=1, p1_car=-1, p2
         else:
             prompt_text = "PRESS CONTINUE TO START"
     
-    title = TITLE_FONT.render(title_text, True, (255, 255, 255))
+    title = render_text(TITLE_FONT, title_text, True, (255, 255, 255))
     win.blit(title, ((WIDTH - title.get_width()) // 2, 30))
     
     if prompt_text:
         prompt_color = (255, 215, 0) if stage == 1 else (100, 150, 255) if stage == 2 else (100, 255, 100)
-        prompt = MAIN_FONT.render(prompt_text, True, prompt_color)
+        prompt = render_text(MAIN_FONT, prompt_text, True, prompt_color)
         win.blit(prompt, ((WIDTH - prompt.get_width()) // 2, 140))  # Moved from 100 to 140
 
     # Car cards
@@ -1125,8 +1094,8 @@ def draw_car_selection(win, images, is_multiplayer=False, stage=1, p1_car=-1, p2
     card_y = 280  # Moved down for better spacing
     
     cars = [
-        ("FERRARI", FERRARI_MENU, (255, 50, 50)),
-        ("RED BULL", REDBULL_MENU, (50, 100, 255))
+        ("FERRARI", ASSETS.get("menu:ferrari"), (255, 50, 50)),
+        ("RED BULL", ASSETS.get("menu:redbull"), (50, 100, 255))
     ]
     
     hover_states = []
@@ -1166,15 +1135,15 @@ def draw_car_selection(win, images, is_multiplayer=False, stage=1, p1_car=-1, p2
         if is_multiplayer and (i == p1_car or i == p2_car):
             indicator_y = y + 10
             if i == p1_car:
-                p1_txt = TINY_FONT.render("P1", True, (255, 215, 0))
+                p1_txt = render_text(TINY_FONT, "P1", True, (255, 215, 0))
                 win.blit(p1_txt, (x + 10, indicator_y))
             if i == p2_car:
-                p2_txt = TINY_FONT.render("P2", True, (100, 150, 255))
+                p2_txt = render_text(TINY_FONT, "P2", True, (100, 150, 255))
                 p2_x = x + card_w - 30 if i == p1_car else x + 10
                 win.blit(p2_txt, (p2_x, indicator_y))
         
         # Car name
-        name_txt = MAIN_FONT.render(name, True, color)
+        name_txt = render_text(MAIN_FONT, name, True, color)
         win.blit(name_txt, (x + (card_w - name_txt.get_width()) // 2, y + 20))
         
         # Car image (scaled to fit card with padding)
@@ -1211,7 +1180,7 @@ def draw_car_selection(win, images, is_multiplayer=False, stage=1, p1_car=-1, p2
             "Handling: Excellent"
         ]
         for j, stat in enumerate(stats):
-            stat_txt = TINY_FONT.render(stat, True, (200, 200, 200))
+            stat_txt = render_text(TINY_FONT, stat, True, (200, 200, 200))
             win.blit(stat_txt, (x + 20, stats_y + j * 20))
         
         hover_states.append((is_hover, i))
@@ -1243,11 +1212,10 @@ def draw_difficulty_selection(win, images):
     for img, pos in images:
         win.blit(img, pos)
 
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 180))
     win.blit(overlay, (0, 0))
 
-    title = TITLE_FONT.render("SELECT DIFFICULTY", True, (255, 255, 255))
+    title = render_text(TITLE_FONT, "SELECT DIFFICULTY", True, (255, 255, 255))
     win.blit(title, ((WIDTH - title.get_width()) // 2, 50))
 
     # Difficulty cards
@@ -1277,11 +1245,11 @@ def draw_difficulty_selection(win, images):
         pygame.draw.rect(win, color, card_rect, 4, border_radius=15)
         
         # Difficulty name
-        name_txt = MAIN_FONT.render(name, True, color)
+        name_txt = render_text(MAIN_FONT, name, True, color)
         win.blit(name_txt, (x + 20, y + 25))
         
         # Description
-        desc_txt = SMALL_FONT.render(desc, True, (200, 200, 200))
+        desc_txt = render_text(SMALL_FONT, desc, True, (200, 200, 200))
         win.blit(desc_txt, (x + 20, y + 70))
         
         hover_states.append((is_hover, name.lower()))
@@ -1295,24 +1263,27 @@ def draw_difficulty_selection(win, images):
     
     return hover_states, back_hover
 
-def draw_map_selection(win, images, maps_list):
+def draw_map_selection(win, images, maps_list, page=0):
+    """Draw one page of map cards; returns card hovers, back hover and (prev, next) page hovers"""
     for img, pos in images:
         win.blit(img, pos)
 
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 180))
     win.blit(overlay, (0, 0))
 
-    title = TITLE_FONT.render("SELECT TRACK", True, (255, 255, 255))
+    title = render_text(TITLE_FONT, "SELECT TRACK", True, (255, 255, 255))
     win.blit(title, ((WIDTH - title.get_width()) // 2, 50))
 
-    # Map cards
+    # Map cards, only those on the current page
     card_w, card_h = 350, 200
     spacing = 40
     start_y = 200
+    page_count = map_page_count(maps_list)
+    page = min(page, page_count - 1)
+    visible = maps_list[page * MAP_CARDS_PER_PAGE:(page + 1) * MAP_CARDS_PER_PAGE]
     
     hover_states = []
-    for i, (map_key, map_data) in enumerate(maps_list):
+    for i, (map_key, map_data) in enumerate(visible):
         x = (WIDTH - card_w) // 2
         y = start_y + i * (card_h + spacing)
         
@@ -1326,19 +1297,13 @@ def draw_map_selection(win, images, maps_list):
         pygame.draw.rect(win, (255, 215, 0), card_rect, 4, border_radius=15)
         
         # Map name (centered)
-        name = MAIN_FONT.render(map_data["name"], True, (255, 255, 255))
+        name = render_text(MAIN_FONT, map_data["name"], True, (255, 255, 255))
         name_x = x + (card_w - name.get_width()) // 2
         win.blit(name, (name_x, y + 20))
         
-        # Map preview - composite of all layers (grass + track + border)
-        preview_surface = pygame.Surface((map_data["track"].get_width(), map_data["track"].get_height()))
-        preview_surface.blit(map_data["grass"], (0, 0))
-        preview_surface.blit(map_data["track"], (0, 0))
-        preview_surface.blit(map_data["border"], (0, 0))
-        
-        # Center the preview
-        preview = pygame.transform.scale(preview_surface, (150, 120))
-        preview_x = x + (card_w - 150) // 2
+        # Map preview - cached composite of grass, track and border
+        preview = THUMBNAILS.get(map_data)
+        preview_x = x + (card_w - preview.get_width()) // 2
         win.blit(preview, (preview_x, y + 60))
         
         hover_states.append((is_hover, map_key))
@@ -1350,19 +1315,35 @@ def draw_map_selection(win, images, maps_list):
     back_hover = draw_button(win, (btn_x, btn_y, btn_w, btn_h), "BACK", SMALL_FONT,
                             (100, 50, 50), (150, 80, 80), (255, 255, 255))
     
-    return hover_states, back_hover
+    # Page buttons either side of BACK when there are more maps than fit
+    page_hovers = (False, False)
+    if page_count > 1:
+        page_w = 80
+        prev_hover = page > 0 and draw_button(win, (btn_x - page_w - 20, btn_y, page_w, btn_h), "<", MAIN_FONT,
+                                              (50, 50, 80), (80, 80, 120), (255, 255, 255))
+        next_hover = page < page_count - 1 and draw_button(win, (btn_x + btn_w + 20, btn_y, page_w, btn_h), ">",
+                                                           MAIN_FONT, (50, 50, 80), (80, 80, 120), (255, 255, 255))
+        page_hovers = (prev_hover, next_hover)
+        page_text = render_text(TINY_FONT, f"Page {page + 1} / {page_count}", True, (200, 200, 200))
+        win.blit(page_text, ((WIDTH - page_text.get_width()) // 2, btn_y - 30))
+    
+    return hover_states, back_hover, page_hovers
+
+def map_page_count(maps_list):
+    return max(1, -(-len(maps_list) // MAP_CARDS_PER_PAGE))
 
 def draw_countdown(win, number):
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 160))
     win.blit(overlay, (0, 0))
 
     # Animated countdown
-    scale = 1.0 + 0.2 * math.sin(time.time() * 10)
-    color_intensity = int(200 + 55 * math.sin(time.time() * 8))
+    scale = 1.0 + 0.2 * math.sin(simclock.now() * 10)
+    color_intensity = int(200 + 55 * math.sin(simclock.now() * 8))
     
-    txt = COUNTDOWN_FONT.render(str(number), True, (255, color_intensity, 0))
+    # Cache the digit in white and tint the scaled copy, so the pulse doesn't churn the text cache
+    txt = render_text(COUNTDOWN_FONT, str(number), True, (255, 255, 255))
     scaled = pygame.transform.rotozoom(txt, 0, scale)
+    scaled.fill((255, color_intensity, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
     win.blit(scaled, ((WIDTH - scaled.get_width()) // 2, (HEIGHT - scaled.get_height()) // 2))
 
 def draw_name_entry(win, images, current_name, prompt="ENTER YOUR NAME"):
@@ -1370,8 +1351,7 @@ def draw_name_entry(win, images, current_name, prompt="ENTER YOUR NAME"):
     for img, pos in images:
         win.blit(img, pos)
     
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 180))
     win.blit(overlay, (0, 0))
     
     box_w, box_h = 600, 300
@@ -1382,7 +1362,7 @@ def draw_name_entry(win, images, current_name, prompt="ENTER YOUR NAME"):
     pygame.draw.rect(win, (255, 215, 0), (box_x, box_y, box_w, box_h), 4, border_radius=15)
     
     # Prompt
-    prompt_txt = MAIN_FONT.render(prompt, True, (255, 215, 0))
+    prompt_txt = render_text(MAIN_FONT, prompt, True, (255, 215, 0))
     win.blit(prompt_txt, (box_x + (box_w - prompt_txt.get_width()) // 2, box_y + 40))
     
     # Name input box
@@ -1395,11 +1375,11 @@ def draw_name_entry(win, images, current_name, prompt="ENTER YOUR NAME"):
     
     # Display name with cursor
     display_name = current_name + "_"
-    name_txt = MAIN_FONT.render(display_name, True, (255, 255, 255))
+    name_txt = render_text(MAIN_FONT, display_name, True, (255, 255, 255))
     win.blit(name_txt, (input_x + 20, input_y + 15))
     
     # Instructions
-    inst_txt = TINY_FONT.render("Press ENTER to continue (max 10 characters)", True, (200, 200, 200))
+    inst_txt = render_text(TINY_FONT, "Press ENTER to continue (max 10 characters)", True, (200, 200, 200))
     win.blit(inst_txt, (box_x + (box_w - inst_txt.get_width()) // 2, box_y + 220))
 
 def draw_leaderboard(win, images, mode="single_player", difficulty="easy"):
@@ -1407,12 +1387,11 @@ def draw_leaderboard(win, images, mode="single_player", difficulty="easy"):
     for img, pos in images:
         win.blit(img, pos)
     
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 180))
     win.blit(overlay, (0, 0))
     
     title_text = "SINGLE PLAYER RECORDS" if mode == "single_player" else "MULTIPLAYER RECORDS"
-    title = TITLE_FONT.render(title_text, True, (255, 215, 0))
+    title = render_text(TITLE_FONT, title_text, True, (255, 215, 0))
     win.blit(title, ((WIDTH - title.get_width()) // 2, 30))
     
     # Difficulty tabs for single player
@@ -1444,7 +1423,7 @@ def draw_leaderboard(win, images, mode="single_player", difficulty="easy"):
             pygame.draw.rect(win, border_color, tab_rect, 2, border_radius=8)
             
             # Tab text
-            tab_txt = TINY_FONT.render(diff.upper(), True, (255, 255, 255))
+            tab_txt = render_text(TINY_FONT, diff.upper(), True, (255, 255, 255))
             win.blit(tab_txt, (tab_x + (tab_w - tab_txt.get_width()) // 2, tab_y + 12))
             
             # Check hover
@@ -1463,7 +1442,7 @@ def draw_leaderboard(win, images, mode="single_player", difficulty="easy"):
     line_height = 55  # Increased from 45 to 55 for date line
     
     if not records:
-        no_records = MAIN_FONT.render("No records yet!", True, (200, 200, 200))
+        no_records = render_text(MAIN_FONT, "No records yet!", True, (200, 200, 200))
         win.blit(no_records, ((WIDTH - no_records.get_width()) // 2, HEIGHT // 2))
     else:
         for i, record in enumerate(records):
@@ -1471,48 +1450,48 @@ def draw_leaderboard(win, images, mode="single_player", difficulty="easy"):
             rank_color = (255, 215, 0) if i == 0 else (192, 192, 192) if i == 1 else (205, 127, 50) if i == 2 else (255, 255, 255)
             
             # Rank
-            rank_txt = SMALL_FONT.render(f"#{i+1}", True, rank_color)
+            rank_txt = render_text(SMALL_FONT, f"#{i+1}", True, rank_color)
             win.blit(rank_txt, (100, y))
             
             if mode == "single_player":
                 # Name
-                name_txt = SMALL_FONT.render(record["name"], True, (255, 255, 255))
+                name_txt = render_text(SMALL_FONT, record["name"], True, (255, 255, 255))
                 win.blit(name_txt, (180, y))
                 
                 # Time
-                time_txt = SMALL_FONT.render(f"{record['time']:.2f}s", True, (100, 255, 100))
+                time_txt = render_text(SMALL_FONT, f"{record['time']:.2f}s", True, (100, 255, 100))
                 win.blit(time_txt, (350, y))
                 
                 # Map & Difficulty
-                info_txt = TINY_FONT.render(f"{record['map']} - {record['difficulty'].upper()}", True, (200, 200, 200))
+                info_txt = render_text(TINY_FONT, f"{record['map']} - {record['difficulty'].upper()}", True, (200, 200, 200))
                 win.blit(info_txt, (500, y))
                 
                 # Date (brighter color for better visibility)
-                date_txt = TINY_FONT.render(record.get('date', 'N/A'), True, (220, 220, 220))
+                date_txt = render_text(TINY_FONT, record.get('date', 'N/A'), True, (220, 220, 220))
                 win.blit(date_txt, (180, y + 22))
             else:
                 # Winner name with vs opponent
                 winner_name = record['winner']
                 opponent_name = record.get('loser', 'Unknown')
                 
-                name_txt = SMALL_FONT.render(winner_name, True, (255, 255, 255))
+                name_txt = render_text(SMALL_FONT, winner_name, True, (255, 255, 255))
                 win.blit(name_txt, (180, y))
                 
                 # "vs opponent" in smaller text next to winner
-                vs_txt = TINY_FONT.render(f"vs {opponent_name}", True, (180, 180, 180))
+                vs_txt = render_text(TINY_FONT, f"vs {opponent_name}", True, (180, 180, 180))
                 vs_x = 180 + name_txt.get_width() + 10
                 win.blit(vs_txt, (vs_x, y + 5))
                 
                 # Time
-                time_txt = SMALL_FONT.render(f"{record['time']:.2f}s", True, (100, 255, 100))
+                time_txt = render_text(SMALL_FONT, f"{record['time']:.2f}s", True, (100, 255, 100))
                 win.blit(time_txt, (480, y))
                 
                 # Map
-                map_txt = TINY_FONT.render(record['map'], True, (200, 200, 200))
+                map_txt = render_text(TINY_FONT, record['map'], True, (200, 200, 200))
                 win.blit(map_txt, (630, y))
                 
                 # Date (brighter color for better visibility)
-                date_txt = TINY_FONT.render(record.get('date', 'N/A'), True, (220, 220, 220))
+                date_txt = render_text(TINY_FONT, record.get('date', 'N/A'), True, (220, 220, 220))
                 win.blit(date_txt, (180, y + 22))
     
     # Buttons
@@ -1534,8 +1513,7 @@ def draw_leaderboard(win, images, mode="single_player", difficulty="easy"):
     return toggle_hover, back_hover, difficulty_tabs
 
 def draw_modal(win, message, winner_time=None, loser_time=None, winner_name=None, loser_name=None, best_lap=None, laps_completed=None):
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    overlay = SURFACE_POOL.overlay((WIDTH, HEIGHT), (0, 0, 0, 180))
     win.blit(overlay, (0, 0))
 
     # Adjust box height if showing lap times
@@ -1547,7 +1525,7 @@ def draw_modal(win, message, winner_time=None, loser_time=None, winner_name=None
     pygame.draw.rect(win, (40, 40, 60), (box_x, box_y, box_w, box_h), border_radius=15)
     pygame.draw.rect(win, (255, 215, 0), (box_x, box_y, box_w, box_h), 4, border_radius=15)
 
-    msg = MAIN_FONT.render(message, True, (255, 255, 255))
+    msg = render_text(MAIN_FONT, message, True, (255, 255, 255))
     win.blit(msg, (box_x + (box_w - msg.get_width()) // 2, box_y + 40))
 
     # Display times
@@ -1559,19 +1537,19 @@ def draw_modal(win, message, winner_time=None, loser_time=None, winner_name=None
             # Best Lap Time
             winner_label = winner_name if winner_name else "Winner"
             best_lap_text = f"{winner_label} Best Lap: {best_lap:.2f}s"
-            best_lap_txt = SMALL_FONT.render(best_lap_text, True, (255, 215, 0))
+            best_lap_txt = render_text(SMALL_FONT, best_lap_text, True, (255, 215, 0))
             win.blit(best_lap_txt, (box_x + (box_w - best_lap_txt.get_width()) // 2, time_y))
             
             # Total Time
             time_y += 40
             total_time_text = f"Total Time: {winner_time:.2f}s"
-            total_time_txt = SMALL_FONT.render(total_time_text, True, (100, 255, 100))
+            total_time_txt = render_text(SMALL_FONT, total_time_text, True, (100, 255, 100))
             win.blit(total_time_txt, (box_x + (box_w - total_time_txt.get_width()) // 2, time_y))
         else:
             # Single lap - just show time
             winner_label = winner_name if winner_name else "Winner"
             time_text = f"{winner_label} Time: {winner_time:.2f}s"
-            time_txt = SMALL_FONT.render(time_text, True, (100, 255, 100))
+            time_txt = render_text(SMALL_FONT, time_text, True, (100, 255, 100))
             win.blit(time_txt, (box_x + (box_w - time_txt.get_width()) // 2, time_y))
 
     # Buttons - only RESTART and MENU
@@ -1587,6 +1565,14 @@ def draw_modal(win, message, winner_time=None, loser_time=None, winner_name=None
                             (220, 100, 100), (255, 140, 140), (0, 0, 0))
     return restart_hover, quit_hover
 
+def fire_projectile(car, owner):
+    """Launch a projectile from the front of car, using one ammo"""
+    rad = math.radians(car.angle)
+    front_x = car.x - math.sin(rad) * (car.img.get_height()//2)
+    front_y = car.y - math.cos(rad) * (car.img.get_height()//2)
+    car.ammo -= 1
+    return Projectile(front_x, front_y, car.angle, owner=owner)
+
 def move_player(player_car, player_car2=None):
     keys = pygame.key.get_pressed()
     
@@ -1631,137 +1617,89 @@ def move_player(player_car, player_car2=None):
             # Stunned - can't move
             player_car2.reduce_speed()
 
-def handle_collision(player_car, computer_car, powerups, projectiles, particles, current_map, game_info, player_car2=None, game_info2=None):
+# Broadphase grids, cleared and refilled every tick
+PICKUP_GRID = SpatialHash()
+SHOT_GRID = SpatialHash()
+
+def push_out_of_wall(car, game_map):
+    """Move a car clear of the walls in one step along the distance field's normal"""
+    border_mask = game_map["border_mask"]
+    field = DISTANCE_FIELDS.get(game_map.key, border_mask)
+    outline = CAR_MASKS.outline(car.img, car.angle)
+    depth, nx, ny = field.penetration(outline, car.x, car.y)
+    if depth < 0 and (nx or ny):
+        push = 2 - depth  # Clear the wall edge by a pixel or so
+        car.x += nx * push
+        car.y += ny * push
+        if car.collide(border_mask) is None:
+            return True
+    # Too deep or wedged between walls: back to the last free position
+    car.x, car.y = car.free_x, car.free_y
+    return False
+
+def handle_collision(player_car, computer_car, powerups, projectiles, particles, current_map, game_info, player_car2=None, game_info2=None, ai_game_info=None, settings=None):
+    if settings is None:
+        settings = game_settings
+    fx = simclock.rng().effects
     border_mask = current_map["border_mask"]
     finish_mask = current_map["finish_mask"]
     finish_pos = current_map["finish_pos"]
     
+    # Swept test first so fast cars stop short of the wall instead of passing through it.
+    # The AI follows its waypoints and never collides with walls, so it is not swept.
     # Car vs border - Player 1
-    if player_car.collide(border_mask) != None:
+    poi = player_car.sweep(border_mask)
+    swept = poi is not None
+    if not swept:
         poi = player_car.collide(border_mask)
+    if poi is not None:
         if poi:
             img_w, img_h = player_car.img.get_width(), player_car.img.get_height()
             
             # Spark particles on collision
-            for _ in range(5):
-                particles.append(Particle(
-                    player_car.x + img_w//2, 
-                    player_car.y + img_h//2,
-                    (255, 200, 0),
-                    random.uniform(-3, 3),
-                    random.uniform(-3, 3),
-                    0.5
-                ))
+            particles.emit(player_car.x + img_w//2, player_car.y + img_h//2,
+                           (255, 200, 0), PARTICLE_COUNT_COLLISION, 3, 0.5, fx)
             
             # Push through if boost or vulnerable, otherwise bounce
             if player_car.active_power == PU_BOOST or player_car.vulnerable:
-                offset_x, offset_y = int(player_car.x), int(player_car.y)
-                overlap_x = poi[0] - offset_x
-                overlap_y = poi[1] - offset_y
-
-                center_x, center_y = img_w / 2.0, img_h / 2.0
-
-                vx = center_x - overlap_x
-                vy = center_y - overlap_y
-
-                if vx == 0 and vy == 0:
-                    rad = math.radians(player_car.angle)
-                    vx = -math.sin(rad)
-                    vy = -math.cos(rad)
-
-                mag = math.hypot(vx, vy)
-                if mag != 0:
-                    vx /= mag
-                    vy /= mag
-
-                pushed = False
-                for step in range(6):
-                    push_amount = 1 + step
-                    player_car.x += vx * push_amount
-                    player_car.y += vy * push_amount
-                    if player_car.collide(border_mask) is None:
-                        pushed = True
-                        break
-
-                if not pushed:
-                    player_car.x, player_car.y = player_car.prev_x, player_car.prev_y
-
+                if not swept:  # A swept car already stopped clear of the wall
+                    push_out_of_wall(player_car, current_map)
                 player_car.vel *= 0.5
             else:
                 player_car.bounce()
 
     # Car vs border - Player 2
-    if player_car2 and player_car2.collide(border_mask) != None:
+    poi = player_car2.sweep(border_mask) if player_car2 else None
+    swept = poi is not None
+    if player_car2 and not swept:
         poi = player_car2.collide(border_mask)
+    if poi is not None:
         if poi:
             img_w, img_h = player_car2.img.get_width(), player_car2.img.get_height()
             
             # Spark particles on collision
-            for _ in range(5):
-                particles.append(Particle(
-                    player_car2.x + img_w//2, 
-                    player_car2.y + img_h//2,
-                    (255, 200, 0),
-                    random.uniform(-3, 3),
-                    random.uniform(-3, 3),
-                    0.5
-                ))
+            particles.emit(player_car2.x + img_w//2, player_car2.y + img_h//2,
+                           (255, 200, 0), PARTICLE_COUNT_COLLISION, 3, 0.5, fx)
             
             # Push through if boost or vulnerable, otherwise bounce
             if player_car2.active_power == PU_BOOST or player_car2.vulnerable:
-                offset_x, offset_y = int(player_car2.x), int(player_car2.y)
-                overlap_x = poi[0] - offset_x
-                overlap_y = poi[1] - offset_y
-
-                center_x, center_y = img_w / 2.0, img_h / 2.0
-
-                vx = center_x - overlap_x
-                vy = center_y - overlap_y
-
-                if vx == 0 and vy == 0:
-                    rad = math.radians(player_car2.angle)
-                    vx = -math.sin(rad)
-                    vy = -math.cos(rad)
-
-                mag = math.hypot(vx, vy)
-                if mag != 0:
-                    vx /= mag
-                    vy /= mag
-
-                pushed = False
-                for step in range(6):
-                    push_amount = 1 + step
-                    player_car2.x += vx * push_amount
-                    player_car2.y += vy * push_amount
-                    if player_car2.collide(border_mask) is None:
-                        pushed = True
-                        break
-
-                if not pushed:
-                    player_car2.x, player_car2.y = player_car2.prev_x, player_car2.prev_y
-
+                if not swept:  # A swept car already stopped clear of the wall
+                    push_out_of_wall(player_car2, current_map)
                 player_car2.vel *= 0.5
             else:
                 player_car2.bounce()
 
     # Checkpoint detection - Player 1
-    checkpoint_pos = current_map.get("checkpoint", (0, 0))
-    checkpoint_radius = 80
-    player_dist_to_checkpoint = math.hypot(player_car.x - checkpoint_pos[0], player_car.y - checkpoint_pos[1])
-    if player_dist_to_checkpoint < checkpoint_radius:
-        game_info.passed_halfway = True
+    checkpoints = current_map["checkpoints"]
+    game_info.pass_checkpoints(player_car, checkpoints)
     
     # Checkpoint detection - Player 2
     if player_car2:
-        player2_dist_to_checkpoint = math.hypot(player_car2.x - checkpoint_pos[0], player_car2.y - checkpoint_pos[1])
-        if player2_dist_to_checkpoint < checkpoint_radius:
-            game_info2.passed_halfway = True
+        game_info2.pass_checkpoints(player_car2, checkpoints)
     
     # Checkpoint detection - AI
     if not player_car2 and ai_game_info:
-        ai_dist_to_checkpoint = math.hypot(computer_car.x - checkpoint_pos[0], computer_car.y - checkpoint_pos[1])
-        if ai_dist_to_checkpoint < checkpoint_radius:
-            ai_game_info.passed_halfway = True
+        ai_game_info.pass_checkpoints(computer_car, checkpoints)
 
     # Finish line - AI in single player mode
     if not player_car2:
@@ -1776,31 +1714,32 @@ def handle_collision(player_car, computer_car, powerups, projectiles, particles,
                 ai_game_info.passed_halfway = False
                 
                 # Debug: Print AI state when completing lap
-                print(f"AI completed lap {ai_game_info.laps}, current_point: {computer_car.current_point}, position: ({computer_car.x:.0f}, {computer_car.y:.0f})")
+                if DEBUG_MODE:
+                    print(f"AI completed lap {ai_game_info.laps}, current_point: {computer_car.current_point}, position: ({computer_car.x:.0f}, {computer_car.y:.0f})")
                 
                 # Sprint Mode: AI won this lap
-                if game_settings.race_mode == "sprint":
-                    if ai_game_info.laps >= game_settings.laps_to_win:
+                if settings.race_mode == "sprint":
+                    if ai_game_info.laps >= settings.laps_to_win:
                         return "lose"  # AI won enough laps
                     else:
                         return "ai_lap_win"  # AI won this lap, reset positions
                 
                 # Continuous Mode: Check if AI completed required laps
-                elif ai_game_info.laps >= game_settings.laps_to_win:
+                elif ai_game_info.laps >= settings.laps_to_win:
                     return "lose"  # AI finished all laps first
                 # Check for map rotation per lap (only if not finished)
-                elif game_settings.map_rotation == "per_lap":
+                elif settings.map_rotation == "per_lap":
                     return "change_map"
 
     player_finish_point_collide = player_car.collide(finish_mask, *finish_pos)
     if player_finish_point_collide != None:
         # Check if we're in cooldown period (within 2 seconds of last lap)
-        current_time = time.time()
+        current_time = simclock.now()
         in_cooldown = (current_time - game_info.last_lap_time) < 2.0
         
         if not game_info.passed_halfway and not in_cooldown:
             # Show wrong way warning (but not during cooldown)
-            game_info.wrong_way_warning = time.time()
+            game_info.wrong_way_warning = simclock.now()
         elif game_info.passed_halfway:
             lap_time = game_info.complete_lap()
             if lap_time == 0:  # Cooldown active, don't process
@@ -1810,39 +1749,33 @@ def handle_collision(player_car, computer_car, powerups, projectiles, particles,
                 game_info.passed_halfway = False
                 
                 # Celebration particles
-                for _ in range(20):
-                    particles.append(Particle(
-                        finish_pos[0] + 50,
-                        finish_pos[1] + 50,
-                        random.choice([(255, 215, 0), (255, 100, 100), (100, 255, 100)]),
-                        random.uniform(-5, 5),
-                        random.uniform(-5, 5),
-                        1.5
-                    ))
+                particles.emit(finish_pos[0] + 50, finish_pos[1] + 50,
+                               [(255, 215, 0), (255, 100, 100), (100, 255, 100)],
+                               PARTICLE_COUNT_FINISH, 5, 1.5, fx)
                 
                 # Sprint Mode handling
-                if game_settings.race_mode == "sprint":
+                if settings.race_mode == "sprint":
                     if player_car2:
                         # Multiplayer sprint: Player 1 won this lap
-                        if game_info.laps >= game_settings.laps_to_win:
+                        if game_info.laps >= settings.laps_to_win:
                             return "p1_win"  # Player 1 won the most laps
                         else:
                             return "p1_lap_win"  # Player 1 won this lap, reset positions
                     else:
                         # Single-player sprint: Player won this lap
-                        if game_info.laps >= game_settings.laps_to_win:
+                        if game_info.laps >= settings.laps_to_win:
                             return "win"  # Player won enough laps
                         else:
                             return "player_lap_win"  # Player won this lap, reset positions
                 
                 # Continuous Mode: Check if all laps completed
-                elif game_info.laps >= game_settings.laps_to_win:
+                elif game_info.laps >= settings.laps_to_win:
                     if player_car2:
                         return "p1_win"  # Player 1 finished all laps first
                     else:
                         return "win"  # Player beat AI
                 # Check for map rotation per lap (only if not finished)
-                elif game_settings.map_rotation == "per_lap":
+                elif settings.map_rotation == "per_lap":
                     return "change_map"
     
     # Player 2 finish line
@@ -1850,12 +1783,12 @@ def handle_collision(player_car, computer_car, powerups, projectiles, particles,
         player2_finish_point_collide = player_car2.collide(finish_mask, *finish_pos)
         if player2_finish_point_collide != None:
             # Check if we're in cooldown period (within 2 seconds of last lap)
-            current_time = time.time()
+            current_time = simclock.now()
             in_cooldown = (current_time - game_info2.last_lap_time) < 2.0
             
             if not game_info2.passed_halfway and not in_cooldown:
                 # Show wrong way warning (but not during cooldown)
-                game_info2.wrong_way_warning = time.time()
+                game_info2.wrong_way_warning = simclock.now()
             elif game_info2.passed_halfway:
                 lap_time = game_info2.complete_lap()
                 if lap_time == 0:  # Cooldown active, don't process
@@ -1865,153 +1798,137 @@ def handle_collision(player_car, computer_car, powerups, projectiles, particles,
                     game_info2.passed_halfway = False
                     
                     # Celebration particles
-                    for _ in range(20):
-                        particles.append(Particle(
-                            finish_pos[0] + 50,
-                            finish_pos[1] + 50,
-                            random.choice([(100, 150, 255), (255, 100, 255), (100, 255, 255)]),
-                            random.uniform(-5, 5),
-                            random.uniform(-5, 5),
-                            1.5
-                        ))
+                    particles.emit(finish_pos[0] + 50, finish_pos[1] + 50,
+                                   [(100, 150, 255), (255, 100, 255), (100, 255, 255)],
+                                   PARTICLE_COUNT_FINISH, 5, 1.5, fx)
                     
                     # Sprint Mode: Reset positions after each lap
-                    if game_settings.race_mode == "sprint":
+                    if settings.race_mode == "sprint":
                         # Player 2 won this lap
-                        if game_info2.laps >= game_settings.laps_to_win:
+                        if game_info2.laps >= settings.laps_to_win:
                             return "p2_win"  # Player 2 won the most laps
                         else:
                             return "p2_lap_win"  # Player 2 won this lap, reset positions
                     
                     # Continuous Mode: Check if all laps completed
-                    elif game_info2.laps >= game_settings.laps_to_win:
+                    elif game_info2.laps >= settings.laps_to_win:
                         return "p2_win"  # Player 2 finished all laps first
                     # Check for map rotation per lap (only if not finished)
-                    elif game_settings.map_rotation == "per_lap":
+                    elif settings.map_rotation == "per_lap":
                         return "change_map"
 
-    # Player 1 picks up powerups
-    px, py = int(player_car.x), int(player_car.y)
-    to_remove = []
+    # Power-up pickups go through a spatial hash instead of testing every power-up
+    pickup_grid = PICKUP_GRID
+    pickup_grid.clear()
     for i, pu in enumerate(powerups):
-        pux, puy = pu["pos"]
-        if math.hypot(pux - px, puy - py) < 30:
-            player_car.apply_powerup(pu["type"])
-            to_remove.append(i)
-            # Pickup particles
-            for _ in range(10):
-                particles.append(Particle(
-                    pux, puy,
-                    PU_COLORS.get(pu["type"], (255, 255, 255)),
-                    random.uniform(-4, 4),
-                    random.uniform(-4, 4),
-                    0.8
-                ))
-    
-    # Player 2 picks up powerups
-    if player_car2:
-        p2x, p2y = int(player_car2.x), int(player_car2.y)
-        for i, pu in enumerate(powerups):
-            if i in to_remove:
+        pickup_grid.insert(i, *pu["pos"])
+    taken = set()
+    
+    pickers = [player_car, player_car2] if player_car2 else [player_car]
+    for car in (pickers if powerups else ()):
+        for i in pickup_grid.query_radius(int(car.x), int(car.y), 30):
+            if i in taken:
                 continue
+            pu = powerups[i]
             pux, puy = pu["pos"]
-            if math.hypot(pux - p2x, puy - p2y) < 30:
-                player_car2.apply_powerup(pu["type"])
-                to_remove.append(i)
-                # Pickup particles
-                for _ in range(10):
-                    particles.append(Particle(
-                        pux, puy,
-                        PU_COLORS.get(pu["type"], (255, 255, 255)),
-                        random.uniform(-4, 4),
-                        random.uniform(-4, 4),
-                        0.8
-                    ))
-    
-    for i in sorted(to_remove, reverse=True):
-        powerups.pop(i)
+            car.apply_powerup(pu["type"])
+            taken.add(i)
+            # Pickup particles
+            particles.emit(pux, puy, PU_COLORS.get(pu["type"], (255, 255, 255)),
+                           PARTICLE_COUNT_PICKUP, 4, 0.8, fx)
+    
+    if taken:
+        powerups[:] = [pu for i, pu in enumerate(powerups) if i not in taken]
 
     # Update projectiles
-    for p in list(projectiles):
+    for p in projectiles:
         p.move()
         if p.x < 0 or p.x > WIDTH or p.y < 0 or p.y > HEIGHT:
-            projectiles.remove(p)
+            p.dead = True
             continue
         
-        # Projectile hits AI
-        if p.owner in ["player", "player2"] and not player_car2:
-            if p.rect().colliderect(pygame.Rect(computer_car.x, computer_car.y, 
-                                                computer_car.img.get_width(), 
-                                                computer_car.img.get_height())):
+        # Projectile hits a wall anywhere along this tick's path
+        wall_hit = segment_hit(border_mask, p.prev_x, p.prev_y, p.x, p.y)
+        if wall_hit:
+            p.dead = True
+            particles.emit(wall_hit[0], wall_hit[1], (255, 100, 0), PARTICLE_COUNT_EXPLOSION, 6, 1.0, fx)
+    
+    # Projectile hits: (target car, owners whose shots hit it)
+    if player_car2:
+        targets = [(player_car2, ("player",)), (player_car, ("player2",))]
+    else:
+        targets = [(computer_car, ("player", "player2"))]
+    
+    shot_grid = SHOT_GRID
+    shot_grid.clear()
+    for p in projectiles:
+        if not p.dead:
+            shot_grid.insert(p, p.x - p.RADIUS, p.y - p.RADIUS, p.RADIUS * 2, p.RADIUS * 2)
+    
+    for car, owners in (targets if len(shot_grid) else ()):
+        # Plain coordinates instead of Rects: this runs every tick (truncated as pygame.Rect would)
+        cx, cy = int(car.x), int(car.y)
+        cw, ch = car.img.get_width(), car.img.get_height()
+        for p in shot_grid.query_rect(cx, cy, cw, ch):
+            if p.dead or p.owner not in owners:
+                continue
+            px, py, size = int(p.x - p.RADIUS), int(p.y - p.RADIUS), p.RADIUS * 2
+            if not (px < cx + cw and cx < px + size and py < cy + ch and cy < py + size):
+                continue
+            p.dead = True
+            if car is computer_car:
                 hit_x, hit_y = computer_car.x, computer_car.y
                 computer_car.reset()
                 computer_car.x, computer_car.y = hit_x, hit_y
                 computer_car.prev_x, computer_car.prev_y = hit_x, hit_y
-                computer_car.stunned_until = time.time() + 3.0
-                projectiles.remove(p)
-                # Explosion particles
-                for _ in range(15):
-                    particles.append(Particle(
-                        p.x, p.y,
-                        (255, 100, 0),
-                        random.uniform(-6, 6),
-                        random.uniform(-6, 6),
-                        1.0
-                    ))
-                continue
-        
-        # Projectile hits player 2 (from player 1)
-        if p.owner == "player" and player_car2:
-            if p.rect().colliderect(pygame.Rect(player_car2.x, player_car2.y, 
-                                                player_car2.img.get_width(), 
-                                                player_car2.img.get_height())):
-                # Stun player 2 for 2 seconds
-                player_car2.stun(2.0)
-                projectiles.remove(p)
-                # Explosion particles
-                for _ in range(15):
-                    particles.append(Particle(
-                        p.x, p.y,
-                        (255, 100, 0),
-                        random.uniform(-6, 6),
-                        random.uniform(-6, 6),
-                        1.0
-                    ))
-                continue
-        
-        # Projectile hits player 1 (from player 2)
-        if p.owner == "player2" and player_car2:
-            if p.rect().colliderect(pygame.Rect(player_car.x, player_car.y, 
-                                                player_car.img.get_width(), 
-                                                player_car.img.get_height())):
-                # Stun player 1 for 2 seconds
-                player_car.stun(2.0)
-                projectiles.remove(p)
-                # Explosion particles
-                for _ in range(15):
-                    particles.append(Particle(
-                        p.x, p.y,
-                        (255, 100, 0),
-                        random.uniform(-6, 6),
-                        random.uniform(-6, 6),
-                        1.0
-                    ))
-                continue
+                computer_car.stunned_until = simclock.now() + 3.0
+            else:
+                # Stun the other player for 2 seconds
+                car.stun(2.0)
+            # Explosion particles
+            particles.emit(p.x, p.y, (255, 100, 0), PARTICLE_COUNT_EXPLOSION, 6, 1.0, fx)
+    
+    if any(p.dead for p in projectiles):
+        projectiles[:] = [p for p in projectiles if not p.dead]
     
     return None
 
-def reset_game_state(current_map_key, multiplayer=False):
-    global player_car, player_car2, computer_car, powerups, projectiles, particles, game_info, game_info2, ai_game_info, last_spawn, selected_car_p1, selected_car_p2
+# AI (max_vel, rotation_vel) per difficulty
+# Player max speed is 4, rotation is 4
+AI_DIFFICULTY_SPEEDS = {
+    "easy": (2.5, 2.5),    # Slow but not too slow
+    "medium": (3.2, 3.5),  # Moderate challenge
+    "hard": (4.0, 4.0),    # Same as player
+    "extreme": (5.0, 5.5)  # Faster than player
+}
+
+def get_ai_speed(difficulty, map_key):
+    """AI max speed and rotation speed for a difficulty on a map"""
+    ai_speed, ai_rotation = AI_DIFFICULTY_SPEEDS.get(difficulty, (2.5, 3))
+    
+    # Some maps slow the AI down (the city circuit is tighter)
+    if "ai_speed_scale" in MAPS[map_key]:
+        ai_speed *= MAPS[map_key]["ai_speed_scale"]
+    return ai_speed, ai_rotation
+
+def reset_game_state(current_map_key, multiplayer=False, seed=None):
+    global player_car, player_car2, computer_car, powerups, projectiles, particles, game_info, game_info2, ai_game_info, last_spawn, selected_car_p1, selected_car_p2, race_clock
+    
+    # Every race gets its own tick clock and random streams
+    race_clock = simclock.set_clock(simclock.TickClock(FPS))
+    simclock.set_rng(simclock.RaceRNG(seed))
     
     current_map = MAPS[current_map_key]
     PlayerCar.START_POS = current_map["player_start"]
     ComputerCar.START_POS = current_map["ai_start"]
+    # Build the wall distance field now rather than at the first wall hit
+    DISTANCE_FIELDS.get(current_map.key, current_map["border_mask"])
     
     player_car = PlayerCar(4, 4, player_num=1)
     
     # Set player 1 car image based on selection
-    player_car.img = FERARRI if selected_car_p1 == 0 else BLUE_CAR
-    PlayerCar.IMG = player_car.img
+    PlayerCar.IMG = CAR_ASSETS[selected_car_p1]
+    player_car.img = ASSETS.get(PlayerCar.IMG)
     
     # Set initial angle if specified in map
     if "start_angle" in current_map:
@@ -2022,7 +1939,7 @@ def reset_game_state(current_map_key, multiplayer=False):
         player_car2 = PlayerCar(4, 4, player_num=2)
         
         # Set player 2 car image based on selection
-        player_car2.img = FERARRI if selected_car_p2 == 0 else BLUE_CAR
+        player_car2.img = ASSETS.get(CAR_ASSETS[selected_car_p2])
         
         player_car2.x, player_car2.y = current_map["ai_start"]
         player_car2.START_POS = current_map["ai_start"]
@@ -2035,19 +1952,7 @@ def reset_game_state(current_map_key, multiplayer=False):
         game_info2 = None
         
         # Set AI speed based on difficulty
-        # Player max speed is 4, rotation is 4
-        difficulty_speeds = {
-            "easy": (2.5, 2.5),    # Slow but not too slow
-            "medium": (3.2, 3.5),  # Moderate challenge
-            "hard": (4.0, 4.0),    # Same as player
-            "extreme": (5.0, 5.5)  # Faster than player
-        }
-        
-        ai_speed, ai_rotation = difficulty_speeds.get(game_settings.ai_difficulty, (2.5, 3))
-        
-        # Adjust for city circuit (slightly slower)
-        if current_map_key == "city":
-            ai_speed *= 0.8
+        ai_speed, ai_rotation = get_ai_speed(game_settings.ai_difficulty, current_map_key)
         
         computer_car = ComputerCar(ai_speed, ai_rotation, current_map["path"])
         computer_car.x, computer_car.y = current_map["ai_start"]
@@ -2059,595 +1964,665 @@ def reset_game_state(current_map_key, multiplayer=False):
     game_info = GameInfo()
     # Only spawn powerups if enabled
     if game_settings.powerups_enabled:
-        powerups = spawn_powerups(4, current_map["track_mask"], current_map["border_mask"])
+        cars = [car for car in (player_car, player_car2, computer_car) if car]
+        powerups = spawn_powerups(4, current_map, [(car.x, car.y) for car in cars])
     else:
         powerups = []
     projectiles = []
-    particles = []
-    last_spawn = time.time()
+    particles = ParticleSystem(PARTICLE_CAPACITY, ENABLE_PARTICLES)
+    last_spawn = simclock.now()
+
+# Static layers of the current map flattened into one surface
+_map_background = {"key": None, "surface": None}
+
+def get_map_background(map_key):
+    """Grass, track, finish and border composited once per map in display format"""
+    if _map_background["key"] != map_key:
+        m = MAPS[map_key]
+        background = pygame.Surface((WIDTH, HEIGHT))
+        for img, pos in [(m["grass"], (0,0)), (m["track"], (0,0)), (m["finish"], m["finish_pos"]), (m["border"], (0,0))]:
+            background.blit(img, pos)
+        _map_background["key"] = map_key
+        _map_background["surface"] = background.convert()
+    return _map_background["surface"]
 
 def get_map_images(map_key):
-    m = MAPS[map_key]
-    return [(m["grass"], (0,0)), (m["track"], (0,0)), (m["finish"], m["finish_pos"]), (m["border"], (0,0))]
-
-# Main game loop
-run = True
-clock = pygame.time.Clock()
-
-# Initialize with classic map
-current_map_key = "classic"
-is_multiplayer = False
-player_car2 = None
-game_info2 = None
-ai_game_info = None
-selected_car_p1 = 0  # 0 = Ferrari, 1 = Red Bull
-selected_car_p2 = 1  # Default different car for P2
-reset_game_state(current_map_key, is_multiplayer)
-images = get_map_images(current_map_key)
-
-state = 'menu'
-modal_result = None
-countdown_start = 0
-countdown_number = 0
-selected_difficulty = None
-player_name = ""
-player2_name = ""
-name_entry_stage = 1  # 1 for first player, 2 for second player
-leaderboard_mode = "single_player"
-leaderboard_difficulty = "easy"  # For single player difficulty filter
-car_selection_stage = 1  # For multiplayer: 1 = P1 selecting, 2 = P2 selecting, 3 = both selected
-update_window_title('menu')
-
-# Add help state to window title updater
-def update_window_title_extended(state, current_map=None, lap=None):
-    if state == 'help':
-        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Game Guide")
-    else:
-        update_window_title(state, current_map, lap)
+    return [(get_map_background(map_key), (0,0))]
+
+if __name__ == "__main__":
+    # Main game loop
+    WIN = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("🏎️ Ultimate Racing Championship")
+    run = True
+    clock = pygame.time.Clock()
+    timestep = simclock.FixedTimestep(FPS)
+    race_renderer = DirtyRectRenderer()
+    frame_stats = FrameStats()
+    dirty_rects = DIRTY_RECT_RENDERING
+    show_frame_stats = SHOW_FRAME_STATS
+
+    # Initialize with classic map
+    current_map_key = MENU_MAP
+    is_multiplayer = False
+    player_car2 = None
+    game_info2 = None
+    ai_game_info = None
+    selected_car_p1 = 0  # 0 = Ferrari, 1 = Red Bull
+    selected_car_p2 = 1  # Default different car for P2
+    # Race state is set up when a map is picked, so the menu does not wait for race assets
+    images = get_map_images(current_map_key)
+    first_frame_ms = None
+
+    state = 'menu'
+    modal_result = None
+    countdown_start = 0
+    countdown_number = 0
+    selected_difficulty = None
+    player_name = ""
+    player2_name = ""
+    name_entry_stage = 1  # 1 for first player, 2 for second player
+    leaderboard_mode = "single_player"
+    leaderboard_difficulty = "easy"  # For single player difficulty filter
+    car_selection_stage = 1  # For multiplayer: 1 = P1 selecting, 2 = P2 selecting, 3 = both selected
+    map_page = 0  # Page of map cards shown on map select
+    update_window_title('menu')
+
+    # Add help state to window title updater
+    def update_window_title_extended(state, current_map=None, lap=None):
+        if state == 'help':
+            pygame.display.set_caption("🏎️ Ultimate Racing Championship - Game Guide")
+        else:
+            update_window_title(state, current_map, lap)
 
-while run:
-    clock.tick(FPS)
-    dt = 1.0 / FPS
+    while run:
+        frame_seconds = clock.tick(FPS) / 1000.0
+        dt = 1.0 / FPS
+        
+        # Countdown and race advance in fixed ticks; everything else is paused
+        if state in ('countdown', 'playing'):
+            sim_ticks = timestep.ticks_for(frame_seconds)
+        else:
+            timestep.reset()
+            sim_ticks = 0
+        if state != 'playing':
+            # Menus and overlays cover the whole window
+            race_renderer.invalidate()
+
+        # Menu state
+        if state == 'menu':
+            hover_states = draw_main_menu(WIN, images)
+        
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if hover_states[0]:  # Single Player
+                        is_multiplayer = False
+                        state = 'car_select'
+                        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Car")
+                    elif hover_states[1]:  # Multiplayer
+                        is_multiplayer = True
+                        state = 'car_select'
+                        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Cars")
+                    elif hover_states[2]:  # Leaderboard
+                        state = 'leaderboard'
+                        leaderboard_mode = 'single_player'
+                        leaderboard_difficulty = 'easy'
+                        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Leaderboard")
+                    elif hover_states[3]:  # Options
+                        state = 'options'
+                        update_window_title('options')
+                    elif hover_states[4]:  # Quit
+                        run = False
+                        break
+        
+            pygame.display.update()
+            if first_frame_ms is None:
+                first_frame_ms = (time.perf_counter() - STARTUP_STARTED) * 1000
+                if DEBUG_MODE:
+                    assets = ASSETS.stats()
+                    print(f"Startup to first frame: {first_frame_ms:.0f}ms "
+                          f"({assets['loaded']} of {assets['registered']} assets loaded)")
+                # Load the rest while the player is still in the menus
+                ASSETS.prefetch(PREFETCH_ASSETS)
+            continue
 
-    # Menu state
-    if state == 'menu':
-        hover_states = draw_main_menu(WIN, images)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if hover_states[0]:  # Single Player
-                    is_multiplayer = False
-                    state = 'car_select'
-                    pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Car")
-                elif hover_states[1]:  # Multiplayer
-                    is_multiplayer = True
-                    state = 'car_select'
-                    pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Cars")
-                elif hover_states[2]:  # Leaderboard
-                    state = 'leaderboard'
-                    leaderboard_mode = 'single_player'
-                    leaderboard_difficulty = 'easy'
-                    pygame.display.set_caption("🏎️ Ultimate Racing Championship - Leaderboard")
-                elif hover_states[3]:  # Options
-                    state = 'options'
-                    update_window_title('options')
-                elif hover_states[4]:  # Quit
+        # Help state
+        if state == 'help':
+            back_hover = draw_help_screen(WIN, images)
+        
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
                     run = False
                     break
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if back_hover:
+                        state = 'options'
+                        update_window_title('options')
+        
+            pygame.display.update()
+            continue
+
+        # Options state
+        if state == 'options':
+            laps_hover, race_mode_hover, rotation_hover, powerups_hover, hud_hover, help_hover, back_hover = draw_options_menu(WIN, images, game_settings)
         
-        pygame.display.update()
-        continue
-
-    # Help state
-    if state == 'help':
-        back_hover = draw_help_screen(WIN, images)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if back_hover:
-                    state = 'options'
-                    update_window_title('options')
-        
-        pygame.display.update()
-        continue
-
-    # Options state
-    if state == 'options':
-        laps_hover, race_mode_hover, rotation_hover, powerups_hover, hud_hover, help_hover, back_hover = draw_options_menu(WIN, images, game_settings)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
             
-            # Handle keyboard input for lap number
-            if event.type == pygame.KEYDOWN and game_settings.editing_laps:
-                if event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
-                    game_settings.stop_editing_laps()
-                elif event.key == pygame.K_BACKSPACE:
-                    game_settings.backspace()
-                elif event.key == pygame.K_ESCAPE:
-                    game_settings.editing_laps = False
-                    game_settings.laps_input = str(game_settings.laps_to_win)
-                elif event.unicode.isdigit():
-                    game_settings.add_digit(event.unicode)
+                # Handle keyboard input for lap number
+                if event.type == pygame.KEYDOWN and game_settings.editing_laps:
+                    if event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
+                        game_settings.stop_editing_laps()
+                    elif event.key == pygame.K_BACKSPACE:
+                        game_settings.backspace()
+                    elif event.key == pygame.K_ESCAPE:
+                        game_settings.editing_laps = False
+                        game_settings.laps_input = str(game_settings.laps_to_win)
+                    elif event.unicode.isdigit():
+                        game_settings.add_digit(event.unicode)
             
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if laps_hover:
-                    if not game_settings.editing_laps:
-                        game_settings.start_editing_laps()
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if laps_hover:
+                        if not game_settings.editing_laps:
+                            game_settings.start_editing_laps()
+                        else:
+                            game_settings.stop_editing_laps()
+                    elif race_mode_hover:
+                        game_settings.cycle_race_mode()
+                    elif rotation_hover and game_settings.race_mode != "continuous":
+                        # Only allow clicking if not in continuous mode
+                        game_settings.cycle_rotation()
+                    elif powerups_hover:
+                        game_settings.toggle_powerups()
+                    elif hud_hover:
+                        game_settings.toggle_hud()
+                    elif help_hover:
+                        state = 'help'
+                        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Game Guide")
+                    elif back_hover:
+                        if game_settings.editing_laps:
+                            game_settings.stop_editing_laps()
+                        state = 'menu'
+                        update_window_title('menu')
+        
+            pygame.display.update()
+            continue
+
+        # Car selection state
+        if state == 'car_select':
+            p1_display = selected_car_p1 if car_selection_stage >= 2 else -1
+            p2_display = selected_car_p2 if car_selection_stage >= 3 else -1
+        
+            hover_states, back_hover, continue_hover = draw_car_selection(WIN, images, is_multiplayer, car_selection_stage, p1_display, p2_display)
+        
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if back_hover:
+                        car_selection_stage = 1
+                        state = 'menu'
+                        update_window_title('menu')
+                    elif continue_hover and is_multiplayer and car_selection_stage == 3:
+                        # Both players selected, continue to map selection
+                        car_selection_stage = 1
+                        state = 'map_select'
+                        update_window_title('map_select')
                     else:
-                        game_settings.stop_editing_laps()
-                elif race_mode_hover:
-                    game_settings.cycle_race_mode()
-                elif rotation_hover and game_settings.race_mode != "continuous":
-                    # Only allow clicking if not in continuous mode
-                    game_settings.cycle_rotation()
-                elif powerups_hover:
-                    game_settings.toggle_powerups()
-                elif hud_hover:
-                    game_settings.toggle_hud()
-                elif help_hover:
-                    state = 'help'
-                    pygame.display.set_caption("🏎️ Ultimate Racing Championship - Game Guide")
-                elif back_hover:
-                    if game_settings.editing_laps:
-                        game_settings.stop_editing_laps()
-                    state = 'menu'
-                    update_window_title('menu')
-        
-        pygame.display.update()
-        continue
-
-    # Car selection state
-    if state == 'car_select':
-        p1_display = selected_car_p1 if car_selection_stage >= 2 else -1
-        p2_display = selected_car_p2 if car_selection_stage >= 3 else -1
-        
-        hover_states, back_hover, continue_hover = draw_car_selection(WIN, images, is_multiplayer, car_selection_stage, p1_display, p2_display)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if back_hover:
-                    car_selection_stage = 1
-                    state = 'menu'
-                    update_window_title('menu')
-                elif continue_hover and is_multiplayer and car_selection_stage == 3:
-                    # Both players selected, continue to map selection
-                    car_selection_stage = 1
-                    state = 'map_select'
-                    update_window_title('map_select')
-                else:
-                    for is_hover, car_index in hover_states:
-                        if is_hover:
-                            if is_multiplayer:
-                                if car_selection_stage == 1:
-                                    # P1 selecting
+                        for is_hover, car_index in hover_states:
+                            if is_hover:
+                                if is_multiplayer:
+                                    if car_selection_stage == 1:
+                                        # P1 selecting
+                                        selected_car_p1 = car_index
+                                        car_selection_stage = 2
+                                    elif car_selection_stage == 2:
+                                        # P2 selecting
+                                        selected_car_p2 = car_index
+                                        car_selection_stage = 3
+                                else:
+                                    # Single player
                                     selected_car_p1 = car_index
-                                    car_selection_stage = 2
-                                elif car_selection_stage == 2:
-                                    # P2 selecting
-                                    selected_car_p2 = car_index
-                                    car_selection_stage = 3
-                            else:
-                                # Single player
-                                selected_car_p1 = car_index
-                                selected_car_p2 = 1 - car_index
-                                state = 'difficulty_select'
-                                pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Difficulty")
-                            break
-        
-        pygame.display.update()
-        continue
-
-    # Difficulty selection state
-    if state == 'difficulty_select':
-        hover_states, back_hover = draw_difficulty_selection(WIN, images)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if back_hover:
-                    state = 'car_select'
-                    pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Car")
-                else:
-                    for is_hover, difficulty in hover_states:
-                        if is_hover:
-                            game_settings.ai_difficulty = difficulty
-                            is_multiplayer = False
-                            state = 'map_select'
-                            update_window_title('map_select')
-                            break
-        
-        pygame.display.update()
-        continue
-
-    # Map selection state
-    if state == 'map_select':
-        maps_list = list(MAPS.items())
-        hover_states, back_hover = draw_map_selection(WIN, images, maps_list)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if back_hover:
-                    # Go back to appropriate screen
-                    if is_multiplayer:
+                                    selected_car_p2 = 1 - car_index
+                                    state = 'difficulty_select'
+                                    pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Difficulty")
+                                break
+        
+            pygame.display.update()
+            continue
+
+        # Difficulty selection state
+        if state == 'difficulty_select':
+            hover_states, back_hover = draw_difficulty_selection(WIN, images)
+        
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if back_hover:
                         state = 'car_select'
-                        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Cars")
+                        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Car")
                     else:
-                        state = 'difficulty_select'
-                        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Difficulty")
-                else:
-                    for is_hover, map_key in hover_states:
-                        if is_hover:
-                            current_map_key = map_key
-                            reset_game_state(current_map_key, is_multiplayer)
-                            images = get_map_images(current_map_key)
-                            countdown_start = time.time()
-                            countdown_number = COUNTDOWN_SECONDS
-                            state = 'countdown'
-                            update_window_title('countdown')
-                            break
-        
-        pygame.display.update()
-        continue
-
-    # Leaderboard state
-    if state == 'leaderboard':
-        toggle_hover, back_hover, difficulty_tabs = draw_leaderboard(WIN, images, leaderboard_mode, leaderboard_difficulty)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if toggle_hover:
-                    leaderboard_mode = "multiplayer" if leaderboard_mode == "single_player" else "single_player"
-                elif back_hover:
-                    state = 'menu'
-                    update_window_title('menu')
-                else:
-                    # Check difficulty tab clicks
-                    for is_hover, diff in difficulty_tabs:
-                        if is_hover:
-                            leaderboard_difficulty = diff
-                            break
-        
-        pygame.display.update()
-        continue
-    
-    # Name entry state
-    if state == 'name_entry':
-        # Determine prompt based on stage and mode
-        if is_multiplayer:
-            if name_entry_stage == 1:
-                if modal_result == "p1_win":
-                    prompt = "PLAYER 1 (WINNER) - ENTER NAME"
-                    current_name = player_name
+                        for is_hover, difficulty in hover_states:
+                            if is_hover:
+                                game_settings.ai_difficulty = difficulty
+                                is_multiplayer = False
+                                state = 'map_select'
+                                update_window_title('map_select')
+                                break
+        
+            pygame.display.update()
+            continue
+
+        # Map selection state
+        if state == 'map_select':
+            maps_list = list(MAPS.items())
+            map_page = min(map_page, map_page_count(maps_list) - 1)
+            hover_states, back_hover, (prev_hover, next_hover) = draw_map_selection(WIN, images, maps_list, map_page)
+        
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+                # Mouse wheel and arrow keys flip pages too
+                if event.type == pygame.MOUSEWHEEL:
+                    map_page = max(0, min(map_page - event.y, map_page_count(maps_list) - 1))
+                if event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    step = 1 if event.key == pygame.K_RIGHT else -1
+                    map_page = max(0, min(map_page + step, map_page_count(maps_list) - 1))
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if prev_hover:
+                        map_page -= 1
+                    elif next_hover:
+                        map_page += 1
+                    elif back_hover:
+                        # Go back to appropriate screen
+                        if is_multiplayer:
+                            state = 'car_select'
+                            pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Cars")
+                        else:
+                            state = 'difficulty_select'
+                            pygame.display.set_caption("🏎️ Ultimate Racing Championship - Select Difficulty")
+                    else:
+                        for is_hover, map_key in hover_states:
+                            if is_hover:
+                                current_map_key = map_key
+                                reset_game_state(current_map_key, is_multiplayer)
+                                images = get_map_images(current_map_key)
+                                countdown_start = simclock.now()
+                                countdown_number = COUNTDOWN_SECONDS
+                                state = 'countdown'
+                                update_window_title('countdown')
+                                break
+        
+            pygame.display.update()
+            continue
+
+        # Leaderboard state
+        if state == 'leaderboard':
+            toggle_hover, back_hover, difficulty_tabs = draw_leaderboard(WIN, images, leaderboard_mode, leaderboard_difficulty)
+        
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if toggle_hover:
+                        leaderboard_mode = "multiplayer" if leaderboard_mode == "single_player" else "single_player"
+                    elif back_hover:
+                        state = 'menu'
+                        update_window_title('menu')
+                    else:
+                        # Check difficulty tab clicks
+                        for is_hover, diff in difficulty_tabs:
+                            if is_hover:
+                                leaderboard_difficulty = diff
+                                break
+        
+            pygame.display.update()
+            continue
+    
+        # Name entry state
+        if state == 'name_entry':
+            # Determine prompt based on stage and mode
+            if is_multiplayer:
+                if name_entry_stage == 1:
+                    if modal_result == "p1_win":
+                        prompt = "PLAYER 1 (WINNER) - ENTER NAME"
+                        current_name = player_name
+                    else:
+                        prompt = "PLAYER 2 (WINNER) - ENTER NAME"
+                        current_name = player2_name
                 else:
-                    prompt = "PLAYER 2 (WINNER) - ENTER NAME"
-                    current_name = player2_name
+                    if modal_result == "p1_win":
+                        prompt = "PLAYER 2 - ENTER NAME"
+                        current_name = player2_name
+                    else:
+                        prompt = "PLAYER 1 - ENTER NAME"
+                        current_name = player_name
             else:
-                if modal_result == "p1_win":
-                    prompt = "PLAYER 2 - ENTER NAME"
-                    current_name = player2_name
-                else:
-                    prompt = "PLAYER 1 - ENTER NAME"
-                    current_name = player_name
-        else:
-            prompt = "ENTER YOUR NAME"
-            current_name = player_name
-        
-        draw_name_entry(WIN, images, current_name, prompt)
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    # Check if name is entered
-                    if is_multiplayer and name_entry_stage == 1:
-                        if modal_result == "p1_win":
-                            current_name_check = player_name
-                        else:
-                            current_name_check = player2_name
-                    elif is_multiplayer and name_entry_stage == 2:
-                        if modal_result == "p1_win":
-                            current_name_check = player2_name
+                prompt = "ENTER YOUR NAME"
+                current_name = player_name
+        
+            draw_name_entry(WIN, images, current_name, prompt)
+        
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_RETURN:
+                        # Check if name is entered
+                        if is_multiplayer and name_entry_stage == 1:
+                            if modal_result == "p1_win":
+                                current_name_check = player_name
+                            else:
+                                current_name_check = player2_name
+                        elif is_multiplayer and name_entry_stage == 2:
+                            if modal_result == "p1_win":
+                                current_name_check = player2_name
+                            else:
+                                current_name_check = player_name
                         else:
                             current_name_check = player_name
-                    else:
-                        current_name_check = player_name
                     
-                    if current_name_check:
-                        if is_multiplayer and name_entry_stage == 1:
-                            # Move to second player name entry
-                            name_entry_stage = 2
-                        else:
-                            # Save to leaderboard
-                            if modal_result in ("win", "p1_win"):
-                                winner_time = game_info.get_level_time()
-                                if is_multiplayer:
-                                    add_multiplayer_record(player_name, player2_name, winner_time, MAPS[current_map_key]["name"], game_settings.laps_to_win)
-                                else:
-                                    add_single_player_record(player_name, winner_time, MAPS[current_map_key]["name"], game_settings.ai_difficulty, game_settings.laps_to_win)
-                            elif modal_result == "p2_win":
-                                winner_time = game_info2.get_level_time()
-                                add_multiplayer_record(player2_name, player_name, winner_time, MAPS[current_map_key]["name"], game_settings.laps_to_win)
+                        if current_name_check:
+                            if is_multiplayer and name_entry_stage == 1:
+                                # Move to second player name entry
+                                name_entry_stage = 2
+                            else:
+                                # Save to leaderboard
+                                if modal_result in ("win", "p1_win"):
+                                    winner_time = game_info.get_level_time()
+                                    if is_multiplayer:
+                                        add_multiplayer_record(player_name, player2_name, winner_time, MAPS[current_map_key]["name"], game_settings.laps_to_win)
+                                    else:
+                                        add_single_player_record(player_name, winner_time, MAPS[current_map_key]["name"], game_settings.ai_difficulty, game_settings.laps_to_win)
+                                elif modal_result == "p2_win":
+                                    winner_time = game_info2.get_level_time()
+                                    add_multiplayer_record(player2_name, player_name, winner_time, MAPS[current_map_key]["name"], game_settings.laps_to_win)
                             
-                            player_name = ""
-                            player2_name = ""
-                            name_entry_stage = 1
-                            state = 'menu'
-                            update_window_title('menu')
-                elif event.key == pygame.K_BACKSPACE:
-                    if is_multiplayer and name_entry_stage == 1:
-                        if modal_result == "p1_win":
-                            player_name = player_name[:-1]
-                        else:
-                            player2_name = player2_name[:-1]
-                    elif is_multiplayer and name_entry_stage == 2:
-                        if modal_result == "p1_win":
-                            player2_name = player2_name[:-1]
+                                player_name = ""
+                                player2_name = ""
+                                name_entry_stage = 1
+                                state = 'menu'
+                                update_window_title('menu')
+                    elif event.key == pygame.K_BACKSPACE:
+                        if is_multiplayer and name_entry_stage == 1:
+                            if modal_result == "p1_win":
+                                player_name = player_name[:-1]
+                            else:
+                                player2_name = player2_name[:-1]
+                        elif is_multiplayer and name_entry_stage == 2:
+                            if modal_result == "p1_win":
+                                player2_name = player2_name[:-1]
+                            else:
+                                player_name = player_name[:-1]
                         else:
                             player_name = player_name[:-1]
-                    else:
-                        player_name = player_name[:-1]
-                elif event.key == pygame.K_ESCAPE:
-                    player_name = ""
-                    player2_name = ""
-                    name_entry_stage = 1
-                    state = 'menu'
-                    update_window_title('menu')
-                elif event.unicode.isalnum() or event.unicode == " ":
-                    if is_multiplayer and name_entry_stage == 1:
-                        if modal_result == "p1_win":
-                            if len(player_name) < 10:
-                                player_name += event.unicode.upper()
-                        else:
-                            if len(player2_name) < 10:
-                                player2_name += event.unicode.upper()
-                    elif is_multiplayer and name_entry_stage == 2:
-                        if modal_result == "p1_win":
-                            if len(player2_name) < 10:
-                                player2_name += event.unicode.upper()
+                    elif event.key == pygame.K_ESCAPE:
+                        player_name = ""
+                        player2_name = ""
+                        name_entry_stage = 1
+                        state = 'menu'
+                        update_window_title('menu')
+                    elif event.unicode.isalnum() or event.unicode == " ":
+                        if is_multiplayer and name_entry_stage == 1:
+                            if modal_result == "p1_win":
+                                if len(player_name) < 10:
+                                    player_name += event.unicode.upper()
+                            else:
+                                if len(player2_name) < 10:
+                                    player2_name += event.unicode.upper()
+                        elif is_multiplayer and name_entry_stage == 2:
+                            if modal_result == "p1_win":
+                                if len(player2_name) < 10:
+                                    player2_name += event.unicode.upper()
+                            else:
+                                if len(player_name) < 10:
+                                    player_name += event.unicode.upper()
                         else:
                             if len(player_name) < 10:
                                 player_name += event.unicode.upper()
-                    else:
-                        if len(player_name) < 10:
-                            player_name += event.unicode.upper()
-        
-        pygame.display.update()
-        continue
-
-    # Countdown state
-    if state == 'countdown':
-        draw(WIN, images, player_car, computer_car, game_info, powerups, projectiles, particles, MAPS[current_map_key], player_car2, game_info2, ai_game_info)
-        
-        elapsed = time.time() - countdown_start
-        sec = COUNTDOWN_SECONDS - int(elapsed)
-        if sec <= 0:
-            state = 'playing'
-            game_info.start_level()
-            if game_info2:
-                game_info2.start_level()
-            elif ai_game_info:
-                ai_game_info.start_level()
-            update_window_title('playing', MAPS[current_map_key], game_info.laps)
-        else:
-            draw_countdown(WIN, sec)
-        
-        pygame.display.update()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-        continue
-
-    # Playing state
-    if state == 'playing':
-        player_car.update_power_state()
-        if player_car2:
-            player_car2.update_power_state()
-
-        # Periodic powerup spawn (only if enabled)
-        if game_settings.powerups_enabled and time.time() - last_spawn > SPAWN_INTERVAL:
-            powerups.extend(spawn_powerups(1, MAPS[current_map_key]["track_mask"], 
-                                          MAPS[current_map_key]["border_mask"]))
-            last_spawn = time.time()
-
-        # Update particles
-        particles = [p for p in particles if p.update(dt)]
-
-        draw(WIN, images, player_car, computer_car, game_info, powerups, projectiles, particles, MAPS[current_map_key], player_car2, game_info2, ai_game_info)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.KEYDOWN:
-                # Player 1 shoot (Space)
-                if event.key == pygame.K_SPACE and player_car.ammo > 0:
-                    rad = math.radians(player_car.angle)
-                    front_x = player_car.x - math.sin(rad) * (player_car.img.get_height()//2)
-                    front_y = player_car.y - math.cos(rad) * (player_car.img.get_height()//2)
-                    proj = Projectile(front_x, front_y, player_car.angle, owner="player")
-                    projectiles.append(proj)
-                    player_car.ammo -= 1
-                # Player 2 shoot ([)
-                elif event.key == pygame.K_LEFTBRACKET and player_car2 and player_car2.ammo > 0:
-                    rad = math.radians(player_car2.angle)
-                    front_x = player_car2.x - math.sin(rad) * (player_car2.img.get_height()//2)
-                    front_y = player_car2.y - math.cos(rad) * (player_car2.img.get_height()//2)
-                    proj = Projectile(front_x, front_y, player_car2.angle, owner="player2")
-                    projectiles.append(proj)
-                    player_car2.ammo -= 1
-                elif event.key == pygame.K_g:
-                    game_settings.toggle_hud()
-                elif event.key == pygame.K_ESCAPE:
-                    state = 'menu'
-                    update_window_title('menu')
-
-        move_player(player_car, player_car2)
-        if computer_car:
-            computer_car.move()
-
-        result = handle_collision(player_car, computer_car, powerups, projectiles, particles, 
-                                 MAPS[current_map_key], game_info, player_car2, game_info2)
-        
-        if result in ("p1_lap_win", "p2_lap_win", "player_lap_win", "ai_lap_win"):
-            # Sprint Mode: Someone won this lap
-            # Check if map rotation is enabled
-            if game_settings.map_rotation == "per_lap":
-                # Change to a random map
-                # Preserve lap counts before resetting
-                p1_laps = game_info.laps
-                p2_laps = game_info2.laps if game_info2 else 0
-                ai_laps = ai_game_info.laps if ai_game_info else 0
+        
+            pygame.display.update()
+            continue
+
+        # Countdown state
+        if state == 'countdown':
+            draw(WIN, images, player_car, computer_car, game_info, powerups, projectiles, particles, MAPS[current_map_key], player_car2, game_info2, ai_game_info)
+        
+            race_clock.tick(sim_ticks)
+            elapsed = simclock.now() - countdown_start
+            sec = COUNTDOWN_SECONDS - int(elapsed)
+            if sec <= 0:
+                state = 'playing'
+                game_info.start_level()
+                if game_info2:
+                    game_info2.start_level()
+                elif ai_game_info:
+                    ai_game_info.start_level()
+                update_window_title('playing', MAPS[current_map_key], game_info.laps)
+            else:
+                draw_countdown(WIN, sec)
+        
+            pygame.display.update()
+        
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+            continue
+
+        # Playing state
+        if state == 'playing':
+            frame_stats.begin()
+            if dirty_rects:
+                race_renderer.begin(WIN, get_map_background(current_map_key))
+            race_rects = draw(WIN, images, player_car, computer_car, game_info, powerups, projectiles, particles, MAPS[current_map_key], player_car2, game_info2, ai_game_info, background=not dirty_rects)
+            if show_frame_stats:
+                race_rects.append(draw_frame_stats(WIN, frame_stats, dirty_rects))
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+                if event.type == pygame.KEYDOWN:
+                    # Player 1 shoot (Space)
+                    if event.key == pygame.K_SPACE and player_car.ammo > 0:
+                        projectiles.append(fire_projectile(player_car, "player"))
+                    # Player 2 shoot ([)
+                    elif event.key == pygame.K_LEFTBRACKET and player_car2 and player_car2.ammo > 0:
+                        projectiles.append(fire_projectile(player_car2, "player2"))
+                    elif event.key == pygame.K_g:
+                        game_settings.toggle_hud()
+                    elif event.key == pygame.K_F2:
+                        dirty_rects = not dirty_rects
+                        race_renderer.invalidate()
+                        frame_stats.reset()
+                    elif event.key == pygame.K_F3:
+                        show_frame_stats = not show_frame_stats
+                    elif event.key == pygame.K_ESCAPE:
+                        state = 'menu'
+                        update_window_title('menu')
+
+            # Fixed-step simulation: same inputs give the same race at any frame rate
+            result = None
+            for _ in range(sim_ticks if state == 'playing' else 0):
+                race_clock.tick()
+                player_car.update_power_state()
+                if player_car2:
+                    player_car2.update_power_state()
+
+                # Periodic powerup spawn (only if enabled)
+                if game_settings.powerups_enabled and simclock.now() - last_spawn > SPAWN_INTERVAL:
+                    occupied = [pu["pos"] for pu in powerups] + [(car.x, car.y) for car in
+                                                                 (player_car, player_car2, computer_car) if car]
+                    powerups.extend(spawn_powerups(1, MAPS[current_map_key], occupied))
+                    last_spawn = simclock.now()
+
+                # Update particles
+                particles.update(dt)
+
+                move_player(player_car, player_car2)
+                if computer_car:
+                    computer_car.move()
+
+                result = handle_collision(player_car, computer_car, powerups, projectiles, particles, 
+                                         MAPS[current_map_key], game_info, player_car2, game_info2, ai_game_info)
+                if result:
+                    break
+            
+            if result in ("p1_lap_win", "p2_lap_win", "player_lap_win", "ai_lap_win"):
+                # Sprint Mode: Someone won this lap
+                # Check if map rotation is enabled
+                if game_settings.map_rotation == "per_lap":
+                    # Change to a random map
+                    # Preserve lap counts before resetting
+                    p1_laps = game_info.laps
+                    p2_laps = game_info2.laps if game_info2 else 0
+                    ai_laps = ai_game_info.laps if ai_game_info else 0
+                
+                    available_maps = list(MAPS.keys())
+                    current_map_key = random.choice(available_maps)
+                    reset_game_state(current_map_key, is_multiplayer)
+                    images = get_map_images(current_map_key)
+                
+                    # Restore lap counts after reset
+                    game_info.laps = p1_laps
+                    if game_info2:
+                        game_info2.laps = p2_laps
+                    if ai_game_info:
+                        ai_game_info.laps = ai_laps
+                
+                    countdown_start = simclock.now()
+                    countdown_number = COUNTDOWN_SECONDS
+                    state = 'countdown'
+                    update_window_title('countdown')
+                else:
+                    # Just reset positions on the same map
+                    player_car.x, player_car.y = MAPS[current_map_key]["player_start"]
+                    player_car.angle = MAPS[current_map_key].get("start_angle", 0)
+                    player_car.vel = 0
+                
+                    if player_car2:
+                        player_car2.x, player_car2.y = MAPS[current_map_key]["ai_start"]
+                        player_car2.angle = MAPS[current_map_key].get("start_angle", 0)
+                        player_car2.vel = 0
+                    elif computer_car:
+                        # Reset AI car in single-player
+                        computer_car.x, computer_car.y = MAPS[current_map_key]["ai_start"]
+                        computer_car.angle = MAPS[current_map_key].get("start_angle", 0)
+                        computer_car.vel = computer_car.max_vel
+                        computer_car.current_point = 0  # Reset pathfinding to start
                 
+                    # Brief countdown before next lap
+                    countdown_start = simclock.now()
+                    countdown_number = 2  # 2 second countdown
+                    state = 'countdown'
+                    update_window_title('countdown')
+        
+            elif result == "change_map":
+                # Random map rotation per lap
                 available_maps = list(MAPS.keys())
                 current_map_key = random.choice(available_maps)
                 reset_game_state(current_map_key, is_multiplayer)
                 images = get_map_images(current_map_key)
-                
-                # Restore lap counts after reset
-                game_info.laps = p1_laps
-                if game_info2:
-                    game_info2.laps = p2_laps
-                if ai_game_info:
-                    ai_game_info.laps = ai_laps
-                
-                countdown_start = time.time()
+                countdown_start = simclock.now()
                 countdown_number = COUNTDOWN_SECONDS
                 state = 'countdown'
                 update_window_title('countdown')
-            else:
-                # Just reset positions on the same map
-                player_car.x, player_car.y = MAPS[current_map_key]["player_start"]
-                player_car.angle = MAPS[current_map_key].get("start_angle", 0)
-                player_car.vel = 0
-                
-                if player_car2:
-                    player_car2.x, player_car2.y = MAPS[current_map_key]["ai_start"]
-                    player_car2.angle = MAPS[current_map_key].get("start_angle", 0)
-                    player_car2.vel = 0
-                elif computer_car:
-                    # Reset AI car in single-player
-                    computer_car.x, computer_car.y = MAPS[current_map_key]["ai_start"]
-                    computer_car.angle = MAPS[current_map_key].get("start_angle", 0)
-                    computer_car.vel = computer_car.max_vel
-                    computer_car.current_point = 0  # Reset pathfinding to start
-                
-                # Brief countdown before next lap
-                countdown_start = time.time()
-                countdown_number = 2  # 2 second countdown
-                state = 'countdown'
-                update_window_title('countdown')
         
-        elif result == "change_map":
-            # Random map rotation per lap
-            available_maps = list(MAPS.keys())
-            current_map_key = random.choice(available_maps)
-            reset_game_state(current_map_key, is_multiplayer)
-            images = get_map_images(current_map_key)
-            countdown_start = time.time()
-            countdown_number = COUNTDOWN_SECONDS
-            state = 'countdown'
-            update_window_title('countdown')
-        
-        elif result in ("win", "lose", "p1_win", "p2_win"):
-            # Freeze all timers when race ends
-            game_info.freeze_time()
-            if game_info2:
-                game_info2.freeze_time()
-            if ai_game_info:
-                ai_game_info.freeze_time()
+            elif result in ("win", "lose", "p1_win", "p2_win"):
+                # Freeze all timers when race ends
+                game_info.freeze_time()
+                if game_info2:
+                    game_info2.freeze_time()
+                if ai_game_info:
+                    ai_game_info.freeze_time()
             
-            modal_result = result
-            state = 'modal'
-            update_window_title('modal')
-        
-        pygame.display.update()
-        continue
-
-    # Modal state
-    if state == 'modal':
-        winner_time = None
-        winner_name = None
-        best_lap = None
-        laps_completed = None
-        
-        if modal_result == 'p1_win':
-            msg = "🏆 PLAYER 1 WINS! 🏆"
-            winner_time = game_info.get_level_time()
-            winner_name = "Player 1"
-            best_lap = game_info.best_time
-            laps_completed = game_info.laps
-        elif modal_result == 'p2_win':
-            msg = "🏆 PLAYER 2 WINS! 🏆"
-            winner_time = game_info2.get_level_time()
-            winner_name = "Player 2"
-            best_lap = game_info2.best_time
-            laps_completed = game_info2.laps
-        elif modal_result == 'win':
-            msg = "🏆 YOU WIN! 🏆"
-            winner_time = game_info.get_level_time()
-            winner_name = "Your"
-            best_lap = game_info.best_time
-            laps_completed = game_info.laps
-        else:
-            msg = "💥 YOU LOSE! 💥"
-            winner_time = ai_game_info.get_level_time() if ai_game_info else None
-            winner_name = "AI"
-            best_lap = ai_game_info.best_time if ai_game_info else None
-            laps_completed = ai_game_info.laps if ai_game_info else None
-        
-        draw(WIN, images, player_car, computer_car, game_info, powerups, projectiles, particles, MAPS[current_map_key], player_car2, game_info2, ai_game_info)
-        
-        restart_hover, quit_hover = draw_modal(WIN, msg, winner_time, None, winner_name, None, best_lap, laps_completed)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
-                break
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if restart_hover:
-                    reset_game_state(current_map_key, is_multiplayer)
-                    images = get_map_images(current_map_key)
-                    countdown_start = time.time()
-                    countdown_number = COUNTDOWN_SECONDS
-                    state = 'countdown'
-                    update_window_title('countdown')
-                elif quit_hover:
-                    # If player won, go to name entry for leaderboard
-                    if modal_result in ("win", "p1_win", "p2_win"):
-                        state = 'name_entry'
-                        player_name = ""
-                        player2_name = ""
-                        name_entry_stage = 1
-                        pygame.display.set_caption("🏎️ Ultimate Racing Championship - Enter Name")
-                    else:
-                        state = 'menu'
-                        update_window_title('menu')
+                modal_result = result
+                state = 'modal'
+                update_window_title('modal')
+        
+            if dirty_rects:
+                race_renderer.end(race_rects)
+            else:
+                pygame.display.update()
+            frame_stats.end()
+            continue
+
+        # Modal state
+        if state == 'modal':
+            winner_time = None
+            winner_name = None
+            best_lap = None
+            laps_completed = None
+        
+            if modal_result == 'p1_win':
+                msg = "🏆 PLAYER 1 WINS! 🏆"
+                winner_time = game_info.get_level_time()
+                winner_name = "Player 1"
+                best_lap = game_info.best_time
+                laps_completed = game_info.laps
+            elif modal_result == 'p2_win':
+                msg = "🏆 PLAYER 2 WINS! 🏆"
+                winner_time = game_info2.get_level_time()
+                winner_name = "Player 2"
+                best_lap = game_info2.best_time
+                laps_completed = game_info2.laps
+            elif modal_result == 'win':
+                msg = "🏆 YOU WIN! 🏆"
+                winner_time = game_info.get_level_time()
+                winner_name = "Your"
+                best_lap = game_info.best_time
+                laps_completed = game_info.laps
+            else:
+                msg = "💥 YOU LOSE! 💥"
+                winner_time = ai_game_info.get_level_time() if ai_game_info else None
+                winner_name = "AI"
+                best_lap = ai_game_info.best_time if ai_game_info else None
+                laps_completed = ai_game_info.laps if ai_game_info else None
+        
+            draw(WIN, images, player_car, computer_car, game_info, powerups, projectiles, particles, MAPS[current_map_key], player_car2, game_info2, ai_game_info)
+        
+            restart_hover, quit_hover = draw_modal(WIN, msg, winner_time, None, winner_name, None, best_lap, laps_completed)
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    run = False
+                    break
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if restart_hover:
+                        reset_game_state(current_map_key, is_multiplayer)
+                        images = get_map_images(current_map_key)
+                        countdown_start = simclock.now()
+                        countdown_number = COUNTDOWN_SECONDS
+                        state = 'countdown'
+                        update_window_title('countdown')
+                    elif quit_hover:
+                        # If player won, go to name entry for leaderboard
+                        if modal_result in ("win", "p1_win", "p2_win"):
+                            state = 'name_entry'
+                            player_name = ""
+                            player2_name = ""
+                            name_entry_stage = 1
+                            pygame.display.set_caption("🏎️ Ultimate Racing Championship - Enter Name")
+                        else:
+                            state = 'menu'
+                            update_window_title('menu')
 
-        pygame.display.update()
-        continue
+            pygame.display.update()
+            continue
 
-pygame.quit()
+    flush_leaderboard()
+    if DEBUG_MODE:
+        print("Assets loaded, slowest first:")
+        print("\n".join(ASSETS.report()))
+    pygame.quit()
@@ -0,0 +1,159 @@
+"""
+Baked map cache
+
+Decoding and scaling map PNGs, building masks, the spawn index and the
+wall distance field all happen once per map and are written to
+cache/maps/<map>/ as raw .npy arrays. Later runs memory-map those arrays
+instead of recomputing. Each cache records BAKE_VERSION and a hash of the
+source images and build settings; if either differs the map is rebaked.
+
+Bake every map ahead of time from the repository root:
+
+    python app/map_bake.py
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+import pygame
+
+from distance_field import DISTANCE_CAP, DISTANCE_FIELDS, DistanceField, mask_to_array
+from spawn_index import SPAWN_INDEXES, SpawnIndex
+from utils import scale_image
+
+BAKE_VERSION = 1
+BAKE_DIR = os.path.join("cache", "maps")
+MASK_LAYERS = ("track", "border", "finish")
+
+
+def source_hash(key, layers, spawn_clearance):
+    """Hash of everything a bake depends on: image bytes, scales and settings"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([BAKE_VERSION, key, sorted(layers.items()), spawn_clearance, DISTANCE_CAP]).encode())
+    for name in sorted(layers):
+        with open(layers[name][0], "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _surface_from_pixels(pixels):
+    height, width = pixels.shape[:2]
+    return pygame.image.frombytes(pixels.tobytes(), (width, height), "RGBA")
+
+
+def _mask_from_bits(bits, size):
+    """Rebuild a pygame mask from np.packbits output"""
+    width, height = size
+    values = np.unpackbits(bits)[:width * height]
+    surface = pygame.image.frombuffer(values.tobytes(), (width, height), "P")
+    surface.set_colorkey(0)
+    return pygame.mask.from_surface(surface)
+
+
+def _map_dir(key):
+    return os.path.join(BAKE_DIR, key)
+
+
+def _bake(key, layers, spawn_clearance, digest):
+    """Build everything from the source images and write the cache"""
+    surfaces = {name: scale_image(pygame.image.load(path), scale) for name, (path, scale) in layers.items()}
+    masks = {name: pygame.mask.from_surface(surfaces[name]) for name in MASK_LAYERS if name in surfaces}
+
+    track_mask, border_mask = masks["track"], masks["border"]
+    spawn = SpawnIndex(track_mask, border_mask, spawn_clearance)
+    field = DistanceField(border_mask)
+
+    arrays = {"spawn_pixels": np.asarray(spawn.pixels, dtype=np.int64),
+              "distance": field.distance, "normal_x": field.normal_x, "normal_y": field.normal_y}
+    for name, surface in surfaces.items():
+        width, height = surface.get_size()
+        arrays[name] = np.frombuffer(pygame.image.tobytes(surface, "RGBA"), dtype=np.uint8).reshape(height, width, 4)
+    for name, mask in masks.items():
+        arrays[name + "_mask"] = np.packbits(mask_to_array(mask))
+
+    # Write into a fresh directory and swap it in, so a crash never leaves a half cache
+    final_dir = _map_dir(key)
+    temp_dir = f"{final_dir}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    os.makedirs(temp_dir)
+    for name, array in arrays.items():
+        np.save(os.path.join(temp_dir, name + ".npy"), array)
+    meta = {"version": BAKE_VERSION, "hash": digest, "spawn_width": track_mask.get_size()[0],
+            "masks": {name: list(mask.get_size()) for name, mask in masks.items()}}
+    with open(os.path.join(temp_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    shutil.rmtree(final_dir, ignore_errors=True)
+    try:
+        os.replace(temp_dir, final_dir)
+    except OSError:
+        # Another process (e.g. a race farm worker) baked the same map first
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return surfaces, masks, spawn, field
+
+
+def _load(key, layers, digest):
+    """Read a cache written by _bake; None if it is missing, stale or unreadable"""
+    map_dir = _map_dir(key)
+    try:
+        with open(os.path.join(map_dir, "meta.json")) as f:
+            meta = json.load(f)
+        if meta.get("version") != BAKE_VERSION or meta.get("hash") != digest:
+            return None
+
+        def array(name):
+            return np.load(os.path.join(map_dir, name + ".npy"), mmap_mode="r")
+
+        surfaces = {name: _surface_from_pixels(array(name)) for name in layers}
+        masks = {name: _mask_from_bits(array(name + "_mask"), size) for name, size in meta["masks"].items()}
+        spawn = SpawnIndex.from_pixels(array("spawn_pixels"), meta["spawn_width"])
+        field = DistanceField.from_arrays(array("distance"), array("normal_x"), array("normal_y"))
+        return surfaces, masks, spawn, field
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def load_map(key, layers, spawn_clearance=0, force=False):
+    """Surfaces and masks of a map, from the bake cache when it is current.
+
+    layers maps a layer name ("grass", "track", "border", "finish") to
+    (image path, scale). Returns a dict with every layer surface plus
+    "<layer>_mask" for the track, border and finish. The map's spawn index
+    and distance field are registered in SPAWN_INDEXES and DISTANCE_FIELDS
+    under key, so they are not rebuilt.
+    """
+    digest = source_hash(key, layers, spawn_clearance)
+    loaded = None if force else _load(key, layers, digest)
+    if loaded is None:
+        loaded = _bake(key, layers, spawn_clearance, digest)
+    surfaces, masks, spawn, field = loaded
+
+    SPAWN_INDEXES.register((key, spawn_clearance), spawn)
+    DISTANCE_FIELDS.register(key, field)
+
+    result = dict(surfaces)
+    for name, mask in masks.items():
+        result[name + "_mask"] = mask
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake every map into the on-disk cache")
+    parser.add_argument("--force", action="store_true", help="Rebake even if the cache is current")
+    args = parser.parse_args()
+
+    from map_registry import discover_maps
+    from config import POWERUP_BORDER_CLEARANCE
+
+    for key, pack in discover_maps().items():
+        started = time.perf_counter()
+        load_map(key, pack.layers, POWERUP_BORDER_CLEARANCE, force=args.force)
+        print(f"{key}: {(time.perf_counter() - started) * 1000:.0f}ms -> {_map_dir(key)}")
+
+
+if __name__ == "__main__":
+    main()
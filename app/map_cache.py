@@ -0,0 +1,30 @@
+"""
+Per-map derived data
+
+Spawn indexes and wall distance fields are built once per map. Each kind
+lives in a MapCache keyed by the map's pack key (plus any build settings),
+so entries never depend on which surface or mask object happens to be
+alive. map_bake registers what it loads from the bake cache; anything
+missing is built the first time it is asked for.
+"""
+
+
+class MapCache:
+    """One kind of per-map data, keyed by map"""
+
+    def __init__(self, build):
+        self.build = build
+        self.entries = {}
+        self.builds = 0
+
+    def get(self, key, *args):
+        """Entry for key, built from build(*args) if nothing has been registered"""
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = self.build(*args)
+            self.builds += 1
+        return entry
+
+    def register(self, key, entry):
+        """Store a prebuilt entry, e.g. one loaded by map_bake"""
+        self.entries[key] = entry
@@ -1,5 +1,9 @@
 import pygame
 import math
+import json
+import os
+
+PACK_DIR = os.path.join("maps", "speedway")
 
 def create_speedway_map():
     """Create a speedway/oval track map"""
@@ -78,11 +82,12 @@ def create_speedway_map():
     
     finish_pos = (center_x - 40, center_y - outer_height//2 - 20)
     
-    # Save images
-    pygame.image.save(grass, 'imgs/speedway-grass.png')
-    pygame.image.save(track, 'imgs/speedway-track.png')
-    pygame.image.save(border, 'imgs/speedway-border.png')
-    pygame.image.save(finish, 'imgs/speedway-finish.png')
+    # Save images into a map pack the game picks up on its next start
+    os.makedirs(PACK_DIR, exist_ok=True)
+    pygame.image.save(grass, os.path.join(PACK_DIR, 'speedway-grass.png'))
+    pygame.image.save(track, os.path.join(PACK_DIR, 'speedway-track.png'))
+    pygame.image.save(border, os.path.join(PACK_DIR, 'speedway-border.png'))
+    pygame.image.save(finish, os.path.join(PACK_DIR, 'speedway-finish.png'))
     
     # Generate AI path points around the oval
     path = []
@@ -96,7 +101,27 @@ def create_speedway_map():
         y = center_y + math.sin(angle) * mid_height
         path.append((int(x), int(y)))
     
-    print(f"Speedway map created!")
+    player_start = (center_x - 30, center_y - outer_height//2 + 50)
+    ai_start = (center_x + 30, center_y - outer_height//2 + 50)
+    manifest = {
+        "name": "Speedway Oval",
+        "order": 2,
+        "layers": {
+            "grass": {"image": "speedway-grass.png"},
+            "track": {"image": "speedway-track.png"},
+            "border": {"image": "speedway-border.png"},
+            "finish": {"image": "speedway-finish.png"}
+        },
+        "finish_pos": finish_pos,
+        "player_start": player_start,
+        "ai_start": ai_start,
+        "checkpoints": [path[num_points // 2]],  # Far side of the oval
+        "path": path
+    }
+    with open(os.path.join(PACK_DIR, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    
+    print(f"Speedway map created in {PACK_DIR}!")
     print(f"Finish position: {finish_pos}")
     print(f"Path points: {path}")
     print(f"Player start: ({center_x - 30}, {center_y - outer_height//2 + 50})")
@@ -105,8 +130,8 @@ def create_speedway_map():
     return {
         "finish_pos": finish_pos,
         "path": path,
-        "player_start": (center_x - 30, center_y - outer_height//2 + 50),
-        "ai_start": (center_x + 30, center_y - outer_height//2 + 50)
+        "player_start": player_start,
+        "ai_start": ai_start
     }
 
 if __name__ == "__main__":
@@ -0,0 +1,134 @@
+"""
+Map packs
+
+Every directory under maps/ with a manifest.json is a map. The manifest
+names the pack's images and holds the race layout:
+
+    {
+      "name": "City Circuit",
+      "order": 1,
+      "layers": {
+        "grass": {"image": "city-grass.png", "scale": 1},
+        "track": {"image": "city-track.png"},
+        "border": {"image": "city-border.png"},
+        "finish": {"image": "city-finish.png"}
+      },
+      "finish_pos": [510, 60],
+      "player_start": [430, 85],
+      "ai_start": [430, 55],
+      "start_angle": 90,
+      "ai_speed_scale": 0.8,
+      "checkpoints": [[662, 575]],
+      "path": [[104, 91], [102, 279], [224, 297]]
+    }
+
+Image paths are relative to the pack directory and "scale" defaults to 1.
+"order" sorts the map select screen, "start_angle" and "ai_speed_scale"
+are optional, "checkpoints" must be driven through in order before a lap
+counts and "path" is the AI's waypoints.
+
+discover_maps() only reads manifests. A pack's images are loaded, through
+the bake cache, the first time one of its layers is used.
+"""
+import json
+import os
+
+from assets import ASSETS
+from map_bake import load_map
+
+MAPS_DIR = "maps"
+MANIFEST_FILE = "manifest.json"
+LAYER_NAMES = ("grass", "track", "border", "finish")
+REQUIRED_KEYS = ("name", "layers", "finish_pos", "player_start", "ai_start", "checkpoints", "path")
+OPTIONAL_KEYS = ("start_angle", "ai_speed_scale")
+
+
+def _point(value):
+    x, y = value
+    return (x, y)
+
+
+class MapPack(dict):
+    """A map's settings from its manifest; surfaces and masks load on first access.
+
+    Reading a layer such as map["track"] or map["border_mask"] loads the
+    pack's images through the shared asset manager, so listing maps only
+    costs the manifest reads.
+    """
+
+    def __init__(self, key, directory, manifest):
+        super().__init__(
+            name=manifest["name"],
+            finish_pos=_point(manifest["finish_pos"]),
+            player_start=_point(manifest["player_start"]),
+            ai_start=_point(manifest["ai_start"]),
+            checkpoints=[_point(p) for p in manifest["checkpoints"]],
+            path=[_point(p) for p in manifest["path"]],
+        )
+        for name in OPTIONAL_KEYS:
+            if name in manifest:
+                self[name] = manifest[name]
+        self.key = key
+        self.directory = directory
+        self.order = manifest.get("order", 0)
+        self.asset = "map:" + key
+        # (image path, scale) per layer, as load_map takes them
+        self.layers = {name: (os.path.join(directory, layer["image"]), layer.get("scale", 1))
+                       for name, layer in manifest["layers"].items()}
+
+    def __missing__(self, key):
+        layers = ASSETS.get(self.asset)
+        if key not in layers:
+            raise KeyError(key)
+        self.update(layers)
+        return layers[key]
+
+    @property
+    def loaded(self):
+        return ASSETS.loaded(self.asset)
+
+
+def read_manifest(directory):
+    """MapPack for one pack directory; ValueError if the manifest or an image is unusable"""
+    key = os.path.basename(os.path.normpath(directory))
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE), "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"cannot read {MANIFEST_FILE}: {e}")
+
+    missing = [name for name in REQUIRED_KEYS if name not in manifest]
+    missing += [name for name in LAYER_NAMES if name not in manifest.get("layers", {})]
+    if missing:
+        raise ValueError("manifest is missing " + ", ".join(missing))
+    try:
+        pack = MapPack(key, directory, manifest)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"bad manifest value: {e!r}")
+    for path, _ in pack.layers.values():
+        if not os.path.exists(path):
+            raise ValueError(f"missing image {path}")
+    return pack
+
+
+def discover_maps(root=MAPS_DIR, spawn_clearance=0):
+    """Every usable pack under root, keyed by directory name, in map select order.
+
+    Each pack's images are registered with ASSETS as "map:<key>". Broken
+    packs are reported and left out rather than stopping the game.
+    """
+    packs = []
+    names = sorted(os.listdir(root)) if os.path.isdir(root) else []
+    for name in names:
+        directory = os.path.join(root, name)
+        if not os.path.isfile(os.path.join(directory, MANIFEST_FILE)):
+            continue
+        try:
+            packs.append(read_manifest(directory))
+        except ValueError as e:
+            print(f"Skipping map pack {directory}: {e}")
+
+    packs.sort(key=lambda pack: (pack.order, pack.key))
+    for pack in packs:
+        ASSETS.register(pack.asset, lambda pack=pack: load_map(pack.key, pack.layers, spawn_clearance))
+    return {pack.key: pack for pack in packs}
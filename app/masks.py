@@ -0,0 +1,116 @@
+import math
+
+import numpy as np
+import pygame
+
+MASK_ANGLE_STEP = 2  # Degrees per cached rotation bucket
+SWEEP_STEP = 3       # Pixels between car positions tested by sweep_mask
+SWEEP_MAX_DISTANCE = 48  # Furthest back a car is swept from; older free positions are stale
+
+
+class RotatedMaskCache:
+    """Collision masks for rotated car images, cached per angle bucket"""
+
+    def __init__(self, angle_step=MASK_ANGLE_STEP):
+        self.angle_step = angle_step
+        self.buckets = int(round(360 / angle_step))
+        self._masks = {}
+        self._outlines = {}
+        self.hits = 0
+        self.misses = 0
+
+    def bucket(self, angle):
+        """Map an angle in degrees to its bucket index"""
+        return int(round(angle / self.angle_step)) % self.buckets
+
+    def get(self, image, angle):
+        """Return (mask, dx, dy) for image rotated by angle.
+
+        dx, dy is the offset of the rotated mask from the car's unrotated
+        top-left corner, matching where blit_rotate_center draws the sprite.
+        """
+        key = (image, self.bucket(angle))
+        entry = self._masks.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        rotated = pygame.transform.rotate(image, key[1] * self.angle_step)
+        rect = rotated.get_rect(center=image.get_rect().center)
+        entry = (pygame.mask.from_surface(rotated), rect.x, rect.y)
+        self._masks[key] = entry
+        return entry
+
+    def outline(self, image, angle):
+        """Perimeter points of the rotated mask as an (N, 2) array, relative to the car's top-left corner"""
+        key = (image, self.bucket(angle))
+        points = self._outlines.get(key)
+        if points is None:
+            mask, dx, dy = self.get(image, angle)
+            points = np.array(mask.outline(), dtype=np.int64).reshape(-1, 2) + (dx, dy)
+            self._outlines[key] = points
+        return points
+
+    def build(self, image):
+        """Eagerly build every bucket for an image"""
+        for i in range(self.buckets):
+            self.get(image, i * self.angle_step)
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self._masks),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate(), 4),
+        }
+
+    def clear(self):
+        self._masks.clear()
+        self._outlines.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+CAR_MASKS = RotatedMaskCache()
+
+
+def segment_hit(mask, x0, y0, x1, y1):
+    """First set pixel of mask on the segment from (x0, y0) to (x1, y1), or None.
+
+    Visits every pixel the segment crosses (DDA), so fast movers cannot skip
+    over thin walls. The start point itself is not tested.
+    """
+    width, height = mask.get_size()
+    dx, dy = x1 - x0, y1 - y0
+    steps = int(max(abs(dx), abs(dy))) + 1
+    for i in range(1, steps + 1):
+        x = int(x0 + dx * i / steps)
+        y = int(y0 + dy * i / steps)
+        if 0 <= x < width and 0 <= y < height and mask.get_at((x, y)):
+            return x, y
+    return None
+
+
+def sweep_mask(mask, car_mask, x0, y0, x1, y1, step=SWEEP_STEP):
+    """Last clear position before car_mask first overlaps mask between (x0, y0) and (x1, y1).
+
+    Positions are car mask offsets like Mask.overlap takes, and the start
+    is assumed clear. Tests points at most `step` pixels apart; returns
+    ((x, y), contact point) for the first overlap, or None if the whole
+    path is clear.
+    """
+    dx, dy = x1 - x0, y1 - y0
+    steps = max(1, int(math.ceil(math.hypot(dx, dy) / step)))
+    free = (x0, y0)
+    for i in range(1, steps + 1):
+        x, y = x0 + dx * i / steps, y0 + dy * i / steps
+        poi = mask.overlap(car_mask, (int(x), int(y)))
+        if poi is not None:
+            return free, poi
+        free = (x, y)
+    return None
@@ -0,0 +1,181 @@
+"""
+Merge leaderboard.json files from several cabinets
+
+Streams every input file record by record (never loading a whole file),
+drops duplicate records and keeps the top N races of every board, where a
+board is one (mode, map, difficulty). Memory stays bounded by N per board
+however many records the inputs hold. The output has the same layout as
+leaderboard.json, so the game can load it directly. Run from the
+repository root:
+
+    python app/merge_leaderboards.py cabinet1.json cabinet2.json --top 10 --output leaderboard.json
+"""
+import argparse
+import heapq
+import json
+import os
+import time
+
+MODES = ("single_player", "multiplayer")
+CHUNK_SIZE = 64 * 1024
+
+
+class _Reader:
+    """Incremental JSON reader over a file, refilled in chunks"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what has been consumed so the buffer stays chunk sized
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, or "" at end of file"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} in {self.f.name}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut by the chunk boundary ("1500." or "12") may continue in the next chunk
+            if (end == len(self.buf) or self.buf[end] not in ",]}: \t\r\n") and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_records(path, mode):
+    """Yield the records of one mode from a leaderboard file, one at a time"""
+    with open(path, "r") as f:
+        reader = _Reader(f)
+        reader.expect("{")
+        while reader.peek() not in ("}", ""):
+            if reader.peek() == ",":
+                reader.pos += 1
+                continue
+            key = reader.value()
+            reader.expect(":")
+            if reader.peek() != "[":
+                reader.value()
+                continue
+            reader.expect("[")
+            while reader.peek() != "]":
+                if reader.peek() == ",":
+                    reader.pos += 1
+                    continue
+                record = reader.value()
+                if key == mode:
+                    yield record
+            reader.expect("]")
+
+
+def record_key(record):
+    """Identity of a race; the same race copied between cabinets has the same key"""
+    return (record.get("name", record.get("winner")), record.get("loser"), record.get("time"),
+            record.get("map"), record.get("difficulty"), record.get("laps"), record.get("date"))
+
+
+class Board:
+    """Top N fastest unique records, held in a max-heap on time"""
+
+    def __init__(self, size):
+        self.size = size
+        self.heap = []   # (-time, seq, key, record): the slowest kept race is on top
+        self.keys = set()
+
+    def offer(self, record, seq):
+        key = record_key(record)
+        if key in self.keys:
+            return
+        entry = (-record["time"], seq, key, record)
+        if len(self.heap) < self.size:
+            heapq.heappush(self.heap, entry)
+            self.keys.add(key)
+        elif record["time"] < -self.heap[0][0]:
+            evicted = heapq.heapreplace(self.heap, entry)
+            self.keys.discard(evicted[2])
+            self.keys.add(key)
+
+    def records(self):
+        return [entry[3] for entry in sorted(self.heap, key=lambda e: (-e[0], e[1]))]
+
+
+def merge(paths, top=10):
+    """Merge leaderboard files into {mode: records} with the top N per board.
+
+    Each file's records are k-way merged by time (the game writes them
+    sorted), then offered to their board's bounded heap, which also keeps
+    the result correct for unsorted inputs.
+    """
+    merged = {}
+    stats = {"files": len(paths), "records": 0}
+    for mode in MODES:
+        boards = {}
+        streams = [iter_records(path, mode) for path in paths]
+        for seq, record in enumerate(heapq.merge(*streams, key=lambda r: r["time"])):
+            board_key = (record.get("map"), record.get("difficulty"))
+            board = boards.get(board_key)
+            if board is None:
+                board = boards[board_key] = Board(top)
+            board.offer(record, seq)
+            stats["records"] += 1
+
+        records = [r for board in boards.values() for r in board.records()]
+        records.sort(key=lambda r: r["time"])
+        merged[mode] = records
+        stats[mode + "_boards"] = len(boards)
+    return merged, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge leaderboard.json files into per-board top N lists")
+    parser.add_argument("inputs", nargs="+", help="leaderboard.json files to merge")
+    parser.add_argument("--top", type=int, default=10, help="Records kept per mode, map and difficulty")
+    parser.add_argument("--output", default="leaderboard_merged.json")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    merged, stats = merge(args.inputs, args.top)
+
+    temp_file = args.output + ".tmp"
+    with open(temp_file, "w") as f:
+        json.dump(merged, f, indent=2)
+    os.replace(temp_file, args.output)
+
+    kept = sum(len(records) for records in merged.values())
+    print(f"Merged {stats['records']} records from {stats['files']} files into {kept} "
+          f"({stats['single_player_boards']} single player, {stats['multiplayer_boards']} multiplayer boards) "
+          f"in {time.perf_counter() - started:.2f}s -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import numpy as np
+import pygame
+
+from config import PARTICLE_CAPACITY
+
+
+class ParticleSystem:
+    """Fixed-capacity particle pool stored as NumPy arrays.
+
+    Every slot is preallocated, so emitting reuses dead slots and a long
+    burst of sparks never grows a list or creates objects. update() moves
+    and ages every particle in one vectorized step.
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, enabled=True):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vel_x = np.zeros(capacity, dtype=np.float32)
+        self.vel_y = np.zeros(capacity, dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._step = np.zeros(capacity, dtype=np.float32)
+        self.dropped = 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def emit(self, x, y, colors, count, spread, lifetime, rng):
+        """Spawn count particles at (x, y) flying in random directions.
+
+        colors is one RGB tuple or a list to pick from per particle; speeds
+        are uniform in [-spread, spread] on each axis, drawn from rng.
+        """
+        if not self.enabled or count <= 0:
+            return
+        free = np.flatnonzero(~self.alive)
+        if len(free) < count:
+            self.dropped += count - len(free)
+        pick = isinstance(colors, list)
+        for slot in free[:count]:
+            color = rng.choice(colors) if pick else colors
+            self.vel_x[slot] = rng.uniform(-spread, spread)
+            self.vel_y[slot] = rng.uniform(-spread, spread)
+            self.size[slot] = rng.randint(2, 5)
+            self.x[slot] = x
+            self.y[slot] = y
+            self.color[slot] = color[:3]
+            self.age[slot] = 0
+            self.lifetime[slot] = lifetime
+            self.alive[slot] = True
+
+    def update(self, dt):
+        """Move and age every particle; expired slots become free"""
+        np.multiply(self.vel_x, dt * 60, out=self._step)
+        self.x += self._step
+        np.multiply(self.vel_y, dt * 60, out=self._step)
+        self.y += self._step
+        self.age += dt
+        self.alive &= self.age < self.lifetime
+
+    def clear(self):
+        self.alive[:] = False
+
+    def draw(self, win):
+        """Draw live particles shrinking with age; returns their rects"""
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return []
+        fade = 1 - self.age[live] / self.lifetime[live]
+        sizes = np.maximum(1, (self.size[live] * fade).astype(np.int32)).tolist()
+        xs = self.x[live].astype(np.int32).tolist()
+        ys = self.y[live].astype(np.int32).tolist()
+        colors = self.color[live].tolist()
+        circle = pygame.draw.circle
+        return [circle(win, colors[i], (xs[i], ys[i]), sizes[i]) for i in range(len(live))]
@@ -0,0 +1,136 @@
+"""
+Race farm: batch AI-vs-AI simulations on a process pool
+
+Spreads race configurations (map, AI difficulty, laps, race mode, seed)
+over every CPU core and streams one result per race to a JSONL or CSV file
+as races finish. Run from the repository root:
+
+    python app/race_farm.py --maps classic city --difficulties easy hard \\
+        --laps 1 3 --races 250 --output results.jsonl
+"""
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import time
+
+DIFFICULTIES = ["easy", "medium", "hard", "extreme"]
+RACE_MODES = ["continuous", "sprint"]
+CSV_FIELDS = ["map", "difficulty", "laps", "race_mode", "seed", "winner", "ticks",
+              "race_time", "lap_times", "best_lap"]
+
+_run_race = None
+
+
+def _init_worker():
+    """Load assets and map masks once per worker process"""
+    global _run_race
+    import headless
+    _run_race = headless.run_race
+
+
+def _run_config(config):
+    return _run_race(config["map"], config["difficulty"], config["laps"],
+                     config["race_mode"], config.get("powerups_enabled", True), config["seed"])
+
+
+def build_configs(maps, difficulties, laps, race_modes, races, seed_start=0, powerups_enabled=True):
+    """Every combination of the given settings, each raced with `races` seeds"""
+    configs = []
+    for map_key, difficulty, lap_count, race_mode in itertools.product(maps, difficulties, laps, race_modes):
+        for seed in range(seed_start, seed_start + races):
+            configs.append({"map": map_key, "difficulty": difficulty, "laps": lap_count,
+                            "race_mode": race_mode, "seed": seed,
+                            "powerups_enabled": powerups_enabled})
+    return configs
+
+
+class ResultWriter:
+    """Appends race results to a .jsonl or .csv file as they arrive"""
+
+    def __init__(self, path):
+        self.path = path
+        self.is_csv = path.lower().endswith(".csv")
+        self.file = open(path, "w", newline="")
+        self.csv = None
+        if self.is_csv:
+            self.csv = csv.DictWriter(self.file, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            self.csv.writeheader()
+
+    def write(self, result):
+        if self.is_csv:
+            row = dict(result)
+            row["lap_times"] = json.dumps(result["lap_times"])
+            row["best_lap"] = json.dumps(result["best_lap"])
+            self.csv.writerow(row)
+        else:
+            self.file.write(json.dumps(result) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def run_farm(configs, output, workers=None, progress=None):
+    """Race every config on a process pool, streaming results to output.
+
+    Returns aggregate stats: races, ticks, seconds, races/sec and ticks/sec.
+    """
+    workers = workers or os.cpu_count() or 1
+    # Small chunks keep results streaming; large enough to amortise IPC
+    chunksize = max(1, min(16, len(configs) // (workers * 8)))
+
+    writer = ResultWriter(output)
+    races = ticks = 0
+    started = time.perf_counter()
+    try:
+        with multiprocessing.Pool(workers, initializer=_init_worker) as pool:
+            for result in pool.imap_unordered(_run_config, configs, chunksize):
+                writer.write(result)
+                races += 1
+                ticks += result["ticks"]
+                if progress and races % progress == 0:
+                    elapsed = time.perf_counter() - started
+                    print(f"{races}/{len(configs)} races, {races / elapsed:.1f} races/s")
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "races": races,
+        "ticks": ticks,
+        "seconds": round(elapsed, 2),
+        "workers": workers,
+        "races_per_sec": round(races / elapsed, 2) if elapsed else 0.0,
+        "ticks_per_sec": round(ticks / elapsed) if elapsed else 0,
+    }
+
+
+def main():
+    # Only the manifests are read here; workers load the maps themselves
+    from map_registry import discover_maps
+
+    parser = argparse.ArgumentParser(description="Run many headless races on all CPU cores")
+    parser.add_argument("--maps", nargs="+", default=["classic"], choices=list(discover_maps()))
+    parser.add_argument("--difficulties", nargs="+", default=DIFFICULTIES, choices=DIFFICULTIES)
+    parser.add_argument("--laps", nargs="+", type=int, default=[1])
+    parser.add_argument("--modes", nargs="+", default=["continuous"], choices=RACE_MODES)
+    parser.add_argument("--races", type=int, default=100, help="Seeds per combination")
+    parser.add_argument("--seed-start", type=int, default=0)
+    parser.add_argument("--no-powerups", action="store_true")
+    parser.add_argument("--workers", type=int, default=None, help="Defaults to every core")
+    parser.add_argument("--output", default="race_results.jsonl", help=".jsonl or .csv")
+    parser.add_argument("--progress", type=int, default=100, help="Report every N races (0 = off)")
+    args = parser.parse_args()
+
+    configs = build_configs(args.maps, args.difficulties, args.laps, args.modes,
+                            args.races, args.seed_start, not args.no_powerups)
+    stats = run_farm(configs, args.output, args.workers, args.progress)
+    print(f"{stats['races']} races on {stats['workers']} workers in {stats['seconds']}s: "
+          f"{stats['races_per_sec']} races/s, {stats['ticks_per_sec']:,} ticks/s -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import time
+from collections import deque
+
+import pygame
+
+
+class FrameStats:
+    """Rolling frame-time statistics for the race renderer"""
+
+    def __init__(self, window=300):
+        self.times = deque(maxlen=window)
+        self._start = None
+
+    def begin(self):
+        self._start = time.perf_counter()
+
+    def end(self):
+        if self._start is not None:
+            self.times.append(time.perf_counter() - self._start)
+            self._start = None
+
+    def reset(self):
+        self.times.clear()
+
+    def summary(self):
+        if not self.times:
+            return {"frames": 0, "avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self.times)
+        return {
+            "frames": len(ordered),
+            "avg_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2),
+        }
+
+
+class DirtyRectRenderer:
+    """Redraws only what moved since the last frame.
+
+    Each frame the background is restored under last frame's entity rects,
+    the entities are drawn, and only the old and new rects are pushed to the
+    display. Call invalidate() whenever something else drew over the whole
+    window (menus, countdown, modals) so the next frame is a full redraw.
+    """
+
+    def __init__(self):
+        self.previous = None
+
+    def invalidate(self):
+        self.previous = None
+
+    def begin(self, win, background):
+        if self.previous is None:
+            win.blit(background, (0, 0))
+        else:
+            for rect in self.previous:
+                win.blit(background, rect, rect)
+
+    def end(self, rects):
+        rects = [r for r in rects if r]
+        if self.previous is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(self.previous + rects)
+        self.previous = rects
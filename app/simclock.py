@@ -0,0 +1,96 @@
+import random
+import time
+
+
+class WallClock:
+    """Real time clock, for tools that never start a race"""
+
+    def now(self):
+        return time.time()
+
+
+class TickClock:
+    """Simulation clock that only advances when ticked.
+
+    Lap times, cooldowns, stuns and power-up timers are measured in ticks,
+    so a race plays out the same whether it is rendered at 60 FPS, at 20 FPS
+    or not at all.
+    """
+
+    def __init__(self, tick_rate=60):
+        self.tick_rate = tick_rate
+        self.ticks = 0
+
+    @property
+    def dt(self):
+        return 1.0 / self.tick_rate
+
+    def tick(self, count=1):
+        self.ticks += count
+
+    def now(self):
+        return self.ticks / self.tick_rate
+
+
+class FixedTimestep:
+    """Converts real frame time into a whole number of simulation ticks"""
+
+    def __init__(self, tick_rate=60, max_ticks_per_frame=5):
+        self.tick_rate = tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+
+    def ticks_for(self, frame_seconds):
+        self.accumulator += frame_seconds * self.tick_rate
+        ticks = int(self.accumulator)
+        self.accumulator -= ticks
+        # Drop time rather than spiral when a frame takes far too long
+        return min(ticks, self.max_ticks_per_frame)
+
+    def reset(self):
+        self.accumulator = 0.0
+
+
+class RaceRNG:
+    """Seedable random streams owned by one race.
+
+    Power-up spawns and visual effects draw from separate streams so that
+    effect settings can never change where power-ups appear.
+    """
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        root = random.Random(seed)
+        self.spawns = random.Random(root.getrandbits(64))
+        self.effects = random.Random(root.getrandbits(64))
+
+
+_clock = WallClock()
+_rng = RaceRNG()
+
+
+def now():
+    """Current game time in seconds from the active clock"""
+    return _clock.now()
+
+
+def get_clock():
+    return _clock
+
+
+def set_clock(clock):
+    """Make clock the time source for all game systems"""
+    global _clock
+    _clock = clock
+    return clock
+
+
+def rng():
+    """Random streams of the active race"""
+    return _rng
+
+
+def set_rng(race_rng):
+    global _rng
+    _rng = race_rng
+    return race_rng
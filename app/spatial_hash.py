@@ -0,0 +1,66 @@
+import math
+
+SPATIAL_CELL_SIZE = 64  # Pixels per grid cell, about two car lengths
+
+
+class SpatialHash:
+    """Uniform grid of axis-aligned boxes for broadphase queries.
+
+    Items are inserted with a box (a point when w = h = 0) and found again
+    with rect or radius queries that only look at the cells they cover.
+    Query results keep insertion order, so callers stay deterministic.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entries = []   # (item, x, y, w, h)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+
+    def _cell_range(self, x, y, w, h):
+        size = self.cell_size
+        return (int(math.floor(x / size)), int(math.floor((x + w) / size)),
+                int(math.floor(y / size)), int(math.floor((y + h) / size)))
+
+    def insert(self, item, x, y, w=0, h=0):
+        index = len(self.entries)
+        self.entries.append((item, x, y, w, h))
+        x0, x1, y0, y1 = self._cell_range(x, y, w, h)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), []).append(index)
+
+    def _candidates(self, x, y, w, h):
+        found = set()
+        x0, x1, y0, y1 = self._cell_range(x, y, w, h)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                found.update(self.cells.get((cx, cy), ()))
+        return sorted(found)
+
+    def query_rect(self, x, y, w, h):
+        """Items whose box overlaps the rect (x, y, w, h)"""
+        result = []
+        for index in self._candidates(x, y, w, h):
+            item, ix, iy, iw, ih = self.entries[index]
+            if ix <= x + w and x <= ix + iw and iy <= y + h and y <= iy + ih:
+                result.append(item)
+        return result
+
+    def query_radius(self, x, y, radius):
+        """Items whose box comes closer than radius to (x, y)"""
+        result = []
+        for index in self._candidates(x - radius, y - radius, radius * 2, radius * 2):
+            item, ix, iy, iw, ih = self.entries[index]
+            # Closest point of the box to the centre
+            nearest_x = min(max(x, ix), ix + iw)
+            nearest_y = min(max(y, iy), iy + ih)
+            if math.hypot(nearest_x - x, nearest_y - y) < radius:
+                result.append(item)
+        return result
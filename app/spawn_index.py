@@ -0,0 +1,93 @@
+import math
+import re
+from array import array
+
+import pygame
+
+from map_cache import MapCache
+
+SPAWN_MARGIN = 50           # Keep spawns this far from the window edges
+SPAWN_MAX_TRIES = 30        # Draws per power-up before giving up on spacing
+
+
+def _disk_mask(radius):
+    # Built by hand: pygame.draw.circle is not symmetric about the centre pixel
+    mask = pygame.Mask((radius * 2 + 1, radius * 2 + 1))
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            if dx * dx + dy * dy <= radius * radius:
+                mask.set_at((dx + radius, dy + radius))
+    return mask
+
+
+class SpawnIndex:
+    """Every valid spawn pixel of a map, so a spawn is a single random draw.
+
+    Valid means on the track, not on the border, at least `clearance`
+    pixels from the border and at least `margin` pixels inside the map's
+    edges (or `bounds`, if given). Pixels are stored
+    as flat y * width + x indices in a compact array.
+    """
+
+    def __init__(self, track_mask, border_mask, clearance=0, bounds=None, margin=SPAWN_MARGIN):
+        width, height = track_mask.get_size()
+        bounds = bounds or (width, height)
+
+        # Window margin, as the rejection sampler used: margin <= x, y <= bound - margin
+        inside = pygame.Mask((width, height))
+        inside.draw(pygame.Mask((max(0, bounds[0] - 2 * margin + 1), max(0, bounds[1] - 2 * margin + 1)), fill=True),
+                    (margin, margin))
+        valid = track_mask.overlap_mask(inside, (0, 0))
+
+        # Border grown by the clearance radius
+        if clearance > 0:
+            blocked = border_mask.convolve(_disk_mask(clearance))
+            valid.erase(blocked, (-clearance, -clearance))
+        else:
+            valid.erase(border_mask, (0, 0))
+
+        # Runs of set pixels straight from the mask bytes, no per-pixel Python loop
+        alpha = pygame.image.tobytes(valid.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0)),
+                                     "RGBA")[3::4]
+        self.width = width
+        self.pixels = array("l")
+        for run in re.finditer(rb"[^\x00]+", alpha):
+            self.pixels.extend(range(run.start(), run.end()))
+
+    @classmethod
+    def from_pixels(cls, pixels, width):
+        """Index over pixels saved from an earlier build, e.g. by map_bake"""
+        index = cls.__new__(cls)
+        index.width = width
+        index.pixels = pixels
+        return index
+
+    def __len__(self):
+        return len(self.pixels)
+
+    def sample(self, rng):
+        """One uniformly random valid (x, y)"""
+        p = int(self.pixels[rng.randrange(len(self.pixels))])
+        return p % self.width, p // self.width
+
+    def spawn_points(self, count, rng, avoid=(), min_spacing=0):
+        """Up to count points at least min_spacing from avoid and from each other.
+
+        Points that cannot be spaced out within SPAWN_MAX_TRIES draws are
+        left out rather than crowded in.
+        """
+        if not len(self.pixels):
+            return []
+        taken = [(float(x), float(y)) for x, y in avoid]
+        points = []
+        for _ in range(count):
+            for _ in range(SPAWN_MAX_TRIES):
+                x, y = self.sample(rng)
+                if all(math.hypot(x - ax, y - ay) >= min_spacing for ax, ay in taken):
+                    points.append((x, y))
+                    taken.append((x, y))
+                    break
+        return points
+
+
+SPAWN_INDEXES = MapCache(SpawnIndex)  # (map key, clearance) -> SpawnIndex
@@ -0,0 +1,134 @@
+import pygame
+
+from config import CAR_SPRITE_ANGLE_STEP
+from utils import display_format
+
+POWERUP_ANGLE_FRAMES = 36   # 10 degree steps
+POWERUP_SCALE_FRAMES = 6    # Pulse sizes between min and max scale
+PROJECTILE_ANGLE_STEP = 4   # Degrees per projectile frame
+
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class RotationFrames:
+    """One pre-rotated copy of an image per angle bucket, built on first use"""
+
+    def __init__(self, image, angle_step=PROJECTILE_ANGLE_STEP):
+        self.image = image
+        self.angle_step = angle_step
+        self.buckets = int(round(360 / angle_step))
+        self.frames = {}
+
+    def frame(self, angle):
+        index = int(round(angle / self.angle_step)) % self.buckets
+        surface = self.frames.get(index)
+        if surface is None:
+            surface = display_format(pygame.transform.rotate(self.image, index * self.angle_step))
+            self.frames[index] = surface
+        return surface
+
+    def memory_bytes(self):
+        return sum(surface_bytes(s) for s in self.frames.values())
+
+
+class PowerupAnimation:
+    """Rotating, pulsing power-up icon as a fixed grid of angle x scale frames"""
+
+    def __init__(self, image, angle_frames=POWERUP_ANGLE_FRAMES, scale_frames=POWERUP_SCALE_FRAMES,
+                 min_scale=0.85, max_scale=1.15):
+        self.image = image
+        self.angle_frames = angle_frames
+        self.scale_frames = scale_frames
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.frames = {}
+
+    def frame(self, angle, scale):
+        angle_index = int(round(angle / 360 * self.angle_frames)) % self.angle_frames
+        t = (scale - self.min_scale) / (self.max_scale - self.min_scale)
+        scale_index = min(self.scale_frames - 1, max(0, int(round(t * (self.scale_frames - 1)))))
+
+        key = (angle_index, scale_index)
+        surface = self.frames.get(key)
+        if surface is None:
+            frame_angle = angle_index * 360 / self.angle_frames
+            frame_scale = self.min_scale + (self.max_scale - self.min_scale) * scale_index / (self.scale_frames - 1)
+            surface = display_format(pygame.transform.rotozoom(self.image, frame_angle, frame_scale))
+            self.frames[key] = surface
+        return surface
+
+    def build(self):
+        """Eagerly render every frame, e.g. during a loading screen"""
+        for a in range(self.angle_frames):
+            for s in range(self.scale_frames):
+                self.frame(a * 360 / self.angle_frames,
+                           self.min_scale + (self.max_scale - self.min_scale) * s / (self.scale_frames - 1))
+
+    def memory_bytes(self):
+        return sum(surface_bytes(s) for s in self.frames.values())
+
+
+class CarSpriteSheet:
+    """Pre-rotated frames of a car image with their centring offsets.
+
+    Offsets are relative to the car's unrotated top-left corner, so a frame
+    lands exactly where blit_rotate_center would draw the exact rotation.
+    """
+
+    def __init__(self, image, angle_step=CAR_SPRITE_ANGLE_STEP):
+        self.image = image
+        self.angle_step = angle_step
+        self.buckets = int(round(360 / angle_step))
+        self.frames = {}
+
+    def frame(self, angle):
+        """Return (surface, dx, dy) for the bucket nearest to angle"""
+        index = int(round(angle / self.angle_step)) % self.buckets
+        entry = self.frames.get(index)
+        if entry is None:
+            rotated = pygame.transform.rotate(self.image, index * self.angle_step)
+            rect = rotated.get_rect(center=self.image.get_rect().center)
+            entry = (display_format(rotated), rect.x, rect.y)
+            self.frames[index] = entry
+        return entry
+
+    def build(self):
+        for i in range(self.buckets):
+            self.frame(i * self.angle_step)
+
+    def memory_bytes(self):
+        return sum(surface_bytes(s) for s, _, _ in self.frames.values())
+
+
+_car_sheets = {}
+_exact_rotation = False
+
+
+def car_sprite_sheet(image, angle_step=CAR_SPRITE_ANGLE_STEP):
+    """Shared sprite sheet for a car image, created on first use"""
+    sheet = _car_sheets.get((image, angle_step))
+    if sheet is None:
+        sheet = CarSpriteSheet(image, angle_step)
+        _car_sheets[(image, angle_step)] = sheet
+    return sheet
+
+
+def set_exact_rotation(enabled):
+    """Draw cars with exact per-frame rotation (for screenshots) instead of the sheets"""
+    global _exact_rotation
+    _exact_rotation = enabled
+
+
+def exact_rotation():
+    return _exact_rotation
+
+
+def car_sheet_memory():
+    """Frames built and bytes used across all car sprite sheets"""
+    return {
+        "sheets": len(_car_sheets),
+        "frames": sum(len(sheet.frames) for sheet in _car_sheets.values()),
+        "bytes": sum(sheet.memory_bytes() for sheet in _car_sheets.values()),
+    }
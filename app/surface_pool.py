@@ -0,0 +1,45 @@
+import pygame
+
+
+class SurfacePool:
+    """Translucent panel and overlay surfaces, built once per size and style.
+
+    Pooled surfaces are shared between callers and must only be blitted,
+    never drawn on. `allocations` counts surfaces actually created, so a
+    steady frame should leave it unchanged.
+    """
+
+    def __init__(self):
+        self._surfaces = {}
+        self.allocations = 0
+        self.hits = 0
+
+    def panel(self, size, fill, border_color=None, border_width=2, border_radius=8):
+        """Filled SRCALPHA rectangle, optionally with a rounded border"""
+        key = ("panel", tuple(size), tuple(fill), tuple(border_color) if border_color else None,
+               border_width, border_radius)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(fill)
+        if border_color:
+            pygame.draw.rect(surface, border_color, surface.get_rect(), border_width, border_radius=border_radius)
+        self.allocations += 1
+        self._surfaces[key] = surface
+        return surface
+
+    def overlay(self, size, color):
+        """Full-window translucent fill behind menus and modals"""
+        return self.panel(size, color)
+
+    def stats(self):
+        return {"surfaces": len(self._surfaces), "allocations": self.allocations, "hits": self.hits}
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+SURFACE_POOL = SurfacePool()
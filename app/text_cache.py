@@ -0,0 +1,59 @@
+from collections import OrderedDict
+
+TEXT_CACHE_SIZE = 512  # Rendered strings kept before the least recently used is dropped
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces.
+
+    Keyed by (font, text, antialias, color, background), so a string is only
+    re-rendered when it actually changes. Returned surfaces are shared and
+    must not be drawn on.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(color), tuple(background) if background else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, antialias, color, background=None):
+    """Drop-in for font.render(text, antialias, color, background) backed by TEXT_CACHE"""
+    return TEXT_CACHE.render(font, text, antialias, color, background)
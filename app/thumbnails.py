@@ -0,0 +1,88 @@
+import json
+import os
+
+import pygame
+
+from assets import load_image
+from utils import display_format
+
+THUMBNAIL_SIZE = (150, 120)
+THUMBNAIL_DIR = os.path.join("cache", "thumbnails")
+THUMBNAIL_VERSION = 1
+PREVIEW_LAYERS = ("grass", "track", "border")
+
+
+def _signature(pack, size):
+    # Image files change rarely; their size and mtime are enough to notice
+    files = []
+    for name in PREVIEW_LAYERS:
+        path, scale = pack.layers[name]
+        stat = os.stat(path)
+        files.append([path, scale, stat.st_mtime_ns, stat.st_size])
+    return {"version": THUMBNAIL_VERSION, "size": list(size), "files": files}
+
+
+class ThumbnailCache:
+    """Map select previews, built once per map and kept in memory and on disk.
+
+    A thumbnail is the grass, track and border layers composited and
+    smoothscaled down. It is saved as cache/thumbnails/<map>.png with the
+    size and mtime of the source images, and rebuilt when those change.
+    It lives apart from the bake cache, so rebaking a map keeps it.
+    Building one reads the images directly, so previewing a map never
+    bakes or loads it for racing.
+    """
+
+    def __init__(self, size=THUMBNAIL_SIZE, cache_dir=THUMBNAIL_DIR):
+        self.size = size
+        self.cache_dir = cache_dir
+        self.thumbnails = {}
+        self.builds = 0
+        self.disk_hits = 0
+
+    def _paths(self, key):
+        return os.path.join(self.cache_dir, key + ".png"), os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, pack):
+        thumbnail = self.thumbnails.get(pack.key)
+        if thumbnail is None:
+            thumbnail = display_format(self._load(pack) or self._build(pack), alpha=False)
+            self.thumbnails[pack.key] = thumbnail
+        return thumbnail
+
+    def _load(self, pack):
+        image_path, meta_path = self._paths(pack.key)
+        try:
+            with open(meta_path, "r") as f:
+                if json.load(f) != _signature(pack, self.size):
+                    return None
+            thumbnail = pygame.image.load(image_path)
+        except (OSError, ValueError, pygame.error):
+            return None
+        self.disk_hits += 1
+        return thumbnail
+
+    def _build(self, pack):
+        # Reuse the map's surfaces if it has been raced, else just decode the images
+        if pack.loaded:
+            layers = [pack[name] for name in PREVIEW_LAYERS]
+        else:
+            layers = [load_image(*pack.layers[name]) for name in PREVIEW_LAYERS]
+        composite = pygame.Surface(layers[1].get_size(), 0, 32)
+        for layer in layers:
+            composite.blit(layer, (0, 0))
+        thumbnail = pygame.transform.smoothscale(composite, self.size)
+        self.builds += 1
+
+        image_path, meta_path = self._paths(pack.key)
+        try:
+            os.makedirs(os.path.dirname(image_path), exist_ok=True)
+            pygame.image.save(thumbnail, image_path)
+            with open(meta_path, "w") as f:
+                json.dump(_signature(pack, self.size), f)
+        except (OSError, pygame.error):
+            pass   # Still usable from memory this run
+        return thumbnail
+
+
+THUMBNAILS = ThumbnailCache()
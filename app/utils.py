@@ -8,9 +8,18 @@ def blit_rotate_center(win, image, top_left, angle):
     rotated_image = pygame.transform.rotate(image, angle)
     new_rect = rotated_image.get_rect(center=image.get_rect(topleft=top_left).center)
 
-    win.blit(rotated_image, new_rect.topleft)
+    return win.blit(rotated_image, new_rect.topleft)
 
 def blit_text_center(win, font, text, color=(255, 255, 255)):
     render = font.render(text, True, color)
     rect = render.get_rect(center=(win.get_width()//2, win.get_height()//2))
-    win.blit(render, rect)
\ No newline at end of file
+    win.blit(render, rect)
+
+def display_format(surface, alpha=True):
+    """surface converted to the display's pixel format for fast blits.
+
+    Tools without a display get the raw surface back.
+    """
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert_alpha() if alpha else surface.convert()
+    return surface